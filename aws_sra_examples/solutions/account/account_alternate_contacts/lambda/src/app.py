@@ -12,12 +12,16 @@ from __future__ import annotations
 import json
 import logging
 import os
+import random
 import re
-from time import sleep
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from time import monotonic, sleep
 from typing import TYPE_CHECKING, Any, List, Literal, Optional, Union
 
 import boto3
 from botocore.config import Config
+from botocore.exceptions import ClientError
 from crhelper import CfnResource
 
 if TYPE_CHECKING:
@@ -39,18 +43,25 @@ LOGGER.setLevel(log_level)
 # Global Variables
 UNEXPECTED = "Unexpected!"
 ORGANIZATIONS_PAGE_SIZE = 20
-ORGANIZATIONS_THROTTLE_PERIOD = 0.2
-SNS_PUBLISH_BATCH_MAX = 10
+SNS_PUBLISH_BATCH_MAX = 10  # Max entries in a PublishBatch request
+SNS_PUBLISH_BATCH_BYTES_MAX = 262144  # Max aggregate payload of a PublishBatch request
+SNS_PUBLISH_MAX_WORKERS = 10  # PublishBatch requests sent at the same time
+SNS_PUBLISH_MAX_ATTEMPTS = 4  # Failed entries are retried with exponential backoff
+SNS_PUBLISH_RETRY_INITIAL_DELAY_SECONDS = 0.5
 # https://docs.aws.amazon.com/accounts/latest/reference/quotas.html
 ACCOUNT_THROTTLE_PERIOD = 0.2
 BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "standard"})
+ORG_BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "adaptive"})  # Client-side rate limiting instead of fixed page sleeps
+ORG_ACCOUNTS_CACHE_TTL_SECONDS = 300  # Reuse the account inventory across warm invocations
+ORG_ACCOUNTS_CACHE_LOCK = threading.Lock()
+ORG_ACCOUNTS_CACHE: dict = {}  # {"Accounts": {account ID: account}, "Time": list time}
 
 # Initialize the helper. `sleep_on_delete` allows time for the CloudWatch Logs to get captured.
 helper = CfnResource(json_logging=True, log_level=log_level, boto_level="CRITICAL", sleep_on_delete=120)
 
 try:
     MANAGEMENT_ACCOUNT_SESSION = boto3.Session()
-    ORG_CLIENT: OrganizationsClient = MANAGEMENT_ACCOUNT_SESSION.client("organizations", config=BOTO3_CONFIG)
+    ORG_CLIENT: OrganizationsClient = MANAGEMENT_ACCOUNT_SESSION.client("organizations", config=ORG_BOTO3_CONFIG)
     SNS_CLIENT: SNSClient = MANAGEMENT_ACCOUNT_SESSION.client("sns", config=BOTO3_CONFIG)
 except Exception as error:
     LOGGER.error({"Unexpected_Error": error})
@@ -88,22 +99,35 @@ def assume_role(role: str, role_session_name: str, account: str = None, session:
     )
 
 
-def get_active_organization_accounts() -> list[AccountTypeDef]:
-    """Get all the active AWS Organization accounts.
+def get_organization_account_inventory() -> dict[str, AccountTypeDef]:
+    """Get the AWS Organization account inventory, listing accounts only when the cached inventory is missing or stale.
 
     Returns:
-        List of active account IDs
+        Accounts keyed by account ID
     """
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        if ORG_ACCOUNTS_CACHE and monotonic() - ORG_ACCOUNTS_CACHE["Time"] < ORG_ACCOUNTS_CACHE_TTL_SECONDS:
+            return ORG_ACCOUNTS_CACHE["Accounts"]
+
+    accounts: dict[str, AccountTypeDef] = {}
     paginator = ORG_CLIENT.get_paginator("list_accounts")
-    accounts: list[AccountTypeDef] = []
     for page in paginator.paginate(PaginationConfig={"PageSize": ORGANIZATIONS_PAGE_SIZE}):
         for account in page["Accounts"]:
-            if account["Status"] == "ACTIVE":
-                accounts.append(account)
-            sleep(ORGANIZATIONS_THROTTLE_PERIOD)
+            accounts[account["Id"]] = account
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        ORG_ACCOUNTS_CACHE.update({"Accounts": accounts, "Time": monotonic()})
     return accounts
 
 
+def get_active_organization_accounts() -> list[AccountTypeDef]:
+    """Get all the active AWS Organization accounts.
+
+    Returns:
+        List of active account IDs
+    """
+    return [account for account in get_organization_account_inventory().values() if account["Status"] == "ACTIVE"]
+
+
 def get_account_info(account_id: str) -> AccountTypeDef:
     """Get AWS Account info.
 
@@ -116,6 +140,9 @@ def get_account_info(account_id: str) -> AccountTypeDef:
     response: DescribeAccountResponseTypeDef = ORG_CLIENT.describe_account(AccountId=account_id)
     api_call_details = {"API_Call": "organizations:DescribeAccounts", "API_Response": response}
     LOGGER.info(api_call_details)
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        if ORG_ACCOUNTS_CACHE:  # Keep the cached inventory current for accounts created or invited after it was listed
+            ORG_ACCOUNTS_CACHE["Accounts"] = {**ORG_ACCOUNTS_CACHE["Accounts"], account_id: response["Account"]}
     return response["Account"]
 
 
@@ -132,7 +159,6 @@ def get_organization_resource_tags(resource_id: str) -> List[TagTypeDef]:
     tags = []
     for page in paginator.paginate(ResourceId=resource_id):
         tags += page["Tags"]
-        sleep(ORGANIZATIONS_THROTTLE_PERIOD)
     return tags
 
 
@@ -256,33 +282,103 @@ def publish_sns_message(message: dict, subject: str, sns_topic_arn: str) -> None
     LOGGER.info(api_call_details)
 
 
-def publish_sns_message_batch(message_batch: list, sns_topic_arn: str) -> None:
-    """Publish SNS Message Batches.
+def build_sns_message_batches(sns_messages: list) -> list:
+    """Group SNS messages into batches within the PublishBatch entry count and aggregate payload limits.
+
+    Args:
+        sns_messages: SNS publish batch request entries
+
+    Returns:
+        list: Batches of SNS publish batch request entries
+    """
+    message_batches: list = []
+    batch_bytes = 0
+    for sns_message in sns_messages:
+        message_bytes = len(sns_message["Message"].encode()) + len(sns_message.get("Subject", "").encode())
+        if not message_batches or len(message_batches[-1]) >= SNS_PUBLISH_BATCH_MAX or batch_bytes + message_bytes > SNS_PUBLISH_BATCH_BYTES_MAX:
+            message_batches.append([])
+            batch_bytes = 0
+        message_batches[-1].append(sns_message)
+        batch_bytes += message_bytes
+    return message_batches
+
+
+def publish_sns_message_batch(sns_client: SNSClient, message_batch: list, sns_topic_arn: str) -> list:
+    """Publish a batch of SNS messages.
 
     Args:
+        sns_client: Boto3 SNS client
         message_batch: Batch of SNS messages
         sns_topic_arn: SNS Topic ARN
+
+    Returns:
+        list: Entries that failed to publish
     """
-    LOGGER.info("Publishing SNS Message Batch")
-    LOGGER.info({"SNSMessageBatch": message_batch})
-    response: PublishBatchResponseTypeDef = SNS_CLIENT.publish_batch(TopicArn=sns_topic_arn, PublishBatchRequestEntries=message_batch)
+    try:
+        response: PublishBatchResponseTypeDef = sns_client.publish_batch(TopicArn=sns_topic_arn, PublishBatchRequestEntries=message_batch)
+    except ClientError as error:
+        LOGGER.warning(f"PublishBatch failed for {len(message_batch)} SNS messages: {error}")
+        return [
+            {"Id": sns_message["Id"], "Code": error.response["Error"]["Code"], "Message": str(error), "SenderFault": False}
+            for sns_message in message_batch
+        ]
     api_call_details = {"API_Call": "sns:PublishBatch", "API_Response": response}
     LOGGER.info(api_call_details)
+    return response["Failed"]
 
 
-def process_sns_message_batches(sns_messages: list, sns_topic_arn: str) -> None:
-    """Process SNS Message Batches for Publishing.
+def publish_sns_messages(sns_client: SNSClient, sns_messages: list, sns_topic_arn: str, max_workers: int = SNS_PUBLISH_MAX_WORKERS) -> None:
+    """Publish SNS messages in concurrent batches, retrying only the entries that failed with a service fault.
 
     Args:
-        sns_messages: SNS messages to be batched.
+        sns_client: Boto3 SNS client
+        sns_messages: SNS publish batch request entries
         sns_topic_arn: SNS Topic ARN
-    """
-    message_batches = []
-    for i in range(SNS_PUBLISH_BATCH_MAX, len(sns_messages) + SNS_PUBLISH_BATCH_MAX, SNS_PUBLISH_BATCH_MAX):
-        message_batches.append(sns_messages[i - SNS_PUBLISH_BATCH_MAX : i])
+        max_workers: Maximum number of PublishBatch requests sent at the same time
 
-    for batch in message_batches:
-        publish_sns_message_batch(batch, sns_topic_arn)
+    Raises:
+        ValueError: SNS messages failed to publish
+    """
+    start_time = monotonic()
+    pending_messages = list(sns_messages)
+    sender_faults: list = []
+    service_faults: list = []
+    attempt = 0
+    delay = SNS_PUBLISH_RETRY_INITIAL_DELAY_SECONDS
+    while pending_messages and attempt < SNS_PUBLISH_MAX_ATTEMPTS:
+        if attempt:
+            LOGGER.info({"Retrying SNS messages": len(pending_messages), "Attempt": attempt + 1})
+            sleep(delay / 2 + random.uniform(0, delay / 2))  # noqa: S311, DUO102
+            delay *= 2
+        attempt += 1
+        message_batches = build_sns_message_batches(pending_messages)
+        pending_messages = []
+        service_faults = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(message_batches))) as executor:
+            futures = {executor.submit(publish_sns_message_batch, sns_client, batch, sns_topic_arn): batch for batch in message_batches}
+            for future in as_completed(futures):
+                messages_by_id = {sns_message["Id"]: sns_message for sns_message in futures[future]}
+                for failed_entry in future.result():
+                    if failed_entry["SenderFault"]:
+                        sender_faults.append(failed_entry)
+                    else:
+                        service_faults.append(failed_entry)
+                        pending_messages.append(messages_by_id[failed_entry["Id"]])
+
+    failed_entries = sender_faults + service_faults
+    LOGGER.info(
+        {
+            "SNS_Publish": {
+                "Messages": len(sns_messages),
+                "Attempts": attempt,
+                "Failed": len(failed_entries),
+                "Seconds": round(monotonic() - start_time, 3),
+            }
+        }
+    )
+    if failed_entries:
+        LOGGER.error({"Failed SNS messages": failed_entries})
+        raise ValueError(f"{len(failed_entries)} of {len(sns_messages)} SNS messages failed to publish")
 
 
 def is_account_with_exclude_tags(aws_account: AccountTypeDef, params: dict) -> bool:
@@ -336,7 +432,7 @@ def process_accounts(event: Union[CloudFormationCustomResourceEvent, dict], para
             sns_message = {"Action": params["action"], "AccountId": account["Id"]}
             sns_messages.append({"Id": account["Id"], "Message": json.dumps(sns_message), "Subject": "Account Alternate Contacts"})
 
-    process_sns_message_batches(sns_messages, params["SNS_TOPIC_ARN"])
+    publish_sns_messages(SNS_CLIENT, sns_messages, params["SNS_TOPIC_ARN"])
 
 
 def process_account(event: dict, aws_account_id: str, params: dict) -> None:
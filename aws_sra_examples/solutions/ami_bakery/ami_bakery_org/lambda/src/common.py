@@ -12,7 +12,10 @@ from __future__ import annotations
 import logging
 import os
 import re
-from time import sleep
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from time import monotonic
 from typing import TYPE_CHECKING, Optional
 
 import boto3
@@ -34,14 +37,26 @@ LOGGER.setLevel(log_level)
 # Global variables
 CLOUDFORMATION_PAGE_SIZE = 20
 CLOUDFORMATION_THROTTLE_PERIOD = 0.2
-ORGANIZATIONS_PAGE_SIZE = 20
-ORGANIZATIONS_THROTTLE_PERIOD = 0.2
+ORGANIZATIONS_PAGE_SIZE = 20  # Max page size for list_accounts
 BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "standard"})
+SESSION_REFRESH_WINDOW = timedelta(minutes=5)  # Refresh cached assumed role credentials this long before they expire
+SESSION_CACHE_LOCK = threading.Lock()
+ASSUMED_ROLE_CREDENTIALS: dict = {}  # (account, role, partition, session name) -> STS credentials, reused across warm invocations
+CALLER_ARNS: dict = {}  # access key -> {"Arn": caller identity ARN, "Time": when it was cached}
+CALLER_ARN_TTL_SECONDS = 3600  # Evict caller identities of credentials that are no longer in use
+REGION_PROBE_MAX_WORKERS = 16
+ENABLED_REGIONS_CACHE_TTL_SECONDS = 900  # Reuse probed regions across warm invocations
+ENABLED_REGIONS_CACHE_LOCK = threading.Lock()
+ENABLED_REGIONS_CACHE: dict = {}  # (customer regions, control tower regions only) -> (probe time, enabled regions)
+ORG_BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "adaptive"})  # Client-side rate limiting instead of fixed page sleeps
+ORG_ACCOUNTS_CACHE_TTL_SECONDS = 300  # Reuse the account inventory across warm invocations
+ORG_ACCOUNTS_CACHE_LOCK = threading.Lock()
+ORG_ACCOUNTS_CACHE: dict = {}  # {"Accounts": {account ID: account}, "Time": list time}
 
 try:
     MANAGEMENT_ACCOUNT_SESSION = boto3.Session()
     CLOUDFORMATION_CLIENT: CloudFormationClient = MANAGEMENT_ACCOUNT_SESSION.client("cloudformation")
-    ORG_CLIENT: OrganizationsClient = MANAGEMENT_ACCOUNT_SESSION.client("organizations", config=BOTO3_CONFIG)
+    ORG_CLIENT: OrganizationsClient = MANAGEMENT_ACCOUNT_SESSION.client("organizations", config=ORG_BOTO3_CONFIG)
     SSM_CLIENT: SSMClient = MANAGEMENT_ACCOUNT_SESSION.client("ssm")
 except Exception as error:
     LOGGER.error({"Unexpected_Error": error})
@@ -74,6 +89,39 @@ def parameter_pattern_validator(parameter_name: str, parameter_value: Optional[s
     return {parameter_name: parameter_value}
 
 
+def evict_expired_sessions() -> None:
+    """Remove expired assumed role credentials and stale caller identities so the warm invocation caches stay bounded."""
+    now = datetime.now(timezone.utc)
+    with SESSION_CACHE_LOCK:
+        for cache_key in [key for key, credentials in ASSUMED_ROLE_CREDENTIALS.items() if credentials["Expiration"] <= now]:
+            CALLER_ARNS.pop(ASSUMED_ROLE_CREDENTIALS.pop(cache_key)["AccessKeyId"], None)
+        for access_key in [key for key, caller in CALLER_ARNS.items() if monotonic() - caller["Time"] >= CALLER_ARN_TTL_SECONDS]:
+            del CALLER_ARNS[access_key]
+
+
+def get_caller_arn(session: boto3.Session) -> str:
+    """Get the caller identity ARN for the session, calling STS once per set of credentials.
+
+    Args:
+        session: Boto3 session
+
+    Returns:
+        Caller identity ARN
+    """
+    access_key = session.get_credentials().access_key
+    evict_expired_sessions()
+    with SESSION_CACHE_LOCK:
+        caller = CALLER_ARNS.get(access_key)
+    if caller:
+        return caller["Arn"]
+    sts_client: STSClient = session.client("sts", config=BOTO3_CONFIG)
+    sts_arn = sts_client.get_caller_identity()["Arn"]
+    LOGGER.info(f"USER: {sts_arn}")
+    with SESSION_CACHE_LOCK:
+        CALLER_ARNS[access_key] = {"Arn": sts_arn, "Time": monotonic()}
+    return sts_arn
+
+
 def assume_role(role: str, role_session_name: str, account: str, session: Optional[boto3.Session] = None) -> boto3.Session:
     """Assumes the provided role in the given account and returns a session.
 
@@ -88,23 +136,64 @@ def assume_role(role: str, role_session_name: str, account: str, session: Option
     """
     if not session:
         session = boto3.Session()
-    sts_client: STSClient = session.client("sts", config=BOTO3_CONFIG)
-    sts_arn = sts_client.get_caller_identity()["Arn"]
-    LOGGER.info(f"USER: {sts_arn}")
+    sts_arn = get_caller_arn(session)
     if not account:
         account = sts_arn.split(":")[4]
     partition = sts_arn.split(":")[1]
-    role_arn = f"arn:{partition}:iam::{account}:role/{role}"
+    cache_key = (account, role, partition, role_session_name)
+
+    with SESSION_CACHE_LOCK:
+        cached_credentials = ASSUMED_ROLE_CREDENTIALS.get(cache_key)
+    if not cached_credentials or cached_credentials["Expiration"] - SESSION_REFRESH_WINDOW <= datetime.now(timezone.utc):
+        role_arn = f"arn:{partition}:iam::{account}:role/{role}"
+        sts_client: STSClient = session.client("sts", config=BOTO3_CONFIG)
+        response = sts_client.assume_role(RoleArn=role_arn, RoleSessionName=role_session_name)
+        LOGGER.info(f"ASSUMED ROLE: {response['AssumedRoleUser']['Arn']}")
+        cached_credentials = response["Credentials"]
+        with SESSION_CACHE_LOCK:
+            ASSUMED_ROLE_CREDENTIALS[cache_key] = cached_credentials
 
-    response = sts_client.assume_role(RoleArn=role_arn, RoleSessionName=role_session_name)
-    LOGGER.info(f"ASSUMED ROLE: {response['AssumedRoleUser']['Arn']}")
     return boto3.Session(
-        aws_access_key_id=response["Credentials"]["AccessKeyId"],
-        aws_secret_access_key=response["Credentials"]["SecretAccessKey"],
-        aws_session_token=response["Credentials"]["SessionToken"],
+        aws_access_key_id=cached_credentials["AccessKeyId"],
+        aws_secret_access_key=cached_credentials["SecretAccessKey"],
+        aws_session_token=cached_credentials["SessionToken"],
     )
 
 
+def get_organization_account_inventory() -> dict:
+    """Get the AWS Organization account inventory, listing accounts only when the cached inventory is missing or stale.
+
+    Returns:
+        Accounts keyed by account ID
+    """
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        if ORG_ACCOUNTS_CACHE and monotonic() - ORG_ACCOUNTS_CACHE["Time"] < ORG_ACCOUNTS_CACHE_TTL_SECONDS:
+            return ORG_ACCOUNTS_CACHE["Accounts"]
+
+    accounts: dict = {}
+    paginator = ORG_CLIENT.get_paginator("list_accounts")
+    for page in paginator.paginate(PaginationConfig={"PageSize": ORGANIZATIONS_PAGE_SIZE}):
+        for account in page["Accounts"]:
+            accounts[account["Id"]] = account
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        ORG_ACCOUNTS_CACHE.update({"Accounts": accounts, "Time": monotonic()})
+    return accounts
+
+
+def update_organization_account_inventory(account_id: str) -> None:
+    """Refresh a single account in the cached inventory after a CreateAccountResult or AcceptHandshake event.
+
+    Args:
+        account_id: AWS account ID
+    """
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        if not ORG_ACCOUNTS_CACHE:
+            return
+    account = ORG_CLIENT.describe_account(AccountId=account_id)["Account"]
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        ORG_ACCOUNTS_CACHE["Accounts"] = {**ORG_ACCOUNTS_CACHE["Accounts"], account_id: account}
+
+
 def get_active_organization_accounts(exclude_accounts: list) -> list:
     """Get all the active AWS Organization accounts.
 
@@ -117,14 +206,9 @@ def get_active_organization_accounts(exclude_accounts: list) -> list:
     if exclude_accounts is None:
         exclude_accounts = ["00000000000"]
     accounts: list[dict] = []
-    paginator = ORG_CLIENT.get_paginator("list_accounts")
-
-    for page in paginator.paginate(PaginationConfig={"PageSize": ORGANIZATIONS_PAGE_SIZE}):
-        for account in page["Accounts"]:
-            if account["Status"] == "ACTIVE" and account["Id"] not in exclude_accounts:
-                accounts.append({"AccountId": account["Id"], "Email": account["Email"]})
-        sleep(ORGANIZATIONS_THROTTLE_PERIOD)
-
+    for account in get_organization_account_inventory().values():
+        if account["Status"] == "ACTIVE" and account["Id"] not in exclude_accounts:
+            accounts.append({"AccountId": account["Id"], "Email": account["Email"]})
     return accounts
 
 
@@ -159,6 +243,31 @@ def get_control_tower_regions() -> list:  # noqa: CCR001
     return list(customer_regions)
 
 
+def probe_region(sts_client: STSClient, region: str) -> str:
+    """Test whether a region is enabled by calling STS in the region.
+
+    Args:
+        sts_client: Regional STS client
+        region: AWS region
+
+    Returns:
+        Region status: enabled, disabled, invalid, or error
+    """
+    try:
+        sts_client.get_caller_identity()
+        return "enabled"
+    except EndpointConnectionError:
+        LOGGER.error(f"Region: ({region}) is not valid")
+        return "invalid"
+    except ClientError as error:
+        LOGGER.error(f"Error {error.response['Error']} occurred testing region {region}")
+        if error.response["Error"]["Code"] == "InvalidClientTokenId":
+            return "disabled"
+    except Exception:
+        LOGGER.exception("Unexpected!")
+    return "error"
+
+
 def get_enabled_regions(customer_regions: str, control_tower_regions_only: bool = False) -> list:  # noqa: CCR001, C901 # NOSONAR
     """Query STS to identify enabled regions.
 
@@ -169,6 +278,13 @@ def get_enabled_regions(customer_regions: str, control_tower_regions_only: bool
     Returns:
         Enabled regions
     """
+    cache_key = (customer_regions.strip(), control_tower_regions_only)
+    with ENABLED_REGIONS_CACHE_LOCK:
+        cached_regions = ENABLED_REGIONS_CACHE.get(cache_key)
+    if cached_regions and monotonic() - cached_regions[0] < ENABLED_REGIONS_CACHE_TTL_SECONDS:
+        LOGGER.info({"Cached_Enabled_Regions": cached_regions[1]})
+        return list(cached_regions[1])
+
     if customer_regions.strip():
         LOGGER.info({"CUSTOMER PROVIDED REGIONS": customer_regions})
         region_list = []
@@ -185,36 +301,28 @@ def get_enabled_regions(customer_regions: str, control_tower_regions_only: bool
         region_list = default_available_regions
 
     region_session = boto3.Session()
-    enabled_regions = []
-    disabled_regions = []
-    invalid_regions = []
-    for region in region_list:
-        try:
-            sts_client = region_session.client(
-                "sts",
-                endpoint_url=f"https://sts.{region}.amazonaws.com",
-                region_name=region,
-            )
-            sts_client.get_caller_identity()
-            enabled_regions.append(region)
-        except EndpointConnectionError:
-            invalid_regions.append(region)
-            LOGGER.error(f"Region: ({region}) is not valid")
-        except ClientError as error:
-            if error.response["Error"]["Code"] == "InvalidClientTokenId":
-                disabled_regions.append(region)
-            LOGGER.error(f"Error {error.response['Error']} occurred testing region {region}")
-        except Exception:
-            LOGGER.exception("Unexpected!")
+    sts_clients = [region_session.client("sts", endpoint_url=f"https://sts.{region}.amazonaws.com", region_name=region) for region in region_list]
+    with ThreadPoolExecutor(max_workers=REGION_PROBE_MAX_WORKERS) as executor:
+        region_statuses = dict(zip(region_list, executor.map(probe_region, sts_clients, region_list)))
+    enabled_regions = [region for region, status in region_statuses.items() if status == "enabled"]
+    disabled_regions = [region for region, status in region_statuses.items() if status == "disabled"]
+    invalid_regions = [region for region, status in region_statuses.items() if status == "invalid"]
+    error_regions = [region for region, status in region_statuses.items() if status == "error"]
 
     LOGGER.info(
         {
             "Enabled_Regions": enabled_regions,
             "Disabled_Regions": disabled_regions,
             "Invalid_Regions": invalid_regions,
+            "Error_Regions": error_regions,
         }
     )
-    return enabled_regions
+    if error_regions:
+        LOGGER.warning(f"Not caching enabled regions because probing failed in: {', '.join(error_regions)}")
+    else:
+        with ENABLED_REGIONS_CACHE_LOCK:
+            ENABLED_REGIONS_CACHE[cache_key] = (monotonic(), enabled_regions)
+    return list(enabled_regions)
 
 
 def create_service_linked_role(service_linked_role_name: str, service_name: str, description: str = "") -> None:
@@ -12,6 +12,7 @@ from __future__ import annotations
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 from typing import TYPE_CHECKING, Literal, Optional, Sequence, Union
 
@@ -27,6 +28,7 @@ if TYPE_CHECKING:
     from mypy_boto3_organizations import OrganizationsClient
     from mypy_boto3_ssm import SSMClient
     from mypy_boto3_ssm.type_defs import TagTypeDef
+    from mypy_boto3_sts import STSClient
 
 # Setup Default Logger
 LOGGER = logging.getLogger(__name__)
@@ -60,6 +62,7 @@ SRA_SSM_PARAMETERS = [
 UNEXPECTED = "Unexpected!"
 EMPTY_VALUE = "NONE"
 BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "standard"})
+REGION_PROBE_MAX_WORKERS = 16
 
 # Initialize the helper
 helper = CfnResource(json_logging=True, log_level=log_level, boto_level="CRITICAL", sleep_on_delete=120)
@@ -157,6 +160,31 @@ def get_customer_other_regions() -> list:  # noqa: CCR001
     return customer_regions
 
 
+def is_region_enabled(sts_client: STSClient, region: str) -> bool:
+    """Test whether a region is enabled by calling STS in the region.
+
+    Args:
+        sts_client: Regional STS client
+        region: AWS region
+
+    Raises:
+        EndpointConnectionError: region is not valid.
+
+    Returns:
+        True if the region is enabled, False if it is disabled
+    """
+    try:
+        sts_client.get_caller_identity()
+    except EndpointConnectionError:
+        LOGGER.error(f"Region: '{region}' is not valid.")
+        raise
+    except ClientError as error:
+        if error.response["Error"]["Code"] == "InvalidClientTokenId":
+            return False
+        raise
+    return True
+
+
 def get_enabled_regions() -> list:  # noqa: CCR001
     """Query STS to identify enabled regions.
 
@@ -188,22 +216,15 @@ def get_enabled_regions() -> list:  # noqa: CCR001
     ]
     LOGGER.info({"Default_Available_Regions": default_available_regions})
 
-    enabled_regions = []
-    disabled_regions = []
     region_session = boto3.Session()
-    for region in default_available_regions:
-        try:
-            sts_client = region_session.client("sts", endpoint_url=f"https://sts.{region}.amazonaws.com", region_name=region, config=BOTO3_CONFIG)
-            sts_client.get_caller_identity()
-            enabled_regions.append(region)
-        except EndpointConnectionError:
-            LOGGER.error(f"Region: '{region}' is not valid.")
-            raise
-        except ClientError as error:
-            if error.response["Error"]["Code"] == "InvalidClientTokenId":
-                disabled_regions.append(region)
-                continue
-            raise
+    sts_clients = [
+        region_session.client("sts", endpoint_url=f"https://sts.{region}.amazonaws.com", region_name=region, config=BOTO3_CONFIG)
+        for region in default_available_regions
+    ]
+    with ThreadPoolExecutor(max_workers=REGION_PROBE_MAX_WORKERS) as executor:
+        region_enabled = dict(zip(default_available_regions, executor.map(is_region_enabled, sts_clients, default_available_regions)))
+    enabled_regions = [region for region, enabled in region_enabled.items() if enabled]
+    disabled_regions = [region for region, enabled in region_enabled.items() if not enabled]
 
     LOGGER.info({"Disabled_Regions": disabled_regions})
     return enabled_regions
@@ -9,6 +9,8 @@ SPDX-License-Identifier: MIT-0
 """
 from __future__ import annotations
 
+import base64
+import gzip
 import json
 import logging
 import os
@@ -24,11 +26,10 @@ from crhelper import CfnResource
 if TYPE_CHECKING:
     from aws_lambda_typing.context import Context
     from aws_lambda_typing.events import CloudFormationCustomResourceEvent
-    from mypy_boto3_config.type_defs import DeliveryChannelTypeDef
+    from mypy_boto3_config.type_defs import ConfigurationRecorderTypeDef, DeliveryChannelTypeDef
     from mypy_boto3_organizations import OrganizationsClient
     from mypy_boto3_secretsmanager import SecretsManagerClient
     from mypy_boto3_sns import SNSClient
-    from mypy_boto3_sns.type_defs import PublishBatchResponseTypeDef
 
 LOGGER = logging.getLogger("sra")
 log_level: str = os.environ.get("LOG_LEVEL", "ERROR")
@@ -37,7 +38,11 @@ LOGGER.setLevel(log_level)
 UNEXPECTED = "Unexpected!"
 SERVICE_NAME = "config.amazonaws.com"
 SLEEP_SECONDS = 60
-SNS_PUBLISH_BATCH_MAX = 10
+SNS_MESSAGE_BYTES_MAX = 262144  # SNS limit for a message and for a whole PublishBatch request
+SNS_MESSAGE_ACCOUNTS_BYTES_BUDGET = 32768  # Serialized account list bytes per regional message
+SNS_MESSAGE_ACCOUNTS_MAX = 200  # Accounts per regional message, bounding the duration of each fan-out invocation
+SNS_MESSAGE_COMPRESSION_THRESHOLD = 65536  # Message bodies larger than this are sent gzip compressed
+SNS_MESSAGE_COMPRESSED_ENCODING = "gzip+base64"
 
 helper = CfnResource(json_logging=True, log_level=log_level, boto_level="CRITICAL", sleep_on_delete=120)
 
@@ -91,24 +96,15 @@ def process_account(aws_account_id: str, params: dict) -> None:
         params: solution parameters
     """
     sleep(SLEEP_SECONDS)
-    config.create_service_linked_role(aws_account_id, params["CONFIGURATION_ROLE_NAME"])
+    config.create_service_linked_roles([aws_account_id], params["CONFIGURATION_ROLE_NAME"])
     regions = common.get_enabled_regions(params["ENABLED_REGIONS"], params["CONTROL_TOWER_REGIONS_ONLY"] == "true")
     resource_types = build_resource_types_param(params)
 
+    configuration_recorder = build_configuration_recorder(params, aws_account_id, resource_types)
+
     for region in regions:
-        role_arn = f"arn:{params['AWS_PARTITION']}:iam::{aws_account_id}:role/aws-service-role/config.amazonaws.com/AWSServiceRoleForConfig"
-        config.set_config_in_org(
-            aws_account_id,
-            region,
-            params["CONFIGURATION_ROLE_NAME"],
-            params["RECORDER_NAME"],
-            role_arn,
-            resource_types,
-            params["ALL_SUPPORTED"],
-            params["INCLUDE_GLOBAL_RESOURCE_TYPES"],
-        )
         delivery_channel = set_delivery_channel_params(params, region)
-        config.set_delivery_channel(aws_account_id, region, params["CONFIGURATION_ROLE_NAME"], delivery_channel)
+        config.set_config_in_org(aws_account_id, region, params["CONFIGURATION_ROLE_NAME"], configuration_recorder, delivery_channel)
 
 
 def process_event_organizations(event: dict) -> None:
@@ -125,10 +121,12 @@ def process_event_organizations(event: dict) -> None:
         for party in event["detail"]["responseElements"]["handshake"]["parties"]:
             if party["type"] == "ACCOUNT":
                 aws_account_id = party["id"]
+                common.update_organization_account_inventory(aws_account_id)
                 process_account(aws_account_id, params)
                 break
     elif event["detail"]["eventName"] == "CreateAccountResult":
         aws_account_id = event["detail"]["serviceEventDetails"]["createAccountStatus"]["accountId"]
+        common.update_organization_account_inventory(aws_account_id)
         process_account(aws_account_id, params)
     else:
         LOGGER.info("Organization event does not match expected values.")
@@ -362,6 +360,29 @@ def set_delivery_channel_params(params: dict, region: str) -> DeliveryChannelTyp
     return delivery_channel
 
 
+def build_configuration_recorder(params: dict, account_id: str, resource_types: list) -> ConfigurationRecorderTypeDef:
+    """Build the Config recorder parameters for an account.
+
+    Args:
+        params: Configuration Parameters
+        account_id: AWS Account ID
+        resource_types: Resource types
+
+    Returns:
+        ConfigurationRecorderTypeDef: Parameters for the Config recorder
+    """
+    role_arn = f"arn:{params['AWS_PARTITION']}:iam::{account_id}:role/aws-service-role/config.amazonaws.com/AWSServiceRoleForConfig"
+    return {
+        "name": params["RECORDER_NAME"],
+        "roleARN": role_arn,
+        "recordingGroup": {
+            "allSupported": params["ALL_SUPPORTED"],
+            "includeGlobalResourceTypes": params["INCLUDE_GLOBAL_RESOURCE_TYPES"],
+            "resourceTypes": resource_types,
+        },
+    }
+
+
 def setup_config_global(params: dict, regions: list, accounts: list) -> None:
     """Enable the Config service and configure its global settings.
 
@@ -370,66 +391,96 @@ def setup_config_global(params: dict, regions: list, accounts: list) -> None:
         regions: list of regions
         accounts: list of accounts
     """
-    for account in accounts:
-        config.create_service_linked_role(account["AccountId"], params["CONFIGURATION_ROLE_NAME"])
+    config.create_service_linked_roles([account["AccountId"] for account in accounts], params["CONFIGURATION_ROLE_NAME"])
 
     create_sns_messages(accounts, regions, params["SNS_TOPIC_ARN_FANOUT"], "configure")
 
 
-def create_sns_messages(accounts: list, regions: list, sns_topic_arn_fanout: str, action: str) -> None:
-    """Create SNS Message.
+def chunk_accounts(accounts: list, bytes_budget: int = SNS_MESSAGE_ACCOUNTS_BYTES_BUDGET, accounts_max: int = SNS_MESSAGE_ACCOUNTS_MAX) -> list:
+    """Split the accounts into chunks whose serialized size fits the byte budget.
 
     Args:
         accounts: Account List
-        regions: list of AWS regions
-        sns_topic_arn_fanout: SNS Topic ARN
-        action: Action
+        bytes_budget: Maximum serialized bytes of the accounts in a chunk
+        accounts_max: Maximum number of accounts in a chunk
+
+    Returns:
+        list: Account chunks, with at least one (possibly empty) chunk
     """
-    sns_messages = []
-    for region in regions:
-        sns_message = {"Accounts": accounts, "Region": region, "Action": action}
-        sns_messages.append(
-            {
-                "Id": region,
-                "Message": json.dumps(sns_message),
-                "Subject": "Config Configuration",
-            }
-        )
+    chunks: list = [[]]
+    chunk_bytes = 0
+    for account in accounts:
+        account_bytes = len(json.dumps(account).encode()) + 2  # Separator between list items
+        if chunks[-1] and (chunk_bytes + account_bytes > bytes_budget or len(chunks[-1]) >= accounts_max):
+            chunks.append([])
+            chunk_bytes = 0
+        chunks[-1].append(account)
+        chunk_bytes += account_bytes
+    return chunks
+
 
-    process_sns_message_batches(sns_messages, sns_topic_arn_fanout)
+def encode_sns_message(message: dict) -> str:
+    """Serialize an SNS message, compressing it when it is larger than the compression threshold.
 
+    Args:
+        message: SNS message
 
-def publish_sns_message_batch(message_batch: list, sns_topic_arn_fanout: str) -> None:
-    """Publish SNS Message Batches.
+    Raises:
+        ValueError: The encoded message is larger than the SNS message limit
+
+    Returns:
+        str: SNS message body
+    """
+    body = json.dumps(message)
+    if len(body.encode()) > SNS_MESSAGE_COMPRESSION_THRESHOLD:
+        payload = base64.b64encode(gzip.compress(body.encode())).decode()
+        body = json.dumps({"Encoding": SNS_MESSAGE_COMPRESSED_ENCODING, "Payload": payload})
+    if len(body.encode()) > SNS_MESSAGE_BYTES_MAX:
+        raise ValueError(f"SNS message for {message.get('Region')} is {len(body.encode())} bytes, larger than the {SNS_MESSAGE_BYTES_MAX} byte limit")
+    return body
+
+
+def decode_sns_message(body: str) -> dict:
+    """Deserialize an SNS message built by encode_sns_message.
 
     Args:
-        message_batch: Batch of SNS messages
-        sns_topic_arn_fanout: SNS Topic ARN
+        body: SNS message body
+
+    Returns:
+        dict: SNS message
     """
-    LOGGER.info("Publishing SNS Message Batch")
-    LOGGER.info({"SNSMessageBatch": message_batch})
-    response: PublishBatchResponseTypeDef = SNS_CLIENT.publish_batch(TopicArn=sns_topic_arn_fanout, PublishBatchRequestEntries=message_batch)
-    api_call_details = {"API_Call": "sns:PublishBatch", "API_Response": response}
-    LOGGER.info(api_call_details)
+    message = json.loads(body)
+    if message.get("Encoding") == SNS_MESSAGE_COMPRESSED_ENCODING:
+        message = json.loads(gzip.decompress(base64.b64decode(message["Payload"])))
+    return message
+
 
+def create_sns_messages(accounts: list, regions: list, sns_topic_arn_fanout: str, action: str) -> None:
+    """Create SNS Message.
 
-def process_sns_message_batches(sns_messages: list, sns_topic_arn_fanout: str) -> None:
-    """Process SNS Message Batches for Publishing.
+    One message is published for each region and account chunk, so each fan-out invocation handles a bounded number of accounts.
 
     Args:
-        sns_messages: SNS messages to be batched.
+        accounts: Account List
+        regions: list of AWS regions
         sns_topic_arn_fanout: SNS Topic ARN
+        action: Action
     """
-    message_batches = []
-    for i in range(
-        SNS_PUBLISH_BATCH_MAX,
-        len(sns_messages) + SNS_PUBLISH_BATCH_MAX,
-        SNS_PUBLISH_BATCH_MAX,
-    ):
-        message_batches.append(sns_messages[i - SNS_PUBLISH_BATCH_MAX : i])
+    sns_messages = []
+    account_chunks = chunk_accounts(accounts)
+    for region in regions:
+        for chunk_index, account_chunk in enumerate(account_chunks):
+            sns_message = {"Accounts": account_chunk, "Region": region, "Action": action, "Chunk": chunk_index, "Chunks": len(account_chunks)}
+            sns_messages.append(
+                {
+                    "Id": f"{region}-{chunk_index}",
+                    "Message": encode_sns_message(sns_message),
+                    "Subject": "Config Configuration",
+                }
+            )
+    LOGGER.info({"SNS_Messages": len(sns_messages), "Account_Chunks": len(account_chunks), "Regions": len(regions)})
 
-    for batch in message_batches:
-        publish_sns_message_batch(batch, sns_topic_arn_fanout)
+    common.publish_sns_messages(SNS_CLIENT, sns_messages, sns_topic_arn_fanout)
 
 
 def process_event_sns(event: dict) -> None:
@@ -440,30 +491,17 @@ def process_event_sns(event: dict) -> None:
     """
     params = get_validated_parameters({})
     for record in event["Records"]:
-        record["Sns"]["Message"] = json.loads(record["Sns"]["Message"])
+        record["Sns"]["Message"] = decode_sns_message(record["Sns"]["Message"])
         LOGGER.info({"SNS Record": record})
         message = record["Sns"]["Message"]
         if message["Action"] == "configure":
             LOGGER.info("Continuing process to enable Config (sns event)")
             resource_types = build_resource_types_param(params)
-
-            for account in message["Accounts"]:
-                role_arn = (
-                    f"arn:{params['AWS_PARTITION']}:iam::{account['AccountId']}:role/aws-service-role/config.amazonaws.com/AWSServiceRoleForConfig"
-                )
-                config.set_config_in_org(
-                    account["AccountId"],
-                    message["Region"],
-                    params["CONFIGURATION_ROLE_NAME"],
-                    params["RECORDER_NAME"],
-                    role_arn,
-                    resource_types,
-                    params["ALL_SUPPORTED"],
-                    params["INCLUDE_GLOBAL_RESOURCE_TYPES"],
-                )
+            configuration_recorders = {
+                account["AccountId"]: build_configuration_recorder(params, account["AccountId"], resource_types) for account in message["Accounts"]
+            }
             delivery_channel = set_delivery_channel_params(params, message["Region"])
-            for account in message["Accounts"]:
-                config.set_delivery_channel(account["AccountId"], message["Region"], params["CONFIGURATION_ROLE_NAME"], delivery_channel)
+            config.set_config_in_accounts(configuration_recorders, message["Region"], params["CONFIGURATION_ROLE_NAME"], delivery_channel)
 
         LOGGER.info("...ADD_UPDATE_NO_EVENT")
 
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING
 
 import boto3
@@ -21,7 +22,6 @@ if TYPE_CHECKING:
     from mypy_boto3_cloudformation import CloudFormationClient
     from mypy_boto3_config.client import ConfigServiceClient
     from mypy_boto3_config.type_defs import ConfigurationRecorderTypeDef, DeliveryChannelTypeDef
-    from mypy_boto3_iam import IAMClient
     from mypy_boto3_organizations import OrganizationsClient
     from mypy_boto3_ssm.client import SSMClient
 
@@ -31,9 +31,8 @@ log_level: str = os.environ.get("LOG_LEVEL", "ERROR")
 LOGGER.setLevel(log_level)
 
 # Global Variables
-MAX_THREADS = 20
+MAX_THREADS = int(os.environ.get("MAX_THREADS", "20"))  # Accounts configured at the same time in a region
 ORG_PAGE_SIZE = 20  # Max page size for list_accounts
-ORG_THROTTLE_PERIOD = 0.2
 BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "standard"})
 
 try:
@@ -46,104 +45,136 @@ except Exception as error:
     raise ValueError("Unexpected error executing Lambda function. Review CloudWatch logs for details.") from None
 
 
-def create_service_linked_role(account_id: str, configuration_role_name: str) -> None:
-    """Create service linked role in the given account.
+def create_service_linked_roles(account_ids: list, configuration_role_name: str) -> dict:
+    """Create service linked role in the given accounts.
 
     Args:
-        account_id (str): Account ID
+        account_ids (list): Account IDs
         configuration_role_name (str): IAM configuration role name
+
+    Returns:
+        dict: Account ID -> "existing" or "created"
     """
-    LOGGER.info(f"creating service linked role for account {account_id}")
-    account_session: boto3.Session = common.assume_role(configuration_role_name, "sra-configure-config", account_id)
-    iam_client: IAMClient = account_session.client("iam")
-    common.create_service_linked_role(
+    LOGGER.info(f"creating service linked role for accounts {account_ids}")
+    return common.provision_service_linked_roles(
+        account_ids,
+        configuration_role_name,
+        "sra-configure-config",
         "AWSServiceRoleForConfig",
         "config.amazonaws.com",
         "A service-linked role required for AWS Config",
-        iam_client,
     )
 
 
-def set_config_in_org(
-    account_id: str,
-    region: str,
-    configuration_role_name: str,
-    recorder_name: str,
-    role_arn: str,
-    resource_types: list,
-    all_supported: bool,
-    include_global_resource_types: bool,
+def set_config_recorder(
+    config_client: ConfigServiceClient, account_id: str, region: str, configuration_recorder: ConfigurationRecorderTypeDef
 ) -> None:
-    """Create Config recorder.
+    """Create or update the Config recorder, describing the existing recorders once.
 
     Args:
-        account_id: Account id
+        config_client: Boto3 Config client
+        account_id: Account ID
         region: AWS Region
-        configuration_role_name:  IAM configuration role name
-        recorder_name: Name for Config recorder
-        role_arn: Role arn to configure Config recorder
-        resource_types: Resource types
-        all_supported: All supported
-        include_global_resource_types: Include global resource types
+        configuration_recorder: Configuration parameters for the Config recorder
     """
-    account_session: boto3.Session = common.assume_role(configuration_role_name, "sra-configure-config", account_id)
-    LOGGER.info(f"Checking config for {account_id} in {region}")  # update
-    config_client: ConfigServiceClient = account_session.client("config", region_name=region)
-    configuration_recorder: ConfigurationRecorderTypeDef = {
-        "name": recorder_name,
-        "roleARN": role_arn,
-        "recordingGroup": {
-            "allSupported": all_supported,
-            "includeGlobalResourceTypes": include_global_resource_types,
-            "resourceTypes": resource_types,
-        },
-    }
-    if len(config_client.describe_configuration_recorders()["ConfigurationRecorders"]):
-        response = config_client.describe_configuration_recorders()["ConfigurationRecorders"]
-        if response.pop(0) == configuration_recorder:
-            LOGGER.info(f"Config recorder is up to update in {account_id} in {region} region. Configurations: {configuration_recorder}")
-        else:
-            LOGGER.info(f"Updating config recorder in {account_id} account in {region} region")
-            config_client.put_configuration_recorder(ConfigurationRecorder=configuration_recorder)
-            LOGGER.info(f"Config recorder updated for {account_id} account in {region} region. Configurations: {configuration_recorder}")
-
-    if not len(config_client.describe_configuration_recorders()["ConfigurationRecorders"]):
+    LOGGER.info(f"Checking config for {account_id} in {region}")
+    existing_recorders = config_client.describe_configuration_recorders()["ConfigurationRecorders"]
+    if not existing_recorders:
         LOGGER.info(f"Creating config recorder in {account_id} account in {region} region")
         config_client.put_configuration_recorder(ConfigurationRecorder=configuration_recorder)
-        LOGGER.info(f"Config recorder started for {account_id} account in {region} region. Configurations: {configuration_recorder}")
-
-    if config_client.describe_configuration_recorder_status()["ConfigurationRecordersStatus"][0]["recording"]:
-        LOGGER.info(f"Config recorder is already started in {region}")
-        LOGGER.info(config_client.describe_configuration_recorder_status())
+        LOGGER.info(f"Config recorder created for {account_id} account in {region} region. Configurations: {configuration_recorder}")
+    elif existing_recorders[0] == configuration_recorder:
+        LOGGER.info(f"Config recorder is up to date in {account_id} in {region} region. Configurations: {configuration_recorder}")
+    else:
+        LOGGER.info(f"Updating config recorder in {account_id} account in {region} region")
+        config_client.put_configuration_recorder(ConfigurationRecorder=configuration_recorder)
+        LOGGER.info(f"Config recorder updated for {account_id} account in {region} region. Configurations: {configuration_recorder}")
 
 
 def set_delivery_channel(
+    config_client: ConfigServiceClient,
     account_id: str,
     region: str,
-    configuration_role_name: str,
+    recorder_name: str,
     delivery_channel: DeliveryChannelTypeDef,
 ) -> None:
-    """Configure Delivery Channel.
+    """Configure Delivery Channel and start the Config recorder.
 
     Args:
+        config_client: Boto3 Config client
         account_id: Account ID
         region: AWS Region
-        configuration_role_name: IAM configuration role name
+        recorder_name: Name of the Config recorder to start
         delivery_channel: Configuration parameters for Config delivery channel
     """
-    account_session: boto3.Session = common.assume_role(configuration_role_name, "sra-configure-config", account_id)
-    config_client: ConfigServiceClient = account_session.client("config", region_name=region)
     try:
         LOGGER.info(f"Setting up config delivery channel for account {account_id} in {region} region")
         config_client.put_delivery_channel(DeliveryChannel=delivery_channel)
-        config_client.start_configuration_recorder(
-            ConfigurationRecorderName=config_client.describe_configuration_recorder_status()["ConfigurationRecordersStatus"][0]["name"]
-        )
+        config_client.start_configuration_recorder(ConfigurationRecorderName=recorder_name)
         LOGGER.info(f"Config delivery channel set for account {account_id} in {region} region. Configurations: {delivery_channel}")
     except ClientError as e:
         LOGGER.info(f"Error {repr(e)} enabling Config on account {account_id}")
 
 
+def set_config_in_org(
+    account_id: str,
+    region: str,
+    configuration_role_name: str,
+    configuration_recorder: ConfigurationRecorderTypeDef,
+    delivery_channel: DeliveryChannelTypeDef,
+) -> None:
+    """Reconcile the Config recorder and delivery channel in an account, assuming the configuration role once.
+
+    Args:
+        account_id: Account ID
+        region: AWS Region
+        configuration_role_name: IAM configuration role name
+        configuration_recorder: Configuration parameters for the Config recorder
+        delivery_channel: Configuration parameters for Config delivery channel
+    """
+    account_session: boto3.Session = common.assume_role(configuration_role_name, "sra-configure-config", account_id)
+    config_client: ConfigServiceClient = account_session.client("config", region_name=region, config=BOTO3_CONFIG)
+    set_config_recorder(config_client, account_id, region, configuration_recorder)
+    set_delivery_channel(config_client, account_id, region, configuration_recorder["name"], delivery_channel)
+
+
+def set_config_in_accounts(
+    configuration_recorders: dict,
+    region: str,
+    configuration_role_name: str,
+    delivery_channel: DeliveryChannelTypeDef,
+    max_workers: int = MAX_THREADS,
+) -> None:
+    """Reconcile the Config recorder and delivery channel in many accounts in a region concurrently.
+
+    Args:
+        configuration_recorders: Account ID -> configuration parameters for the account's Config recorder
+        region: AWS Region
+        configuration_role_name: IAM configuration role name
+        delivery_channel: Configuration parameters for Config delivery channel
+        max_workers: Maximum number of accounts configured at the same time
+
+    Raises:
+        ValueError: Config could not be configured in one or more accounts
+    """
+    failed_accounts: dict = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(set_config_in_org, account_id, region, configuration_role_name, configuration_recorder, delivery_channel): account_id
+            for account_id, configuration_recorder in configuration_recorders.items()
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as error:
+                LOGGER.exception(f"Failed to configure Config in {futures[future]} account in {region} region")
+                failed_accounts[futures[future]] = str(error)
+
+    if failed_accounts:
+        LOGGER.error({"Region": region, "Config failed accounts": failed_accounts})
+        raise ValueError(f"Config configuration failed in {region} for accounts: {', '.join(sorted(failed_accounts))}")
+
+
 def stop_config_recorder(account_id: str, region: str, configuration_role_name: str) -> None:
     """.
 
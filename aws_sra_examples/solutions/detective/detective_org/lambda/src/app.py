@@ -13,7 +13,7 @@ import logging
 import os
 import re
 from time import sleep
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 import boto3
 import common
@@ -302,27 +302,31 @@ def setup_detective_global(params: dict, regions: list, accounts: list) -> None:
             params["CONFIGURATION_ROLE_NAME"],
         )
 
-    for region in regions:
-        setup_detective_in_region(
-            region,
-            accounts,
-            build_datasource_param(params["DATASOURCE_PACKAGES"]),
-            params["DELEGATED_ADMIN_ACCOUNT_ID"],
-            params["CONFIGURATION_ROLE_NAME"],
+    regional_graphs = {
+        region: setup_detective_in_region(region, params["DELEGATED_ADMIN_ACCOUNT_ID"], params["CONFIGURATION_ROLE_NAME"]) for region in regions
+    }
+
+    detective.create_members(accounts, regional_graphs)
+
+    datasource_packages = build_datasource_param(params["DATASOURCE_PACKAGES"])
+    for detective_delegated_admin_region_client, graph_arn in regional_graphs.values():
+        detective.update_datasource_packages(
+            detective_delegated_admin_region_client,
+            graph_arn,
+            datasource_packages,
         )
 
 
-def setup_detective_in_region(
-    region: str, accounts: list, datasource_packages: list, delegated_admin_account: str, configuration_role_name: str
-) -> None:
+def setup_detective_in_region(region: str, delegated_admin_account: str, configuration_role_name: str) -> Tuple[DetectiveClient, str]:
     """Regional setup process of the Detective service.
 
     Args:
         region: aws region
-        accounts: list of accounts and email
-        datasource_packages: datasource packages
         delegated_admin_account: delegated admin aws account number
         configuration_role_name: detective configuration role
+
+    Returns:
+        Delegated admin detective client for the region and Detective's graph arn
     """
     detective.register_and_enable_delegated_admin(
         delegated_admin_account,
@@ -344,13 +348,7 @@ def setup_detective_in_region(
 
     detective.set_auto_enable_detective_in_org(region, detective_delegated_admin_region_client, graph_arn)
 
-    detective.create_members(accounts, detective_delegated_admin_region_client, graph_arn)
-
-    detective.update_datasource_packages(
-        detective_delegated_admin_region_client,
-        graph_arn,
-        datasource_packages,
-    )
+    return detective_delegated_admin_region_client, graph_arn
 
 
 @helper.create
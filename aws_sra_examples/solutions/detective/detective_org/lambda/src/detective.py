@@ -9,13 +9,12 @@ SPDX-License-Identifier: MIT-0
 from __future__ import annotations
 
 import logging
-import math
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from time import sleep
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, Iterator
 
 import boto3
-import botocore
 import common
 
 if TYPE_CHECKING:
@@ -37,12 +36,13 @@ LOGGER.setLevel(log_level)
 
 
 UNEXPECTED = "Unexpected!"
-EMPTY_STRING = ""
-DETECTIVE_THROTTLE_PERIOD = 0.2
 ENABLE_RETRY_ATTEMPTS = 10
 ENABLE_RETRY_SLEEP_INTERVAL = 10
 MAX_RETRY = 5
 SLEEP_SECONDS = 10
+LIST_MEMBERS_PAGE_SIZE = 200  # Max page size for list_members
+CREATE_MEMBERS_BATCH_MAX = 50
+CREATE_MEMBERS_MAX_WORKERS = 8
 
 
 try:
@@ -84,12 +84,10 @@ def is_admin_account_enabled(detective_client: DetectiveClient, admin_account_id
     Returns:
         True or False
     """
-    paginator: botocore.paginate.Paginator = detective_client.get_paginator("list_organization_admin_accounts")
-    for page in paginator.paginate():
+    for page in common.rate_limited_paginate(detective_client, "list_organization_admin_accounts"):
         for admin_account in page["Administrators"]:
             if admin_account["AccountId"] == admin_account_id:
                 return True
-        sleep(DETECTIVE_THROTTLE_PERIOD)
     return False
 
 
@@ -101,11 +99,10 @@ def disable_organization_admin_account(regions: list) -> None:
     """
     for region in regions:
         detective_client: DetectiveClient = MANAGEMENT_ACCOUNT_SESSION.client("detective", region)
-        response = detective_client.disable_organization_admin_account()
+        response = common.rate_limited_call(detective_client, "disable_organization_admin_account")
         api_call_details = {"API_Call": "detective:DisableOrganizationAdminAccount", "API_Response": response}
         LOGGER.info(api_call_details)
         LOGGER.info(f"Admin Account Disabled in {region}")
-        sleep(DETECTIVE_THROTTLE_PERIOD)
 
 
 def check_organization_admin_enabled(detective_client: DetectiveClient) -> bool:
@@ -190,47 +187,38 @@ def get_unprocessed_account_details(create_members_response: CreateMembersRespon
     Returns:
         remaining account list
     """
+    accounts_by_id = {account_record["AccountId"]: account_record for account_record in accounts}
     remaining_accounts = []
 
     for unprocessed_account in create_members_response["UnprocessedAccounts"]:
         if "error" in unprocessed_account["Reason"]:
             LOGGER.error(f"{unprocessed_account}")
             raise ValueError(f"Internal Error creating member accounts: {unprocessed_account['Reason']}") from None
-        for account_record in accounts:
-            LOGGER.info(f"Unprocessed Account {unprocessed_account}")
-            if account_record["AccountId"] == unprocessed_account["AccountId"] and unprocessed_account["Reason"] != "Account is already a member":
-                remaining_accounts.append(account_record)
+        LOGGER.info(f"Unprocessed Account {unprocessed_account}")
+        if unprocessed_account["AccountId"] in accounts_by_id and unprocessed_account["Reason"] != "Account is already a member":
+            remaining_accounts.append(accounts_by_id[unprocessed_account["AccountId"]])
     return remaining_accounts
 
 
-def get_detective_member_accounts(  # noqa S107
-    detective_client: DetectiveClient, graph_arn: str, next_token: str = EMPTY_STRING, members: list = None
-) -> list:
-    """Get Detective's member accounts with a status of Enabled.
+def get_detective_member_accounts(detective_client: DetectiveClient, graph_arn: str) -> Iterator[str]:
+    """Get Detective's member accounts with a status of Enabled, one page at a time.
 
     Args:
         detective_client: boto3 Detective Client
         graph_arn: Detective's graph arn
-        next_token: Next token for truncated API results. Defaults to ''.
-        members: accounts that are members of Detective. Defaults to None.
 
-    Returns:
+    Yields:
         accounts that are members of Detective
     """
-    response: ListMembersResponseTypeDef
-    if members is None:
-        members = []
-    if next_token != EMPTY_STRING:
-        response = detective_client.list_members(GraphArn=graph_arn, MaxResults=200, NextToken=next_token)
-    else:
-        response = detective_client.list_members(GraphArn=graph_arn, MaxResults=10)
-    for member in response["MemberDetails"]:
-        if member["Status"] == "ENABLED":
-            members.append(member["AccountId"])
-    if "NextToken" in response:
-        get_detective_member_accounts(detective_client, graph_arn, response["NextToken"], members)
-
-    return members
+    list_members_params: dict = {"GraphArn": graph_arn, "MaxResults": LIST_MEMBERS_PAGE_SIZE}
+    while True:
+        response: ListMembersResponseTypeDef = common.rate_limited_call(detective_client, "list_members", **list_members_params)
+        for member in response["MemberDetails"]:
+            if member["Status"] == "ENABLED":
+                yield member["AccountId"]
+        if "NextToken" not in response:
+            return
+        list_members_params["NextToken"] = response["NextToken"]
 
 
 def get_members_to_add(detective_client: DetectiveClient, graph_arn: str, accounts: list) -> list:
@@ -245,36 +233,32 @@ def get_members_to_add(detective_client: DetectiveClient, graph_arn: str, accoun
         Organization accounts that are not members of Detective
     """
     LOGGER.info("get_members_to_add begin")
-    members_to_add: list = []
-    confirmed_members: list = get_detective_member_accounts(detective_client, graph_arn)
-
-    for account in accounts:
-        if account["AccountId"] not in confirmed_members:
-            LOGGER.info(f"Account {account['AccountId']} is a member of the Organization but not a member of Detective, adding...")
-            members_to_add.append({"AccountId": account["AccountId"], "EmailAddress": account["Email"]})
-        else:
-            LOGGER.info(f"Account {account['AccountId']} is already a member of Detective")
+    members_to_add: dict = {account["AccountId"]: {"AccountId": account["AccountId"], "EmailAddress": account["Email"]} for account in accounts}
+    for member_account_id in get_detective_member_accounts(detective_client, graph_arn):
+        if members_to_add.pop(member_account_id, None):
+            LOGGER.info(f"Account {member_account_id} is already a member of Detective")
+
+    for account_id in members_to_add:
+        LOGGER.info(f"Account {account_id} is a member of the Organization but not a member of Detective, adding...")
     LOGGER.info("get_members_to_add end")
-    return members_to_add
+    return list(members_to_add.values())
 
 
-def create_members(accounts_info: list, detective_client: DetectiveClient, graph_arn: str) -> None:  # noqa: CCR001 (cognitive complexity)
-    """Create members for Detective.
+def create_member_chunk(detective_client: DetectiveClient, graph_arn: str, account_details: list) -> None:
+    """Create up to CREATE_MEMBERS_BATCH_MAX Detective members, retrying the unprocessed accounts.
 
     Args:
-        accounts_info: [{"AccountId": "Value", "EmailAddress": "Value"]
         detective_client: boto3 detective client object
         graph_arn: Detective's graph arn
-
-    Raises:
-        ValueError: Unprocessed accounts
+        account_details: [{"AccountId": "Value", "EmailAddress": "Value"]
     """
-    accounts_info = get_members_to_add(detective_client, graph_arn, accounts_info)
-    number_of_create_members_calls = math.ceil(len(accounts_info) / 50)
-    for api_call_number in range(0, number_of_create_members_calls):
-        account_details = accounts_info[api_call_number * 50 : (api_call_number * 50) + 50]
-        create_members_response: CreateMembersResponseTypeDef = detective_client.create_members(
-            GraphArn=graph_arn, DisableEmailNotification=True, Accounts=account_details
+    remaining_accounts = account_details
+    retry_count = 0
+    while remaining_accounts:
+        if retry_count:
+            LOGGER.info(f"Retry number; {retry_count} for unprocessed accounts")
+        create_members_response: CreateMembersResponseTypeDef = common.rate_limited_call(
+            detective_client, "create_members", GraphArn=graph_arn, DisableEmailNotification=True, Accounts=remaining_accounts
         )
         api_call_details = {
             "API_Call": "Detective:CreateMembers",
@@ -282,32 +266,62 @@ def create_members(accounts_info: list, detective_client: DetectiveClient, graph
         }
         LOGGER.info(api_call_details)
 
-        if "UnprocessedAccounts" in create_members_response and create_members_response["UnprocessedAccounts"]:
-            unprocessed = True
-            retry_count = 0
-            unprocessed_accounts: list = []
+        if not create_members_response.get("UnprocessedAccounts"):
+            return
+        LOGGER.info(f"Unprocessed Accounts: {create_members_response['UnprocessedAccounts']}")
+        remaining_accounts = get_unprocessed_account_details(create_members_response, remaining_accounts)
+        if remaining_accounts:
+            if retry_count >= MAX_RETRY:
+                LOGGER.info(f"max retry reached, remaining accounts: {remaining_accounts}")
+                return
+            retry_count += 1
             LOGGER.info(f"Sleeping for {SLEEP_SECONDS} before retry")
             sleep(SLEEP_SECONDS)
-            while unprocessed:
-                retry_count += 1
-                LOGGER.info(f"Retry number; {retry_count} for unprocessed accounts")
-                LOGGER.info(f"Unprocessed Accounts: {create_members_response['UnprocessedAccounts']}")
-                remaining_accounts = get_unprocessed_account_details(create_members_response, account_details)
-
-                if remaining_accounts:
-                    LOGGER.info(f"Remaining accounts found during create members {remaining_accounts}")
-                    create_members_response = detective_client.create_members(
-                        GraphArn=graph_arn, DisableEmailNotification=True, Accounts=remaining_accounts
-                    )
-                    api_call_details["API_Response"] = create_members_response
-                    LOGGER.info(api_call_details)
-
-                if retry_count >= MAX_RETRY:
-                    LOGGER.info("max retry reached")
-                    unprocessed = False
-            if unprocessed_accounts:
-                LOGGER.info(f"Unprocessed Member Accounts: {unprocessed_accounts}")
-                raise ValueError("Unprocessed Member Accounts while Creating Members")
+
+
+def create_members(accounts_info: list, regional_graphs: dict, max_workers: int = CREATE_MEMBERS_MAX_WORKERS) -> None:
+    """Create members for Detective in many regions, submitting the CreateMembers chunks of all regions concurrently.
+
+    Args:
+        accounts_info: [{"AccountId": "Value", "Email": "Value"]
+        regional_graphs: region -> (boto3 detective client object, Detective's graph arn)
+        max_workers: Maximum number of CreateMembers chunks submitted at the same time
+
+    Raises:
+        ValueError: Creating members failed in one or more regions
+    """
+    failed_regions: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        listing_futures = {
+            executor.submit(get_members_to_add, detective_client, graph_arn, accounts_info): region
+            for region, (detective_client, graph_arn) in regional_graphs.items()
+        }
+        chunk_futures = {}
+        for listing_future in as_completed(listing_futures):
+            region = listing_futures[listing_future]
+            try:
+                members_to_add = listing_future.result()
+            except Exception as error:
+                LOGGER.exception(f"Failed to list Detective members in {region}")
+                failed_regions[region] = str(error)
+                continue
+            detective_client, graph_arn = regional_graphs[region]
+            for index in range(0, len(members_to_add), CREATE_MEMBERS_BATCH_MAX):
+                chunk_future = executor.submit(
+                    create_member_chunk, detective_client, graph_arn, members_to_add[index : index + CREATE_MEMBERS_BATCH_MAX]
+                )
+                chunk_futures[chunk_future] = region
+
+        for chunk_future in as_completed(chunk_futures):
+            try:
+                chunk_future.result()
+            except Exception as error:
+                LOGGER.exception(f"Failed to create Detective members in {chunk_futures[chunk_future]}")
+                failed_regions[chunk_futures[chunk_future]] = str(error)
+
+    if failed_regions:
+        LOGGER.error({"Create members failed regions": failed_regions})
+        raise ValueError(f"Creating Detective members failed in regions: {', '.join(sorted(failed_regions))}")
 
 
 def update_datasource_packages(detective_client: DetectiveClient, graph_arn: str, packages: list) -> None:
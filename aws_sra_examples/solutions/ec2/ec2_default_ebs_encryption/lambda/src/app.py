@@ -14,8 +14,11 @@ from __future__ import annotations
 import json
 import logging
 import os
+import random
 import re
-from time import sleep
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from time import monotonic, sleep
 from typing import TYPE_CHECKING, Any, List, Optional, Union
 
 import boto3
@@ -45,10 +48,21 @@ LOGGER.setLevel(log_level)
 CLOUDFORMATION_PAGE_SIZE = 20
 CLOUDFORMATION_THROTTLE_PERIOD = 0.2
 ORGANIZATIONS_PAGE_SIZE = 20
-ORGANIZATIONS_THROTTLE_PERIOD = 0.2
-SNS_PUBLISH_BATCH_MAX = 10
+SNS_PUBLISH_BATCH_MAX = 10  # Max entries in a PublishBatch request
+SNS_PUBLISH_BATCH_BYTES_MAX = 262144  # Max aggregate payload of a PublishBatch request
+SNS_PUBLISH_MAX_WORKERS = 10  # PublishBatch requests sent at the same time
+SNS_PUBLISH_MAX_ATTEMPTS = 4  # Failed entries are retried with exponential backoff
+SNS_PUBLISH_RETRY_INITIAL_DELAY_SECONDS = 0.5
 UNEXPECTED = "Unexpected!"
 BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "standard"})
+ORG_BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "adaptive"})  # Client-side rate limiting instead of fixed page sleeps
+ORG_ACCOUNTS_CACHE_TTL_SECONDS = 300  # Reuse the account inventory across warm invocations
+ORG_ACCOUNTS_CACHE_LOCK = threading.Lock()
+ORG_ACCOUNTS_CACHE: dict = {}  # {"Accounts": {account ID: account}, "Time": list time}
+REGION_PROBE_MAX_WORKERS = 16
+ENABLED_REGIONS_CACHE_TTL_SECONDS = 900  # Reuse probed regions across warm invocations
+ENABLED_REGIONS_CACHE_LOCK = threading.Lock()
+ENABLED_REGIONS_CACHE: dict = {}  # (customer regions, control tower regions only) -> (probe time, enabled regions)
 
 # Initialize the helper. `sleep_on_delete` allows time for the CloudWatch Logs to get captured.
 helper = CfnResource(json_logging=True, log_level=log_level, boto_level="CRITICAL", sleep_on_delete=120)
@@ -56,7 +70,7 @@ helper = CfnResource(json_logging=True, log_level=log_level, boto_level="CRITICA
 try:
     MANAGEMENT_ACCOUNT_SESSION = boto3.Session()
     CFN_CLIENT: CloudFormationClient = MANAGEMENT_ACCOUNT_SESSION.client("cloudformation", config=BOTO3_CONFIG)
-    ORG_CLIENT: OrganizationsClient = MANAGEMENT_ACCOUNT_SESSION.client("organizations", config=BOTO3_CONFIG)
+    ORG_CLIENT: OrganizationsClient = MANAGEMENT_ACCOUNT_SESSION.client("organizations", config=ORG_BOTO3_CONFIG)
     SNS_CLIENT: SNSClient = MANAGEMENT_ACCOUNT_SESSION.client("sns", config=BOTO3_CONFIG)
     SSM_CLIENT: SSMClient = MANAGEMENT_ACCOUNT_SESSION.client("ssm")
 except Exception as error:
@@ -110,6 +124,32 @@ def get_control_tower_regions() -> list:  # noqa: CCR001
     return list(customer_regions)
 
 
+def probe_region(sts_client: STSClient, region: str) -> str:
+    """Test whether a region is enabled by calling STS in the region.
+
+    Args:
+        sts_client: Regional STS client
+        region: AWS region
+
+    Returns:
+        Region status: enabled, disabled, invalid, or error
+    """
+    try:
+        sts_client.get_caller_identity()
+        return "enabled"
+    except ClientError as error:
+        LOGGER.error(f"Error {error.response['Error']} occurred testing region {region}")
+        if error.response["Error"]["Code"] == "InvalidClientTokenId":
+            return "disabled"
+    except Exception as error:
+        if "Could not connect to the endpoint URL" in str(error):
+            LOGGER.error(f"Region: '{region}' is not valid")
+            LOGGER.error(f"{error}")
+            return "invalid"
+        LOGGER.error(f"{error}")
+    return "error"
+
+
 def get_enabled_regions(customer_regions: str = None, control_tower_regions_only: bool = False) -> list:  # noqa: CCR001
     """Query STS to identify enabled regions.
 
@@ -120,6 +160,13 @@ def get_enabled_regions(customer_regions: str = None, control_tower_regions_only
     Returns:
         Enabled regions
     """
+    cache_key = ((customer_regions or "").strip(), control_tower_regions_only)
+    with ENABLED_REGIONS_CACHE_LOCK:
+        cached_regions = ENABLED_REGIONS_CACHE.get(cache_key)
+    if cached_regions and monotonic() - cached_regions[0] < ENABLED_REGIONS_CACHE_TTL_SECONDS:
+        LOGGER.info({"Cached_Enabled_Regions": cached_regions[1]})
+        return list(cached_regions[1])
+
     if customer_regions and customer_regions.strip():
         LOGGER.debug(f"CUSTOMER PROVIDED REGIONS: {str(customer_regions)}")
         region_list = [value.strip() for value in customer_regions.split(",") if value != ""]
@@ -132,45 +179,57 @@ def get_enabled_regions(customer_regions: str = None, control_tower_regions_only
         LOGGER.info({"Default_Available_Regions": default_available_regions})
         region_list = default_available_regions
 
-    enabled_regions = []
-    disabled_regions = []
-    invalid_regions = []
     region_session = boto3.Session()
-    for region in region_list:
-        try:
-            sts_client = region_session.client("sts", endpoint_url=f"https://sts.{region}.amazonaws.com", region_name=region, config=BOTO3_CONFIG)
-            sts_client.get_caller_identity()
-            enabled_regions.append(region)
-        except ClientError as error:
-            if error.response["Error"]["Code"] == "InvalidClientTokenId":
-                disabled_regions.append(region)
-            LOGGER.error(f"Error {error.response['Error']} occurred testing region {region}")
-        except Exception as error:
-            if "Could not connect to the endpoint URL" in str(error):
-                invalid_regions.append(region)
-                LOGGER.error(f"Region: '{region}' is not valid")
-            LOGGER.error(f"{error}")
+    sts_clients = [
+        region_session.client("sts", endpoint_url=f"https://sts.{region}.amazonaws.com", region_name=region, config=BOTO3_CONFIG)
+        for region in region_list
+    ]
+    with ThreadPoolExecutor(max_workers=REGION_PROBE_MAX_WORKERS) as executor:
+        region_statuses = dict(zip(region_list, executor.map(probe_region, sts_clients, region_list)))
+    enabled_regions = [region for region, status in region_statuses.items() if status == "enabled"]
+    disabled_regions = [region for region, status in region_statuses.items() if status == "disabled"]
+    invalid_regions = [region for region, status in region_statuses.items() if status == "invalid"]
+    error_regions = [region for region, status in region_statuses.items() if status == "error"]
     LOGGER.info({"Disabled_Regions": disabled_regions})
     LOGGER.info({"Invalid_Regions": invalid_regions})
-    return enabled_regions
+    LOGGER.info({"Error_Regions": error_regions})
+    if error_regions:
+        LOGGER.warning(f"Not caching enabled regions because probing failed in: {', '.join(error_regions)}")
+    else:
+        with ENABLED_REGIONS_CACHE_LOCK:
+            ENABLED_REGIONS_CACHE[cache_key] = (monotonic(), enabled_regions)
+    return list(enabled_regions)
 
 
-def get_active_organization_accounts() -> list[AccountTypeDef]:
-    """Get all the active AWS Organization accounts.
+def get_organization_account_inventory() -> dict[str, AccountTypeDef]:
+    """Get the AWS Organization account inventory, listing accounts only when the cached inventory is missing or stale.
 
     Returns:
-        List of active account IDs
+        Accounts keyed by account ID
     """
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        if ORG_ACCOUNTS_CACHE and monotonic() - ORG_ACCOUNTS_CACHE["Time"] < ORG_ACCOUNTS_CACHE_TTL_SECONDS:
+            return ORG_ACCOUNTS_CACHE["Accounts"]
+
+    accounts: dict[str, AccountTypeDef] = {}
     paginator = ORG_CLIENT.get_paginator("list_accounts")
-    accounts: list[AccountTypeDef] = []
     for page in paginator.paginate(PaginationConfig={"PageSize": ORGANIZATIONS_PAGE_SIZE}):
         for account in page["Accounts"]:
-            if account["Status"] == "ACTIVE":
-                accounts.append(account)
-            sleep(ORGANIZATIONS_THROTTLE_PERIOD)
+            accounts[account["Id"]] = account
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        ORG_ACCOUNTS_CACHE.update({"Accounts": accounts, "Time": monotonic()})
     return accounts
 
 
+def get_active_organization_accounts() -> list[AccountTypeDef]:
+    """Get all the active AWS Organization accounts.
+
+    Returns:
+        List of active account IDs
+    """
+    return [account for account in get_organization_account_inventory().values() if account["Status"] == "ACTIVE"]
+
+
 def get_account_info(account_id: str) -> AccountTypeDef:
     """Get AWS Account info.
 
@@ -183,6 +242,9 @@ def get_account_info(account_id: str) -> AccountTypeDef:
     response: DescribeAccountResponseTypeDef = ORG_CLIENT.describe_account(AccountId=account_id)
     api_call_details = {"API_Call": "organizations:DescribeAccounts", "API_Response": response}
     LOGGER.info(api_call_details)
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        if ORG_ACCOUNTS_CACHE:  # Keep the cached inventory current for accounts created or invited after it was listed
+            ORG_ACCOUNTS_CACHE["Accounts"] = {**ORG_ACCOUNTS_CACHE["Accounts"], account_id: response["Account"]}
     return response["Account"]
 
 
@@ -199,7 +261,6 @@ def get_organization_resource_tags(resource_id: str) -> List[TagTypeDef]:
     tags = []
     for page in paginator.paginate(ResourceId=resource_id):
         tags += page["Tags"]
-        sleep(ORGANIZATIONS_THROTTLE_PERIOD)
     return tags
 
 
@@ -237,33 +298,103 @@ def publish_sns_message(message: dict, subject: str, sns_topic_arn: str) -> None
     LOGGER.info(api_call_details)
 
 
-def publish_sns_message_batch(message_batch: list, sns_topic_arn: str) -> None:
-    """Publish SNS Message Batches.
+def build_sns_message_batches(sns_messages: list) -> list:
+    """Group SNS messages into batches within the PublishBatch entry count and aggregate payload limits.
 
     Args:
+        sns_messages: SNS publish batch request entries
+
+    Returns:
+        list: Batches of SNS publish batch request entries
+    """
+    message_batches: list = []
+    batch_bytes = 0
+    for sns_message in sns_messages:
+        message_bytes = len(sns_message["Message"].encode()) + len(sns_message.get("Subject", "").encode())
+        if not message_batches or len(message_batches[-1]) >= SNS_PUBLISH_BATCH_MAX or batch_bytes + message_bytes > SNS_PUBLISH_BATCH_BYTES_MAX:
+            message_batches.append([])
+            batch_bytes = 0
+        message_batches[-1].append(sns_message)
+        batch_bytes += message_bytes
+    return message_batches
+
+
+def publish_sns_message_batch(sns_client: SNSClient, message_batch: list, sns_topic_arn: str) -> list:
+    """Publish a batch of SNS messages.
+
+    Args:
+        sns_client: Boto3 SNS client
         message_batch: Batch of SNS messages
         sns_topic_arn: SNS Topic ARN
+
+    Returns:
+        list: Entries that failed to publish
     """
-    LOGGER.info("Publishing SNS Message Batch")
-    LOGGER.info({"SNSMessageBatch": message_batch})
-    response: PublishBatchResponseTypeDef = SNS_CLIENT.publish_batch(TopicArn=sns_topic_arn, PublishBatchRequestEntries=message_batch)
+    try:
+        response: PublishBatchResponseTypeDef = sns_client.publish_batch(TopicArn=sns_topic_arn, PublishBatchRequestEntries=message_batch)
+    except ClientError as error:
+        LOGGER.warning(f"PublishBatch failed for {len(message_batch)} SNS messages: {error}")
+        return [
+            {"Id": sns_message["Id"], "Code": error.response["Error"]["Code"], "Message": str(error), "SenderFault": False}
+            for sns_message in message_batch
+        ]
     api_call_details = {"API_Call": "sns:PublishBatch", "API_Response": response}
     LOGGER.info(api_call_details)
+    return response["Failed"]
 
 
-def process_sns_message_batches(sns_messages: list, sns_topic_arn: str) -> None:
-    """Process SNS Message Batches for Publishing.
+def publish_sns_messages(sns_client: SNSClient, sns_messages: list, sns_topic_arn: str, max_workers: int = SNS_PUBLISH_MAX_WORKERS) -> None:
+    """Publish SNS messages in concurrent batches, retrying only the entries that failed with a service fault.
 
     Args:
-        sns_messages: SNS messages to be batched.
+        sns_client: Boto3 SNS client
+        sns_messages: SNS publish batch request entries
         sns_topic_arn: SNS Topic ARN
-    """
-    message_batches = []
-    for i in range(SNS_PUBLISH_BATCH_MAX, len(sns_messages) + SNS_PUBLISH_BATCH_MAX, SNS_PUBLISH_BATCH_MAX):
-        message_batches.append(sns_messages[i - SNS_PUBLISH_BATCH_MAX : i])
+        max_workers: Maximum number of PublishBatch requests sent at the same time
 
-    for batch in message_batches:
-        publish_sns_message_batch(batch, sns_topic_arn)
+    Raises:
+        ValueError: SNS messages failed to publish
+    """
+    start_time = monotonic()
+    pending_messages = list(sns_messages)
+    sender_faults: list = []
+    service_faults: list = []
+    attempt = 0
+    delay = SNS_PUBLISH_RETRY_INITIAL_DELAY_SECONDS
+    while pending_messages and attempt < SNS_PUBLISH_MAX_ATTEMPTS:
+        if attempt:
+            LOGGER.info({"Retrying SNS messages": len(pending_messages), "Attempt": attempt + 1})
+            sleep(delay / 2 + random.uniform(0, delay / 2))  # noqa: S311, DUO102
+            delay *= 2
+        attempt += 1
+        message_batches = build_sns_message_batches(pending_messages)
+        pending_messages = []
+        service_faults = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(message_batches))) as executor:
+            futures = {executor.submit(publish_sns_message_batch, sns_client, batch, sns_topic_arn): batch for batch in message_batches}
+            for future in as_completed(futures):
+                messages_by_id = {sns_message["Id"]: sns_message for sns_message in futures[future]}
+                for failed_entry in future.result():
+                    if failed_entry["SenderFault"]:
+                        sender_faults.append(failed_entry)
+                    else:
+                        service_faults.append(failed_entry)
+                        pending_messages.append(messages_by_id[failed_entry["Id"]])
+
+    failed_entries = sender_faults + service_faults
+    LOGGER.info(
+        {
+            "SNS_Publish": {
+                "Messages": len(sns_messages),
+                "Attempts": attempt,
+                "Failed": len(failed_entries),
+                "Seconds": round(monotonic() - start_time, 3),
+            }
+        }
+    )
+    if failed_entries:
+        LOGGER.error({"Failed SNS messages": failed_entries})
+        raise ValueError(f"{len(failed_entries)} of {len(sns_messages)} SNS messages failed to publish")
 
 
 def is_account_with_exclude_tags(aws_account: AccountTypeDef, params: dict) -> bool:
@@ -316,7 +447,7 @@ def process_accounts(event: Union[CloudFormationCustomResourceEvent, dict], para
             sns_message = {"Action": params["action"], "AccountId": account["Id"]}
             sns_messages.append({"Id": account["Id"], "Message": json.dumps(sns_message), "Subject": "EC2 Default EBS Encryption"})
 
-    process_sns_message_batches(sns_messages, params["SNS_TOPIC_ARN"])
+    publish_sns_messages(SNS_CLIENT, sns_messages, params["SNS_TOPIC_ARN"])
 
 
 def process_account(event: dict, aws_account_id: str, params: dict) -> None:
@@ -11,9 +11,10 @@ from __future__ import annotations
 
 import logging
 import os
+import random
 import re
 import time
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 import boto3
 import botocore
@@ -40,6 +41,13 @@ UNEXPECTED = "Unexpected!"
 BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "standard"})
 MAX_RETRIES = 12
 SLEEP_TIME = 5
+WAITER_INITIAL_DELAY_SECONDS = 5.0
+WAITER_MAX_DELAY_SECONDS = 60.0
+WAITER_BACKOFF_RATE = 2.0
+ADMIN_ACCOUNT_READY_DEADLINE_SECONDS = 600
+ADMIN_ACCOUNT_DISASSOCIATED_DEADLINE_SECONDS = 600
+LAMBDA_TIMEOUT_MARGIN_SECONDS = 60  # Time kept to report the result to CloudFormation before the Lambda timeout
+READINESS_METRICS: dict = {}  # readiness check name -> {"Ready": bool, "SecondsToReady": float, "Polls": int}
 
 
 def assume_role(role: str, role_session_name: str, account: str = None, session: boto3.Session = None) -> boto3.Session:
@@ -73,14 +81,104 @@ def assume_role(role: str, role_session_name: str, account: str = None, session:
     )
 
 
-def associate_admin_account(delegated_admin_account_id: str) -> None:  # noqa CCR001
+def wait_until_ready(
+    check_name: str,
+    is_ready: Callable[[], bool],
+    deadline_seconds: float,
+    initial_delay_seconds: float = WAITER_INITIAL_DELAY_SECONDS,
+    max_delay_seconds: float = WAITER_MAX_DELAY_SECONDS,
+) -> bool:
+    """Poll a readiness check with exponential backoff and jitter until it passes or the deadline is reached.
+
+    Args:
+        check_name: Readiness check name used for logging and metrics
+        is_ready: Readiness check returning True when ready
+        deadline_seconds: Maximum seconds to wait
+        initial_delay_seconds: Delay before the second check
+        max_delay_seconds: Maximum delay between checks
+
+    Returns:
+        True if ready before the deadline
+    """
+    start_time = time.monotonic()
+    deadline = start_time + deadline_seconds
+    delay = initial_delay_seconds
+    polls = 0
+    while True:
+        polls += 1
+        ready = is_ready()
+        remaining_seconds = deadline - time.monotonic()
+        if ready or remaining_seconds <= 0:
+            break
+        jittered_delay = delay / 2 + random.uniform(0, delay / 2)  # noqa: S311, DUO102
+        LOGGER.info(f"{check_name} not ready, checking again in {jittered_delay:.1f} seconds")
+        time.sleep(min(jittered_delay, remaining_seconds))
+        delay = min(max_delay_seconds, delay * WAITER_BACKOFF_RATE)
+
+    READINESS_METRICS[check_name] = {"Ready": ready, "SecondsToReady": round(time.monotonic() - start_time, 1), "Polls": polls}
+    LOGGER.info({"Readiness": check_name, **READINESS_METRICS[check_name]})
+    return ready
+
+
+def get_remaining_seconds(context: Context) -> float:
+    """Get the seconds left for waiting before the Lambda function times out.
+
+    Args:
+        context: runtime information
+
+    Returns:
+        Remaining seconds less the timeout margin
+    """
+    return max(0.0, context.get_remaining_time_in_millis() / 1000 - LAMBDA_TIMEOUT_MARGIN_SECONDS)
+
+
+def is_admin_account_ready(firewall_manager_client: FMSClient) -> bool:
+    """Check if the Firewall Manager admin account role status is READY.
+
+    Args:
+        firewall_manager_client: boto3 Firewall Manager client
+
+    Returns:
+        True or False
+    """
+    try:
+        admin_account_status = firewall_manager_client.get_admin_account()
+    except firewall_manager_client.exceptions.ResourceNotFoundException:
+        LOGGER.info("Admin account not found yet")
+        return False
+    LOGGER.info(f"Admin account status = {admin_account_status['RoleStatus']}")
+    return admin_account_status["RoleStatus"] == "READY"
+
+
+def is_admin_account_disassociated(firewall_manager_client: FMSClient) -> bool:
+    """Check if the Firewall Manager admin account has been disassociated.
+
+    Args:
+        firewall_manager_client: boto3 Firewall Manager client
+
+    Returns:
+        True or False
+    """
+    try:
+        admin_account_status = firewall_manager_client.get_admin_account()
+    except firewall_manager_client.exceptions.ResourceNotFoundException:
+        return True
+    LOGGER.info(f"Admin account {admin_account_status['AdminAccount']} status = {admin_account_status['RoleStatus']}")
+    return False
+
+
+def associate_admin_account(
+    delegated_admin_account_id: str, ready_deadline_seconds: float = ADMIN_ACCOUNT_READY_DEADLINE_SECONDS
+) -> None:  # noqa CCR001
     """Associate an administrator account for Firewall Manager.
 
     Args:
         delegated_admin_account_id: _description_
+        ready_deadline_seconds: Maximum seconds to wait for the admin account to reach READY status
 
     Raises:
         ValueError: Admin account already exists.
+        ValueError: Admin account did not reach READY status.
     """
     LOGGER.info(f"Admin account: {delegated_admin_account_id}")
     firewall_manager_client: FMSClient = boto3.client("fms", region_name="us-east-1", config=BOTO3_CONFIG)  # APIs only work in us-east-1 region
@@ -120,18 +218,9 @@ def associate_admin_account(delegated_admin_account_id: str) -> None:  # noqa CC
         else:
             LOGGER.error("Unexpected error. Unable to associate admin account due to error unrelated to an invalid operation.")
             raise ValueError("Unexpected error. Unable to associate admin account due to error unrelated to an invalid operation.") from None
-    LOGGER.info("...Waiting 5 minutes for admin account association.")
-    time.sleep(300)  # use 5 minute wait
-    while True:
-        LOGGER.info("Getting admin account status in Firewall Manager")
-        admin_account_status = firewall_manager_client.get_admin_account()
-        if admin_account_status["RoleStatus"] == "READY":
-            LOGGER.info("Admin account status = READY")
-            break
-        else:
-            LOGGER.info(f"Admin account status = {admin_account_status['RoleStatus']}")
-        LOGGER.info("...Waiting 20 seconds before next admin account status check.")
-        time.sleep(20)
+    if not wait_until_ready("Firewall Manager admin account READY", lambda: is_admin_account_ready(firewall_manager_client), ready_deadline_seconds):
+        LOGGER.error("Admin account did not reach READY status in the allowed time.")
+        raise ValueError("Admin account did not reach READY status in the allowed time.")
 
 
 def parameter_pattern_validator(parameter_name: str, parameter_value: Optional[str], pattern: str) -> None:
@@ -175,7 +264,7 @@ def get_validated_parameters(event: CloudFormationCustomResourceEvent) -> dict:
 @helper.create
 @helper.update
 @helper.delete
-def process_event(event: CloudFormationCustomResourceEvent, context: Context) -> str:  # noqa U100
+def process_event(event: CloudFormationCustomResourceEvent, context: Context) -> str:
     """Process Event from AWS CloudFormation.
 
     Args:
@@ -193,7 +282,7 @@ def process_event(event: CloudFormationCustomResourceEvent, context: Context) ->
     params = get_validated_parameters(event)
 
     if params["action"] == "Add":
-        associate_admin_account(params["DELEGATED_ADMIN_ACCOUNT_ID"])
+        associate_admin_account(params["DELEGATED_ADMIN_ACCOUNT_ID"], min(ADMIN_ACCOUNT_READY_DEADLINE_SECONDS, get_remaining_seconds(context)))
     elif params["action"] == "Update":
         management_fms_client: FMSClient = boto3.client("fms", region_name="us-east-1", config=BOTO3_CONFIG)  # APIs only work in us-east-1 region
         admin_account = management_fms_client.get_admin_account()
@@ -202,10 +291,14 @@ def process_event(event: CloudFormationCustomResourceEvent, context: Context) ->
             delegated_admin_session: boto3.Session = assume_role(params["ROLE_TO_ASSUME"], params["ROLE_SESSION_NAME"], admin_account["AdminAccount"])
             update_fms_client: FMSClient = delegated_admin_session.client("fms", region_name="us-east-1", config=BOTO3_CONFIG)
             update_fms_client.disassociate_admin_account()
-            LOGGER.info("...Waiting 10 minutes before associating new account.")
-            time.sleep(600)
-
-        associate_admin_account(params["DELEGATED_ADMIN_ACCOUNT_ID"])
+            if not wait_until_ready(
+                "Firewall Manager admin account disassociated",
+                lambda: is_admin_account_disassociated(management_fms_client),
+                min(ADMIN_ACCOUNT_DISASSOCIATED_DEADLINE_SECONDS, get_remaining_seconds(context) / 2),  # Keep time for the READY wait
+            ):
+                LOGGER.warning("Previous admin account was not disassociated in the allowed time. Attempting to associate the new admin account.")
+
+        associate_admin_account(params["DELEGATED_ADMIN_ACCOUNT_ID"], min(ADMIN_ACCOUNT_READY_DEADLINE_SECONDS, get_remaining_seconds(context)))
     elif params["action"] == "Remove":
         delegated_admin_session = assume_role(params["ROLE_TO_ASSUME"], params["ROLE_SESSION_NAME"], params["DELEGATED_ADMIN_ACCOUNT_ID"])
         remove_fms_client: FMSClient = delegated_admin_session.client(
@@ -1061,6 +1061,7 @@ def lambda_handler(event: dict, context: Any) -> dict:  # noqa: CCR001
         else:
             LOGGER.info(f"Lambda record not found in {STATE_TABLE} table so unable to update it.")
 
+    LOGGER.info({"STS client pool": sts.get_pool_stats()})
     return {
         "statusCode": 200,
         "lambda_start": LAMBDA_START,
@@ -9,7 +9,10 @@ SPDX-License-Identifier: MIT-0
 """
 import logging
 import os
-from typing import Any
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Tuple
 
 import boto3
 import botocore
@@ -27,6 +30,15 @@ class SRASTS:
     BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "standard"})
     PARTITION: str = ""
     HOME_REGION: str = ""
+    ASSUME_ROLE_DURATION_SECONDS: int = 900
+    SESSION_REFRESH_WINDOW_SECONDS: int = 300
+    CLIENT_POOL_MAX_SIZE: int = 512
+
+    # Process-wide caches, reused across warm invocations
+    POOL_LOCK = threading.Lock()
+    ASSUMED_ROLE_SESSIONS: dict = {}
+    CLIENT_POOL: OrderedDict = OrderedDict()
+    POOL_STATS: dict = {"hits": 0, "misses": 0, "evictions": 0}
 
     # Setup Default Logger
     LOGGER = logging.getLogger(__name__)
@@ -80,6 +92,101 @@ class SRASTS:
                 self.LOGGER.info(f"Error: {error}")
                 raise ValueError(f"Error: {error}") from None
 
+    def get_assumed_role_session(self, account: str, role_name: str) -> Tuple[boto3.Session, datetime]:
+        """Get a boto3 session for the role in the account, reusing cached credentials until shortly before they expire.
+
+        The session is shared by every service and region requested for the account.
+
+        Args:
+            account: aws account id
+            role_name: aws role name
+
+        Returns:
+            Tuple[boto3.Session, datetime]: session and credential expiration
+        """
+        cache_key = (account, role_name)
+        with self.POOL_LOCK:
+            cached_session = self.ASSUMED_ROLE_SESSIONS.get(cache_key)
+        if cached_session and not self._is_expiring(cached_session[1]):
+            return cached_session
+        sts_response = self.STS_CLIENT.assume_role(
+            RoleArn="arn:" + self.PARTITION + ":iam::" + account + ":role/" + role_name,
+            RoleSessionName="SRA-AssumeCrossAccountRole",
+            DurationSeconds=self.ASSUME_ROLE_DURATION_SECONDS,
+        )
+        assumed_session = boto3.Session(
+            aws_access_key_id=sts_response["Credentials"]["AccessKeyId"],
+            aws_secret_access_key=sts_response["Credentials"]["SecretAccessKey"],
+            aws_session_token=sts_response["Credentials"]["SessionToken"],
+        )
+        cached_session = (assumed_session, sts_response["Credentials"]["Expiration"])
+        with self.POOL_LOCK:
+            self.ASSUMED_ROLE_SESSIONS[cache_key] = cached_session
+        return cached_session
+
+    def _is_expiring(self, expiration: Optional[datetime]) -> bool:
+        """Check if credentials expire within the refresh window.
+
+        Args:
+            expiration: credential expiration, None for the management account session
+
+        Returns:
+            bool: True if the credentials should be refreshed
+        """
+        if expiration is None:
+            return False
+        return expiration - timedelta(seconds=self.SESSION_REFRESH_WINDOW_SECONDS) <= datetime.now(timezone.utc)
+
+    def _get_pooled(self, kind: str, account: str, role_name: str, service: str, region_name: str) -> Any:
+        """Get a pooled boto3 client or resource, creating it on a miss and evicting expired or least recently used entries.
+
+        Args:
+            kind: "client" or "resource"
+            account: aws account id
+            role_name: aws role name
+            service: aws service
+            region_name: aws region
+
+        Returns:
+            Any: boto3 client or resource
+        """
+        pool_key = (kind, account, role_name, service, region_name)
+        with self.POOL_LOCK:
+            pooled = self.CLIENT_POOL.get(pool_key)
+            if pooled and not self._is_expiring(pooled[1]):
+                self.CLIENT_POOL.move_to_end(pool_key)
+                self.POOL_STATS["hits"] += 1
+                return pooled[0]
+            self.POOL_STATS["misses"] += 1
+
+        self.LOGGER.info(f"ASSUME ROLE ACCOUNT ({kind.upper()}): {account}; ROLE NAME: {role_name}; SERVICE: {service}; REGION: {region_name}")
+        expiration: Optional[datetime] = None
+        if kind == "client" and account == self.MANAGEMENT_ACCOUNT:
+            pooled_object = self.MANAGEMENT_ACCOUNT_SESSION.client(service, region_name=region_name, config=self.BOTO3_CONFIG)  # type: ignore
+        else:
+            session, expiration = self.get_assumed_role_session(account, role_name)
+            if kind == "resource":
+                pooled_object = session.resource(service, region_name=region_name)  # type: ignore
+            else:
+                pooled_object = session.client(service, region_name=region_name)  # type: ignore
+
+        with self.POOL_LOCK:
+            self.CLIENT_POOL[pool_key] = (pooled_object, expiration)
+            self.CLIENT_POOL.move_to_end(pool_key)
+            while len(self.CLIENT_POOL) > self.CLIENT_POOL_MAX_SIZE:
+                self.CLIENT_POOL.popitem(last=False)
+                self.POOL_STATS["evictions"] += 1
+        return pooled_object
+
+    def get_pool_stats(self) -> dict:
+        """Get the client pool hit, miss, and eviction counters.
+
+        Returns:
+            dict: pool counters and current size
+        """
+        with self.POOL_LOCK:
+            return {**self.POOL_STATS, "size": len(self.CLIENT_POOL)}
+
     def assume_role(self, account: str, role_name: str, service: str, region_name: str) -> Any:
         """Get boto3 client assumed into an account for a specified service.
 
@@ -92,23 +199,7 @@ class SRASTS:
         Returns:
             Any: boto3 client
         """
-        self.LOGGER.info(f"ASSUME ROLE CALLER ID INFO: {self.MANAGEMENT_ACCOUNT_SESSION.client('sts').get_caller_identity()}")
-        self.LOGGER.info(f"ASSUME ROLE ACCOUNT (CLIENT): {account}; ROLE NAME: {role_name}; SERVICE: {service}; REGION: {region_name}")
-        client = self.MANAGEMENT_ACCOUNT_SESSION.client("sts")
-        if account != self.MANAGEMENT_ACCOUNT:
-            sts_response = client.assume_role(
-                RoleArn="arn:" + self.PARTITION + ":iam::" + account + ":role/" + role_name,
-                RoleSessionName="SRA-AssumeCrossAccountRole",
-                DurationSeconds=900,
-            )
-            return self.MANAGEMENT_ACCOUNT_SESSION.client(
-                service,  # type: ignore
-                region_name=region_name,
-                aws_access_key_id=sts_response["Credentials"]["AccessKeyId"],
-                aws_secret_access_key=sts_response["Credentials"]["SecretAccessKey"],
-                aws_session_token=sts_response["Credentials"]["SessionToken"],
-            )
-        return self.MANAGEMENT_ACCOUNT_SESSION.client(service, region_name=region_name, config=self.BOTO3_CONFIG)  # type: ignore
+        return self._get_pooled("client", account, role_name, service, region_name)
 
     def assume_role_resource(self, account: str, role_name: str, service: str, region_name: str) -> Any:
         """Get boto3 resource assumed into an account for a specified service.
@@ -122,21 +213,7 @@ class SRASTS:
         Returns:
             Any: boto3 client
         """
-        self.LOGGER.info(f"ASSUME ROLE CALLER ID INFO: {self.MANAGEMENT_ACCOUNT_SESSION.client('sts').get_caller_identity()}")
-        self.LOGGER.info(f"ASSUME ROLE ACCOUNT (RESOURCE): {account}; ROLE NAME: {role_name}; SERVICE: {service}; REGION: {region_name}")
-        client = self.MANAGEMENT_ACCOUNT_SESSION.client("sts")
-        sts_response = client.assume_role(
-            RoleArn="arn:" + self.PARTITION + ":iam::" + account + ":role/" + role_name,
-            RoleSessionName="SRA-AssumeCrossAccountRole",
-            DurationSeconds=900,
-        )
-        return self.MANAGEMENT_ACCOUNT_SESSION.resource(
-            service,  # type: ignore
-            region_name=region_name,
-            aws_access_key_id=sts_response["Credentials"]["AccessKeyId"],
-            aws_secret_access_key=sts_response["Credentials"]["SecretAccessKey"],
-            aws_session_token=sts_response["Credentials"]["SessionToken"],
-        )
+        return self._get_pooled("resource", account, role_name, service, region_name)
 
     def get_lambda_execution_role(self) -> str:
         """Get the current lambda execution role arn.
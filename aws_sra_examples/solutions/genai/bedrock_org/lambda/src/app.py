@@ -1903,18 +1903,10 @@ def create_sns_messages(
     global CFN_RESPONSE_DATA
 
     LOGGER.info("Creating SNS Messages...")
-    sns_messages = []
     LOGGER.info("ResourceProperties found in event")
-
-    for region in regions:
-        sns_message = {"Accounts": accounts, "Region": region, "ResourceProperties": resource_properties, "Action": action}
-        sns_messages.append(
-            {
-                "Id": region,
-                "Message": json.dumps(sns_message),
-                "Subject": "SRA Bedrock Configuration",
-            }
-        )
+    sns_messages = sns.build_regional_sns_messages(
+        accounts, regions, {"ResourceProperties": resource_properties, "Action": action}, "SRA Bedrock Configuration"
+    )
     sns.process_sns_message_batches(sns_messages, sns_topic_arn)
     if DRY_RUN is False:
         LIVE_RUN_DATA["SNSFanout"] = "Published SNS messages for regional fanout configuration"
@@ -1931,14 +1923,15 @@ def process_sns_records(event: dict) -> None:
     """
     LOGGER.info("Processing SNS records...")
     for record in event["Records"]:
-        record["Sns"]["Message"] = json.loads(record["Sns"]["Message"])
+        record["Sns"]["Message"] = sns.decode_sns_message(record["Sns"]["Message"])
         LOGGER.info({"SNS Record": record})
         message = record["Sns"]["Message"]
         if message["Action"] == "configure":
             LOGGER.info("Continuing process to enable SRA security controls for Bedrock (sns event)")
 
-            # 3) Deploy config rules (regional)
-            message["Accounts"].append(sts.MANAGEMENT_ACCOUNT)
+            # 3) Deploy config rules (regional); the management account is handled with the first account chunk of each region
+            if message.get("Chunk", 0) == 0:
+                message["Accounts"].append(sts.MANAGEMENT_ACCOUNT)
             deploy_config_rules(
                 message["Region"],
                 message["Accounts"],
@@ -2388,6 +2381,7 @@ def lambda_handler(event: dict, context: Any) -> dict:  # noqa: CCR001
         else:
             LOGGER.info(f"Lambda record not found in {STATE_TABLE} table so unable to update it.")
 
+    LOGGER.info({"STS client pool": sts.get_pool_stats()})
     return {
         "statusCode": 200,
         "lambda_start": LAMBDA_START,
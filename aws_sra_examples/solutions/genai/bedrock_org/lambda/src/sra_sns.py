@@ -9,10 +9,14 @@ SPDX-License-Identifier: MIT-0
 """
 from __future__ import annotations
 
+import base64
+import gzip
 import json
 import logging
 import os
-from time import sleep
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from time import monotonic, sleep
 from typing import TYPE_CHECKING
 
 import boto3
@@ -36,7 +40,16 @@ class SRASNS:
     BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "standard"})
     UNEXPECTED = "Unexpected!"
 
-    SNS_PUBLISH_BATCH_MAX = 10
+    SNS_PUBLISH_BATCH_MAX = 10  # Max entries in a PublishBatch request
+    SNS_PUBLISH_BATCH_BYTES_MAX = 262144  # Max aggregate payload of a PublishBatch request
+    SNS_PUBLISH_MAX_WORKERS = 10  # PublishBatch requests sent at the same time
+    SNS_PUBLISH_MAX_ATTEMPTS = 4  # Failed entries are retried with exponential backoff
+    SNS_PUBLISH_RETRY_INITIAL_DELAY_SECONDS = 0.5
+    SNS_MESSAGE_BYTES_MAX = 262144  # SNS limit for a message and for a whole PublishBatch request
+    SNS_MESSAGE_ACCOUNTS_BYTES_BUDGET = 32768  # Serialized account list bytes per regional message
+    SNS_MESSAGE_ACCOUNTS_MAX = 20  # Accounts per regional message, bounding the duration of each fan-out invocation
+    SNS_MESSAGE_COMPRESSION_THRESHOLD = 65536  # Message bodies larger than this are sent gzip compressed
+    SNS_MESSAGE_COMPRESSED_ENCODING = "gzip+base64"
 
     try:
         MANAGEMENT_ACCOUNT_SESSION = boto3.Session()
@@ -198,34 +211,185 @@ class SRASNS:
         except ClientError as e:
             raise ValueError(f"Error setting SNS topic policy: {e}") from None
 
-    def publish_sns_message_batch(self, message_batch: list, sns_topic_arn: str) -> None:
-        """Publish SNS Message Batches.
+    def chunk_accounts(self, accounts: list) -> list:
+        """Split the accounts into chunks whose serialized size fits the byte budget.
+
+        Args:
+            accounts: Account List
+
+        Returns:
+            list: Account chunks, with at least one (possibly empty) chunk
+        """
+        chunks: list = [[]]
+        chunk_bytes = 0
+        for account in accounts:
+            account_bytes = len(json.dumps(account).encode()) + 2  # Separator between list items
+            if chunks[-1] and (
+                chunk_bytes + account_bytes > self.SNS_MESSAGE_ACCOUNTS_BYTES_BUDGET or len(chunks[-1]) >= self.SNS_MESSAGE_ACCOUNTS_MAX
+            ):
+                chunks.append([])
+                chunk_bytes = 0
+            chunks[-1].append(account)
+            chunk_bytes += account_bytes
+        return chunks
+
+    def encode_sns_message(self, message: dict) -> str:
+        """Serialize an SNS message, compressing it when it is larger than the compression threshold.
+
+        Args:
+            message: SNS message
+
+        Raises:
+            ValueError: The encoded message is larger than the SNS message limit
+
+        Returns:
+            str: SNS message body
+        """
+        body = json.dumps(message)
+        if len(body.encode()) > self.SNS_MESSAGE_COMPRESSION_THRESHOLD:
+            payload = base64.b64encode(gzip.compress(body.encode())).decode()
+            body = json.dumps({"Encoding": self.SNS_MESSAGE_COMPRESSED_ENCODING, "Payload": payload})
+        if len(body.encode()) > self.SNS_MESSAGE_BYTES_MAX:
+            raise ValueError(
+                f"SNS message for {message.get('Region')} is {len(body.encode())} bytes, larger than the {self.SNS_MESSAGE_BYTES_MAX} byte limit"
+            )
+        return body
+
+    def decode_sns_message(self, body: str) -> dict:
+        """Deserialize an SNS message built by encode_sns_message.
+
+        Args:
+            body: SNS message body
+
+        Returns:
+            dict: SNS message
+        """
+        message = json.loads(body)
+        if message.get("Encoding") == self.SNS_MESSAGE_COMPRESSED_ENCODING:
+            message = json.loads(gzip.decompress(base64.b64decode(message["Payload"])))
+        return message
+
+    def build_regional_sns_messages(self, accounts: list, regions: list, message_fields: dict, subject: str) -> list:
+        """Build one SNS message for each region and account chunk.
+
+        Args:
+            accounts: Account List
+            regions: list of AWS regions
+            message_fields: Fields added to every message
+            subject: SNS message subject
+
+        Returns:
+            list: PublishBatch request entries
+        """
+        sns_messages = []
+        account_chunks = self.chunk_accounts(accounts)
+        for region in regions:
+            for chunk_index, account_chunk in enumerate(account_chunks):
+                sns_message = {
+                    "Accounts": account_chunk,
+                    "Region": region,
+                    **message_fields,
+                    "Chunk": chunk_index,
+                    "Chunks": len(account_chunks),
+                }
+                sns_messages.append({"Id": f"{region}-{chunk_index}", "Message": self.encode_sns_message(sns_message), "Subject": subject})
+        self.LOGGER.info({"SNS_Messages": len(sns_messages), "Account_Chunks": len(account_chunks), "Regions": len(regions)})
+        return sns_messages
+
+    def build_sns_message_batches(self, sns_messages: list) -> list:
+        """Group SNS messages into batches within the PublishBatch entry count and aggregate payload limits.
+
+        Args:
+            sns_messages: SNS publish batch request entries
+
+        Returns:
+            list: Batches of SNS publish batch request entries
+        """
+        message_batches: list = []
+        batch_bytes = 0
+        for sns_message in sns_messages:
+            message_bytes = len(sns_message["Message"].encode()) + len(sns_message.get("Subject", "").encode())
+            if (
+                not message_batches
+                or len(message_batches[-1]) >= self.SNS_PUBLISH_BATCH_MAX
+                or batch_bytes + message_bytes > self.SNS_PUBLISH_BATCH_BYTES_MAX
+            ):
+                message_batches.append([])
+                batch_bytes = 0
+            message_batches[-1].append(sns_message)
+            batch_bytes += message_bytes
+        return message_batches
+
+    def publish_sns_message_batch(self, message_batch: list, sns_topic_arn: str) -> list:
+        """Publish a batch of SNS messages.
 
         Args:
             message_batch: Batch of SNS messages
             sns_topic_arn: SNS Topic ARN
+
+        Returns:
+            list: Entries that failed to publish
         """
-        self.LOGGER.info("Publishing SNS Message Batch...")
-        self.LOGGER.info({"SNSMessageBatch": message_batch})
-        response: PublishBatchResponseTypeDef = self.SNS_CLIENT.publish_batch(TopicArn=sns_topic_arn, PublishBatchRequestEntries=message_batch)
+        try:
+            response: PublishBatchResponseTypeDef = self.SNS_CLIENT.publish_batch(TopicArn=sns_topic_arn, PublishBatchRequestEntries=message_batch)
+        except ClientError as error:
+            self.LOGGER.warning(f"PublishBatch failed for {len(message_batch)} SNS messages: {error}")
+            return [
+                {"Id": sns_message["Id"], "Code": error.response["Error"]["Code"], "Message": str(error), "SenderFault": False}
+                for sns_message in message_batch
+            ]
         api_call_details = {"API_Call": "sns:PublishBatch", "API_Response": response}
         self.LOGGER.info(api_call_details)
+        return response["Failed"]
 
-    def process_sns_message_batches(self, sns_messages: list, sns_topic_arn: str) -> None:
-        """Process SNS Message Batches for Publishing.
+    def process_sns_message_batches(self, sns_messages: list, sns_topic_arn: str, max_workers: int = SNS_PUBLISH_MAX_WORKERS) -> None:
+        """Publish SNS messages in concurrent batches, retrying only the entries that failed with a service fault.
 
         Args:
-            sns_messages: SNS messages to be batched.
+            sns_messages: SNS publish batch request entries
             sns_topic_arn: SNS Topic ARN
+            max_workers: Maximum number of PublishBatch requests sent at the same time.
+
+        Raises:
+            ValueError: SNS messages failed to publish
         """
-        self.LOGGER.info("Processing SNS Message Batches...")
-        message_batches = []
-        for i in range(
-            self.SNS_PUBLISH_BATCH_MAX,
-            len(sns_messages) + self.SNS_PUBLISH_BATCH_MAX,
-            self.SNS_PUBLISH_BATCH_MAX,
-        ):
-            message_batches.append(sns_messages[i - self.SNS_PUBLISH_BATCH_MAX : i])
-
-        for batch in message_batches:
-            self.publish_sns_message_batch(batch, sns_topic_arn)
+        start_time = monotonic()
+        pending_messages = list(sns_messages)
+        sender_faults: list = []
+        service_faults: list = []
+        attempt = 0
+        delay = self.SNS_PUBLISH_RETRY_INITIAL_DELAY_SECONDS
+        while pending_messages and attempt < self.SNS_PUBLISH_MAX_ATTEMPTS:
+            if attempt:
+                self.LOGGER.info({"Retrying SNS messages": len(pending_messages), "Attempt": attempt + 1})
+                sleep(delay / 2 + random.uniform(0, delay / 2))  # noqa: S311, DUO102
+                delay *= 2
+            attempt += 1
+            message_batches = self.build_sns_message_batches(pending_messages)
+            pending_messages = []
+            service_faults = []
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(message_batches))) as executor:
+                futures = {executor.submit(self.publish_sns_message_batch, batch, sns_topic_arn): batch for batch in message_batches}
+                for future in as_completed(futures):
+                    messages_by_id = {sns_message["Id"]: sns_message for sns_message in futures[future]}
+                    for failed_entry in future.result():
+                        if failed_entry["SenderFault"]:
+                            sender_faults.append(failed_entry)
+                        else:
+                            service_faults.append(failed_entry)
+                            pending_messages.append(messages_by_id[failed_entry["Id"]])
+
+        failed_entries = sender_faults + service_faults
+        self.LOGGER.info(
+            {
+                "SNS_Publish": {
+                    "Messages": len(sns_messages),
+                    "Attempts": attempt,
+                    "Failed": len(failed_entries),
+                    "Seconds": round(monotonic() - start_time, 3),
+                }
+            }
+        )
+        if failed_entries:
+            self.LOGGER.error({"Failed SNS messages": failed_entries})
+            raise ValueError(f"{len(failed_entries)} of {len(sns_messages)} SNS messages failed to publish")
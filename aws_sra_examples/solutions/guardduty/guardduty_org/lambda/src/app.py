@@ -19,7 +19,6 @@ import json
 import logging
 import os
 import re
-from time import sleep
 from typing import TYPE_CHECKING, Any, Dict
 
 import boto3
@@ -45,8 +44,7 @@ helper = CfnResource(json_logging=True, log_level=log_level, boto_level="CRITICA
 PRINCIPAL_NAME = "malware-protection.guardduty.amazonaws.com"
 SERVICE_NAME = "guardduty.amazonaws.com"
 UNEXPECTED = "Unexpected!"
-MAX_RUN_COUNT = 60  # 5 minute wait = 30 x 10 seconds
-SLEEP_SECONDS = 10
+DETECTORS_READY_DEADLINE_SECONDS = 660  # Wait up to 11 minutes for the delegated admin detectors
 BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "standard"})
 
 try:
@@ -196,17 +194,10 @@ def process_create_update_event(params: dict, regions: list) -> None:
             "A service-linked role required for Amazon GuardDuty to access your resources.",
         )
         guardduty.process_organization_admin_account(params.get("DELEGATED_ADMIN_ACCOUNT_ID", ""), regions)
-        sleep(60)
         session = common.assume_role(params.get("CONFIGURATION_ROLE_NAME", ""), "CreateGuardDuty", params.get("DELEGATED_ADMIN_ACCOUNT_ID", ""))
-        detectors_exist = False
-        run_count = 0
-
-        while not detectors_exist and run_count < MAX_RUN_COUNT:
-            run_count += 1
-            detectors_exist = guardduty.check_for_detectors(session, regions)
-            LOGGER.info(f"All Detectors Exist?: {detectors_exist}. Count: {run_count}")
-            if not detectors_exist:
-                sleep(SLEEP_SECONDS)
+        detectors_exist = common.wait_until_ready(
+            "GuardDuty delegated admin detectors", lambda: guardduty.check_for_detectors(session, regions), DETECTORS_READY_DEADLINE_SECONDS
+        )
 
         if not detectors_exist:
             raise ValueError("GuardDuty Detectors did not get created in the allowed time. Check the Org Management delegated admin setup.")
@@ -254,7 +245,9 @@ def process_sns_records(records: list) -> None:
         sns_info = record["Sns"]
         LOGGER.info(f"SNS INFO: {sns_info}")
         message = json.loads(sns_info["Message"])
-        guardduty.cleanup_member_account(message["AccountId"], message["DeleteDetectorRoleName"], message["Regions"])
+        guardduty.cleanup_member_accounts(
+            message.get("AccountIds", [message.get("AccountId")]), message["DeleteDetectorRoleName"], message["Regions"]
+        )
 
 
 @helper.create
@@ -11,8 +11,12 @@ from __future__ import annotations
 
 import logging
 import os
-from time import sleep
-from typing import TYPE_CHECKING
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Callable
 
 import boto3
 from botocore.config import Config
@@ -21,6 +25,8 @@ from botocore.exceptions import ClientError
 if TYPE_CHECKING:
     from mypy_boto3_iam.client import IAMClient
     from mypy_boto3_organizations import OrganizationsClient
+    from mypy_boto3_sns import SNSClient
+    from mypy_boto3_sns.type_defs import PublishBatchResponseTypeDef
     from mypy_boto3_ssm.client import SSMClient
     from mypy_boto3_sts.client import STSClient
 
@@ -31,16 +37,71 @@ LOGGER.setLevel(log_level)
 
 # Global variables
 ORG_PAGE_SIZE = 20  # Max page size for list_accounts
-ORG_THROTTLE_PERIOD = 0.2
 BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "standard"})
+SESSION_REFRESH_WINDOW = timedelta(minutes=5)  # Refresh cached assumed role credentials this long before they expire
+SESSION_CACHE_LOCK = threading.Lock()
+ASSUMED_ROLE_CREDENTIALS: dict = {}  # (account, role, partition, session name) -> STS credentials, reused across warm invocations
+CALLER_ARNS: dict = {}  # access key -> {"Arn": caller identity ARN, "Time": when it was cached}
+CALLER_ARN_TTL_SECONDS = 3600  # Evict caller identities of credentials that are no longer in use
+REGION_PROBE_MAX_WORKERS = 16
+ENABLED_REGIONS_CACHE_TTL_SECONDS = 900  # Reuse probed regions across warm invocations
+ENABLED_REGIONS_CACHE_LOCK = threading.Lock()
+ENABLED_REGIONS_CACHE: dict = {}  # (customer regions, control tower regions only) -> (probe time, enabled regions)
+ORG_BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "adaptive"})  # Client-side rate limiting instead of fixed page sleeps
+ORG_ACCOUNTS_CACHE_TTL_SECONDS = 300  # Reuse the account inventory across warm invocations
+ORG_ACCOUNTS_CACHE_LOCK = threading.Lock()
+ORG_ACCOUNTS_CACHE: dict = {}  # {"Accounts": {account ID: account}, "Time": list time}
+WAITER_INITIAL_DELAY_SECONDS = 2.0
+WAITER_MAX_DELAY_SECONDS = 30.0
+WAITER_BACKOFF_RATE = 2.0
+SNS_PUBLISH_BATCH_MAX = 10  # Max entries in a PublishBatch request
+SNS_PUBLISH_BATCH_BYTES_MAX = 262144  # Max aggregate payload of a PublishBatch request
+SNS_PUBLISH_MAX_WORKERS = 10  # PublishBatch requests sent at the same time
+SNS_PUBLISH_MAX_ATTEMPTS = 4  # Failed entries are retried with exponential backoff
+SNS_PUBLISH_RETRY_INITIAL_DELAY_SECONDS = 0.5
+READINESS_METRICS: dict = {}  # readiness check name -> {"Ready": bool, "SecondsToReady": float, "Polls": int}
 try:
     MANAGEMENT_ACCOUNT_SESSION = boto3.Session()
+    ORG_CLIENT: OrganizationsClient = MANAGEMENT_ACCOUNT_SESSION.client("organizations", config=ORG_BOTO3_CONFIG)
     SSM_CLIENT: SSMClient = MANAGEMENT_ACCOUNT_SESSION.client("ssm")
 except Exception as error:
     LOGGER.error({"Unexpected_Error": error})
     raise ValueError("Unexpected error executing Lambda function. Review CloudWatch logs for details.") from None
 
 
+def evict_expired_sessions() -> None:
+    """Remove expired assumed role credentials and stale caller identities so the warm invocation caches stay bounded."""
+    now = datetime.now(timezone.utc)
+    with SESSION_CACHE_LOCK:
+        for cache_key in [key for key, credentials in ASSUMED_ROLE_CREDENTIALS.items() if credentials["Expiration"] <= now]:
+            CALLER_ARNS.pop(ASSUMED_ROLE_CREDENTIALS.pop(cache_key)["AccessKeyId"], None)
+        for access_key in [key for key, caller in CALLER_ARNS.items() if monotonic() - caller["Time"] >= CALLER_ARN_TTL_SECONDS]:
+            del CALLER_ARNS[access_key]
+
+
+def get_caller_arn(session: boto3.Session) -> str:
+    """Get the caller identity ARN for the session, calling STS once per set of credentials.
+
+    Args:
+        session: Boto3 session
+
+    Returns:
+        Caller identity ARN
+    """
+    access_key = session.get_credentials().access_key
+    evict_expired_sessions()
+    with SESSION_CACHE_LOCK:
+        caller = CALLER_ARNS.get(access_key)
+    if caller:
+        return caller["Arn"]
+    sts_client: STSClient = session.client("sts", config=BOTO3_CONFIG)
+    sts_arn = sts_client.get_caller_identity()["Arn"]
+    LOGGER.info(f"USER: {sts_arn}")
+    with SESSION_CACHE_LOCK:
+        CALLER_ARNS[access_key] = {"Arn": sts_arn, "Time": monotonic()}
+    return sts_arn
+
+
 def assume_role(role: str, role_session_name: str, account: str = None, session: boto3.Session = None) -> boto3.Session:
     """Assumes the provided role in the given account and returns a session.
 
@@ -58,23 +119,64 @@ def assume_role(role: str, role_session_name: str, account: str = None, session:
 
     if not session:
         session = boto3.Session()
-    sts_client: STSClient = session.client("sts", config=BOTO3_CONFIG)
-    sts_arn = sts_client.get_caller_identity()["Arn"]
-    LOGGER.info(f"USER: {sts_arn}")
+    sts_arn = get_caller_arn(session)
     if not account:
         account = sts_arn.split(":")[4]
     partition = sts_arn.split(":")[1]
-    role_arn = f"arn:{partition}:iam::{account}:role/{role}"
+    cache_key = (account, role, partition, role_session_name)
+
+    with SESSION_CACHE_LOCK:
+        cached_credentials = ASSUMED_ROLE_CREDENTIALS.get(cache_key)
+    if not cached_credentials or cached_credentials["Expiration"] - SESSION_REFRESH_WINDOW <= datetime.now(timezone.utc):
+        role_arn = f"arn:{partition}:iam::{account}:role/{role}"
+        sts_client: STSClient = session.client("sts", config=BOTO3_CONFIG)
+        response = sts_client.assume_role(RoleArn=role_arn, RoleSessionName=role_session_name)
+        LOGGER.info(f"ASSUMED ROLE: {response['AssumedRoleUser']['Arn']}")
+        cached_credentials = response["Credentials"]
+        with SESSION_CACHE_LOCK:
+            ASSUMED_ROLE_CREDENTIALS[cache_key] = cached_credentials
 
-    response = sts_client.assume_role(RoleArn=role_arn, RoleSessionName=role_session_name)
-    LOGGER.info(f"ASSUMED ROLE: {response['AssumedRoleUser']['Arn']}")
     return boto3.Session(
-        aws_access_key_id=response["Credentials"]["AccessKeyId"],
-        aws_secret_access_key=response["Credentials"]["SecretAccessKey"],
-        aws_session_token=response["Credentials"]["SessionToken"],
+        aws_access_key_id=cached_credentials["AccessKeyId"],
+        aws_secret_access_key=cached_credentials["SecretAccessKey"],
+        aws_session_token=cached_credentials["SessionToken"],
     )
 
 
+def get_organization_account_inventory() -> dict:
+    """Get the AWS Organization account inventory, listing accounts only when the cached inventory is missing or stale.
+
+    Returns:
+        Accounts keyed by account ID
+    """
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        if ORG_ACCOUNTS_CACHE and monotonic() - ORG_ACCOUNTS_CACHE["Time"] < ORG_ACCOUNTS_CACHE_TTL_SECONDS:
+            return ORG_ACCOUNTS_CACHE["Accounts"]
+
+    accounts: dict = {}
+    paginator = ORG_CLIENT.get_paginator("list_accounts")
+    for page in paginator.paginate(PaginationConfig={"PageSize": ORG_PAGE_SIZE}):
+        for account in page["Accounts"]:
+            accounts[account["Id"]] = account
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        ORG_ACCOUNTS_CACHE.update({"Accounts": accounts, "Time": monotonic()})
+    return accounts
+
+
+def update_organization_account_inventory(account_id: str) -> None:
+    """Refresh a single account in the cached inventory after a CreateAccountResult or AcceptHandshake event.
+
+    Args:
+        account_id: AWS account ID
+    """
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        if not ORG_ACCOUNTS_CACHE:
+            return
+    account = ORG_CLIENT.describe_account(AccountId=account_id)["Account"]
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        ORG_ACCOUNTS_CACHE["Accounts"] = {**ORG_ACCOUNTS_CACHE["Accounts"], account_id: account}
+
+
 def get_all_organization_accounts(exclude_accounts: list = None) -> list:
     """Get all the active AWS Organization accounts.
 
@@ -86,18 +188,10 @@ def get_all_organization_accounts(exclude_accounts: list = None) -> list:
     """
     if exclude_accounts is None:
         exclude_accounts = ["00000000000"]
-    accounts = []
-    management_account_session = boto3.Session()
-    org_client: OrganizationsClient = management_account_session.client("organizations", config=BOTO3_CONFIG)
-    paginator = org_client.get_paginator("list_accounts")
-
-    for page in paginator.paginate(PaginationConfig={"PageSize": ORG_PAGE_SIZE}):
-        for acct in page["Accounts"]:
-            if acct["Status"] == "ACTIVE" and acct["Id"] not in exclude_accounts:  # Store active accounts in a dict
-                account_record = {"AccountId": acct["Id"], "Email": acct["Email"]}
-                accounts.append(account_record)
-        sleep(ORG_THROTTLE_PERIOD)
-
+    accounts: list[dict] = []
+    for account in get_organization_account_inventory().values():
+        if account["Status"] == "ACTIVE" and account["Id"] not in exclude_accounts:
+            accounts.append({"AccountId": account["Id"], "Email": account["Email"]})
     return accounts
 
 
@@ -132,6 +226,32 @@ def get_control_tower_regions() -> list:  # noqa: CCR001
     return list(customer_regions)
 
 
+def probe_region(sts_client: STSClient, region: str) -> str:
+    """Test whether a region is enabled by calling STS in the region.
+
+    Args:
+        sts_client: Regional STS client
+        region: AWS region
+
+    Returns:
+        Region status: enabled, disabled, invalid, or error
+    """
+    try:
+        sts_client.get_caller_identity()
+        return "enabled"
+    except ClientError as error:
+        LOGGER.error(f"Error {error.response['Error']} occurred testing region {region}")
+        if error.response["Error"]["Code"] == "InvalidClientTokenId":
+            return "disabled"
+    except Exception as error:
+        if "Could not connect to the endpoint URL" in str(error):
+            LOGGER.error(f"Region: '{region}' is not valid")
+            LOGGER.error(f"{error}")
+            return "invalid"
+        LOGGER.error(f"{error}")
+    return "error"
+
+
 def get_enabled_regions(customer_regions: str, control_tower_regions_only: bool = False) -> list:  # noqa: CCR001
     """Query STS to identify enabled regions.
 
@@ -142,6 +262,13 @@ def get_enabled_regions(customer_regions: str, control_tower_regions_only: bool
     Returns:
         Enabled regions
     """
+    cache_key = (customer_regions.strip(), control_tower_regions_only)
+    with ENABLED_REGIONS_CACHE_LOCK:
+        cached_regions = ENABLED_REGIONS_CACHE.get(cache_key)
+    if cached_regions and monotonic() - cached_regions[0] < ENABLED_REGIONS_CACHE_TTL_SECONDS:
+        LOGGER.info({"Cached_Enabled_Regions": cached_regions[1]})
+        return list(cached_regions[1])
+
     if customer_regions.strip():
         LOGGER.debug(f"CUSTOMER PROVIDED REGIONS: {str(customer_regions)}")
         region_list = [value.strip() for value in customer_regions.split(",") if value != ""]
@@ -154,27 +281,26 @@ def get_enabled_regions(customer_regions: str, control_tower_regions_only: bool
         LOGGER.info({"Default_Available_Regions": default_available_regions})
         region_list = default_available_regions
 
-    enabled_regions = []
-    disabled_regions = []
-    invalid_regions = []
     region_session = boto3.Session()
-    for region in region_list:
-        try:
-            sts_client = region_session.client("sts", endpoint_url=f"https://sts.{region}.amazonaws.com", region_name=region, config=BOTO3_CONFIG)
-            sts_client.get_caller_identity()
-            enabled_regions.append(region)
-        except ClientError as error:
-            if error.response["Error"]["Code"] == "InvalidClientTokenId":
-                disabled_regions.append(region)
-            LOGGER.error(f"Error {error.response['Error']} occurred testing region {region}")
-        except Exception as error:
-            if "Could not connect to the endpoint URL" in str(error):
-                invalid_regions.append(region)
-                LOGGER.error(f"Region: '{region}' is not valid")
-            LOGGER.error(f"{error}")
+    sts_clients = [
+        region_session.client("sts", endpoint_url=f"https://sts.{region}.amazonaws.com", region_name=region, config=BOTO3_CONFIG)
+        for region in region_list
+    ]
+    with ThreadPoolExecutor(max_workers=REGION_PROBE_MAX_WORKERS) as executor:
+        region_statuses = dict(zip(region_list, executor.map(probe_region, sts_clients, region_list)))
+    enabled_regions = [region for region, status in region_statuses.items() if status == "enabled"]
+    disabled_regions = [region for region, status in region_statuses.items() if status == "disabled"]
+    invalid_regions = [region for region, status in region_statuses.items() if status == "invalid"]
+    error_regions = [region for region, status in region_statuses.items() if status == "error"]
     LOGGER.info({"Disabled_Regions": disabled_regions})
     LOGGER.info({"Invalid_Regions": invalid_regions})
-    return enabled_regions
+    LOGGER.info({"Error_Regions": error_regions})
+    if error_regions:
+        LOGGER.warning(f"Not caching enabled regions because probing failed in: {', '.join(error_regions)}")
+    else:
+        with ENABLED_REGIONS_CACHE_LOCK:
+            ENABLED_REGIONS_CACHE[cache_key] = (monotonic(), enabled_regions)
+    return list(enabled_regions)
 
 
 def create_service_linked_role(service_linked_role_name: str, service_name: str, description: str = "") -> None:
@@ -190,3 +316,141 @@ def create_service_linked_role(service_linked_role_name: str, service_name: str,
         iam_client.get_role(RoleName=service_linked_role_name)
     except iam_client.exceptions.NoSuchEntityException:
         iam_client.create_service_linked_role(AWSServiceName=service_name, Description=description)
+
+
+def wait_until_ready(
+    check_name: str,
+    is_ready: Callable[[], bool],
+    deadline_seconds: float,
+    initial_delay_seconds: float = WAITER_INITIAL_DELAY_SECONDS,
+    max_delay_seconds: float = WAITER_MAX_DELAY_SECONDS,
+) -> bool:
+    """Poll a readiness check with exponential backoff and jitter until it passes or the deadline is reached.
+
+    Args:
+        check_name: Readiness check name used for logging and metrics
+        is_ready: Readiness check returning True when ready
+        deadline_seconds: Maximum seconds to wait
+        initial_delay_seconds: Delay before the second check
+        max_delay_seconds: Maximum delay between checks
+
+    Returns:
+        True if ready before the deadline
+    """
+    start_time = monotonic()
+    deadline = start_time + deadline_seconds
+    delay = initial_delay_seconds
+    polls = 0
+    while True:
+        polls += 1
+        ready = is_ready()
+        remaining_seconds = deadline - monotonic()
+        if ready or remaining_seconds <= 0:
+            break
+        jittered_delay = delay / 2 + random.uniform(0, delay / 2)  # noqa: S311, DUO102
+        LOGGER.info(f"{check_name} not ready, checking again in {jittered_delay:.1f} seconds")
+        sleep(min(jittered_delay, remaining_seconds))
+        delay = min(max_delay_seconds, delay * WAITER_BACKOFF_RATE)
+
+    READINESS_METRICS[check_name] = {"Ready": ready, "SecondsToReady": round(monotonic() - start_time, 1), "Polls": polls}
+    LOGGER.info({"Readiness": check_name, **READINESS_METRICS[check_name]})
+    return ready
+
+
+def build_sns_message_batches(sns_messages: list) -> list:
+    """Group SNS messages into batches within the PublishBatch entry count and aggregate payload limits.
+
+    Args:
+        sns_messages: SNS publish batch request entries
+
+    Returns:
+        list: Batches of SNS publish batch request entries
+    """
+    message_batches: list = []
+    batch_bytes = 0
+    for sns_message in sns_messages:
+        message_bytes = len(sns_message["Message"].encode()) + len(sns_message.get("Subject", "").encode())
+        if not message_batches or len(message_batches[-1]) >= SNS_PUBLISH_BATCH_MAX or batch_bytes + message_bytes > SNS_PUBLISH_BATCH_BYTES_MAX:
+            message_batches.append([])
+            batch_bytes = 0
+        message_batches[-1].append(sns_message)
+        batch_bytes += message_bytes
+    return message_batches
+
+
+def publish_sns_message_batch(sns_client: SNSClient, message_batch: list, sns_topic_arn: str) -> list:
+    """Publish a batch of SNS messages.
+
+    Args:
+        sns_client: Boto3 SNS client
+        message_batch: Batch of SNS messages
+        sns_topic_arn: SNS Topic ARN
+
+    Returns:
+        list: Entries that failed to publish
+    """
+    try:
+        response: PublishBatchResponseTypeDef = sns_client.publish_batch(TopicArn=sns_topic_arn, PublishBatchRequestEntries=message_batch)
+    except ClientError as error:
+        LOGGER.warning(f"PublishBatch failed for {len(message_batch)} SNS messages: {error}")
+        return [
+            {"Id": sns_message["Id"], "Code": error.response["Error"]["Code"], "Message": str(error), "SenderFault": False}
+            for sns_message in message_batch
+        ]
+    api_call_details = {"API_Call": "sns:PublishBatch", "API_Response": response}
+    LOGGER.info(api_call_details)
+    return response["Failed"]
+
+
+def publish_sns_messages(sns_client: SNSClient, sns_messages: list, sns_topic_arn: str, max_workers: int = SNS_PUBLISH_MAX_WORKERS) -> None:
+    """Publish SNS messages in concurrent batches, retrying only the entries that failed with a service fault.
+
+    Args:
+        sns_client: Boto3 SNS client
+        sns_messages: SNS publish batch request entries
+        sns_topic_arn: SNS Topic ARN
+        max_workers: Maximum number of PublishBatch requests sent at the same time
+
+    Raises:
+        ValueError: SNS messages failed to publish
+    """
+    start_time = monotonic()
+    pending_messages = list(sns_messages)
+    sender_faults: list = []
+    service_faults: list = []
+    attempt = 0
+    delay = SNS_PUBLISH_RETRY_INITIAL_DELAY_SECONDS
+    while pending_messages and attempt < SNS_PUBLISH_MAX_ATTEMPTS:
+        if attempt:
+            LOGGER.info({"Retrying SNS messages": len(pending_messages), "Attempt": attempt + 1})
+            sleep(delay / 2 + random.uniform(0, delay / 2))  # noqa: S311, DUO102
+            delay *= 2
+        attempt += 1
+        message_batches = build_sns_message_batches(pending_messages)
+        pending_messages = []
+        service_faults = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(message_batches))) as executor:
+            futures = {executor.submit(publish_sns_message_batch, sns_client, batch, sns_topic_arn): batch for batch in message_batches}
+            for future in as_completed(futures):
+                messages_by_id = {sns_message["Id"]: sns_message for sns_message in futures[future]}
+                for failed_entry in future.result():
+                    if failed_entry["SenderFault"]:
+                        sender_faults.append(failed_entry)
+                    else:
+                        service_faults.append(failed_entry)
+                        pending_messages.append(messages_by_id[failed_entry["Id"]])
+
+    failed_entries = sender_faults + service_faults
+    LOGGER.info(
+        {
+            "SNS_Publish": {
+                "Messages": len(sns_messages),
+                "Attempts": attempt,
+                "Failed": len(failed_entries),
+                "Seconds": round(monotonic() - start_time, 3),
+            }
+        }
+    )
+    if failed_entries:
+        LOGGER.error({"Failed SNS messages": failed_entries})
+        raise ValueError(f"{len(failed_entries)} of {len(sns_messages)} SNS messages failed to publish")
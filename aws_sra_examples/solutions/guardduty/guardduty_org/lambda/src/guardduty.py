@@ -13,6 +13,8 @@ from __future__ import annotations
 import json
 import logging
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from time import sleep
 from typing import TYPE_CHECKING, Any, Dict
 
@@ -42,10 +44,14 @@ UNEXPECTED = "Unexpected!"
 MAX_RETRY = 5
 BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "standard"})
 CHECK_ACCT_MEMBER_RETRIES = 10
+REGION_MAX_WORKERS = 8  # Default number of regions configured concurrently
+CLEANUP_ACCOUNT_MAX_WORKERS = 4  # Member accounts cleaned up at the same time, each cleaning up its regions concurrently
+CLEANUP_ACCOUNTS_PER_MESSAGE = int(os.environ.get("CLEANUP_ACCOUNTS_PER_MESSAGE", "10"))  # Member accounts cleaned up by each SNS message
 
 try:
     MANAGEMENT_ACCOUNT_SESSION = boto3.Session()
     ORG_CLIENT: OrganizationsClient = MANAGEMENT_ACCOUNT_SESSION.client("organizations", config=BOTO3_CONFIG)
+    SNS_CLIENT: SNSClient = MANAGEMENT_ACCOUNT_SESSION.client("sns", config=BOTO3_CONFIG)
 except Exception:
     LOGGER.exception(UNEXPECTED)
     raise ValueError("Unexpected error executing Lambda function. Review CloudWatch logs for details.") from None
@@ -109,18 +115,45 @@ def get_unprocessed_account_details(create_members_response: CreateMembersRespon
     Returns:
         remaining account list
     """
+    accounts_by_id = {account_record["AccountId"]: account_record for account_record in accounts}
     remaining_accounts = []
 
     for unprocessed_account in create_members_response["UnprocessedAccounts"]:
         if "error" in unprocessed_account["Result"]:
             LOGGER.error(f"{unprocessed_account}")
             raise ValueError(f"Internal Error creating member accounts: {unprocessed_account['Result']}") from None
-        for account_record in accounts:
-            if account_record["AccountId"] == unprocessed_account["AccountId"]:
-                remaining_accounts.append(account_record)
+        if unprocessed_account["AccountId"] in accounts_by_id:
+            remaining_accounts.append(accounts_by_id[unprocessed_account["AccountId"]])
     return remaining_accounts
 
 
+def reconcile_members(guardduty_client: GuardDutyClient, detector_id: str, accounts: list) -> Dict[str, list]:
+    """Compare the GuardDuty members with the accounts in the organization in a single pass.
+
+    Args:
+        guardduty_client: boto3 guardduty client
+        detector_id: detectorId of the delegated admin account
+        accounts: list of accounts in the organization
+
+    Returns:
+        Missing accounts, extra member account IDs and member account IDs with a changed email
+    """
+    accounts_by_id = {account["AccountId"]: account for account in accounts}
+    member_emails: Dict[str, str] = {}
+    member_paginator = guardduty_client.get_paginator("list_members")
+    for page in member_paginator.paginate(DetectorId=detector_id):
+        for member in page["Members"]:
+            member_emails[member["AccountId"]] = member["Email"]
+
+    return {
+        "Missing": [account for account_id, account in accounts_by_id.items() if account_id not in member_emails],
+        "Extra": [account_id for account_id in member_emails if account_id not in accounts_by_id],
+        "Changed": [
+            account_id for account_id, email in member_emails.items() if account_id in accounts_by_id and accounts_by_id[account_id]["Email"] != email
+        ],
+    }
+
+
 def check_members(guardduty_client: GuardDutyClient, detector_id: str, accounts: list) -> list:
     """Check all accounts in the organization are member accounts.
 
@@ -135,18 +168,11 @@ def check_members(guardduty_client: GuardDutyClient, detector_id: str, accounts:
     LOGGER.info("check_members begin")
     retries = 0
     missing_members: list = []
-    confirmed_members: list = []
     while retries < CHECK_ACCT_MEMBER_RETRIES:
-        confirmed_members = []
-        missing_members = []
-        member_paginator = guardduty_client.get_paginator("list_members")
-        page_iterator = member_paginator.paginate(DetectorId=detector_id)
-        for page in page_iterator:
-            for member in page["Members"]:
-                confirmed_members.append(member["AccountId"])
-        for account in accounts:
-            if account["AccountId"] not in confirmed_members:
-                missing_members.append(account)
+        reconciliation = reconcile_members(guardduty_client, detector_id, accounts)
+        missing_members = reconciliation["Missing"]
+        if reconciliation["Extra"] or reconciliation["Changed"]:
+            LOGGER.info(f"members not in the organization: {reconciliation['Extra']}, members with a changed email: {reconciliation['Changed']}")
         if len(missing_members) > 0:
             LOGGER.info(f"missing {len(missing_members)} members: {missing_members}")
             retries += 1
@@ -159,8 +185,8 @@ def check_members(guardduty_client: GuardDutyClient, detector_id: str, accounts:
     return missing_members
 
 
-def create_members(guardduty_client: GuardDutyClient, detector_id: str, accounts: list) -> None:  # noqa: CCR001 (cognitive complexity)
-    """Create GuardDuty members with existing accounts. Retry 2 times.
+def create_members(guardduty_client: GuardDutyClient, detector_id: str, accounts: list) -> None:
+    """Create GuardDuty members with existing accounts. Retry unprocessed accounts up to MAX_RETRY times.
 
     Args:
         guardduty_client: GuardDutyClient
@@ -176,36 +202,21 @@ def create_members(guardduty_client: GuardDutyClient, detector_id: str, accounts
 
     for api_call_number in range(0, number_of_create_members_calls):
         account_details = accounts[api_call_number * 50 : (api_call_number * 50) + 50]
-        LOGGER.info(f"Calling create_member, api_call_number {api_call_number} with detector_id: {detector_id}")
-        LOGGER.info(f"Create member account_details: {account_details}, account_details length: {len(account_details)}")
-        create_members_response = guardduty_client.create_members(DetectorId=detector_id, AccountDetails=account_details)
-
-        if "UnprocessedAccounts" in create_members_response and create_members_response["UnprocessedAccounts"]:
-            unprocessed = True
-            retry_count = 0
-            unprocessed_accounts = []
-            LOGGER.info(f"Retry number; {retry_count} for unprocessed accounts")
-            LOGGER.info(f"Sleeping for {SLEEP_SECONDS} before retry")
-            sleep(SLEEP_SECONDS)
-            while unprocessed:
-                retry_count += 1
-                LOGGER.info(f"Unprocessed Accounts: {create_members_response['UnprocessedAccounts']}")
-                remaining_accounts = get_unprocessed_account_details(create_members_response, accounts)
-
-                if len(remaining_accounts) > 0:
-                    LOGGER.info("Remaining accounts found during create members")
-                    LOGGER.info(f"Calling create_member, api_call_number {api_call_number} with detector_id: {detector_id}")
-                    LOGGER.info(f"Create member account_details: {remaining_accounts}, remaining_accounts length: {len(remaining_accounts)}")
-                    create_members_response = guardduty_client.create_members(DetectorId=detector_id, AccountDetails=remaining_accounts)
-                    if "UnprocessedAccounts" in create_members_response and create_members_response["UnprocessedAccounts"]:
-                        LOGGER.info("Unprocessed accounts found during retry")
-                        unprocessed_accounts = create_members_response["UnprocessedAccounts"]
-                        if retry_count == MAX_RETRY:
-                            unprocessed = False
-
-            if unprocessed_accounts:
-                LOGGER.info(f"Unprocessed Member Accounts: {unprocessed_accounts}")
+        retry_count = 0
+        while account_details:
+            LOGGER.info(f"Calling create_member, api_call_number {api_call_number} with detector_id: {detector_id}")
+            LOGGER.info(f"Create member account_details: {account_details}, account_details length: {len(account_details)}")
+            create_members_response = guardduty_client.create_members(DetectorId=detector_id, AccountDetails=account_details)
+            if not create_members_response.get("UnprocessedAccounts"):
+                break
+
+            LOGGER.info(f"Unprocessed Accounts: {create_members_response['UnprocessedAccounts']}")
+            if retry_count == MAX_RETRY:
                 raise ValueError("Unprocessed Member Accounts while Creating Members")
+            account_details = get_unprocessed_account_details(create_members_response, account_details)
+            retry_count += 1
+            LOGGER.info(f"Retry number {retry_count} for unprocessed accounts, sleeping for {SLEEP_SECONDS} seconds")
+            sleep(SLEEP_SECONDS)
 
 
 def set_features_list(gd_features: dict) -> list:
@@ -474,7 +485,99 @@ def update_guardduty_configuration(
     guardduty_client.update_detector(**admin_configuration_params)
 
 
-def configure_guardduty(  # noqa: CFQ002, CFQ001
+def configure_guardduty_in_region(  # noqa: CFQ002
+    regional_guardduty: GuardDutyClient,
+    region: str,
+    gd_features: dict,
+    accounts: list,
+    account_ids: list,
+    finding_publishing_frequency: str,
+    kms_key_arn: str,
+    publishing_destination_arn: str,
+) -> None:
+    """Configure GuardDuty in a region and verify the members were created.
+
+    Args:
+        regional_guardduty: GuardDuty client for the region
+        region: AWS Region
+        gd_features: GuardDuty protection plans configuration
+        accounts: AWS account details
+        account_ids: AWS account IDs
+        finding_publishing_frequency: Finding publishing frequency
+        kms_key_arn: KMS Key ARN
+        publishing_destination_arn: Publishing Destination ARN (S3 Bucket)
+
+    Raises:
+        ValueError: "Check members failure"
+    """
+    LOGGER.info(f"Configuring GuardDuty in {region}")
+    detectors = regional_guardduty.list_detectors()
+
+    if not detectors["DetectorIds"]:
+        LOGGER.info(f"No GuardDuty detector found in {region}")
+        return
+
+    detector_id = detectors["DetectorIds"][0]
+    LOGGER.info(f"DetectorID: {detector_id} Region: {region}")
+
+    # Update Publish Destination
+    destinations = regional_guardduty.list_publishing_destinations(DetectorId=detector_id)
+
+    if "Destinations" in destinations and len(destinations["Destinations"]) == 1:
+        destination_id = destinations["Destinations"][0]["DestinationId"]
+
+        regional_guardduty.update_publishing_destination(
+            DetectorId=detector_id,
+            DestinationId=destination_id,
+            DestinationProperties={
+                "DestinationArn": publishing_destination_arn,
+                "KmsKeyArn": kms_key_arn,
+            },
+        )
+    else:
+        # Create Publish Destination
+        regional_guardduty.create_publishing_destination(
+            DetectorId=detector_id,
+            DestinationType="S3",
+            DestinationProperties={
+                "DestinationArn": publishing_destination_arn,
+                "KmsKeyArn": kms_key_arn,
+            },
+        )
+
+    # Set GuardDuty Organization configuration to auto-enable selected features
+    update_guardduty_configuration(
+        regional_guardduty,
+        gd_features,
+        detector_id,
+        finding_publishing_frequency,
+    )
+
+    # Create members only for Organization accounts that are not already members
+    reconciliation = reconcile_members(regional_guardduty, detector_id, accounts)
+    if reconciliation["Extra"] or reconciliation["Changed"]:
+        LOGGER.info(f"members not in the organization: {reconciliation['Extra']}, members with a changed email: {reconciliation['Changed']}")
+    if reconciliation["Missing"]:
+        LOGGER.info(f"Creating members for missing accounts: {reconciliation['Missing']} in {region}")
+        create_members(regional_guardduty, detector_id, reconciliation["Missing"])
+    else:
+        LOGGER.info(f"All accounts in the organization are already members in {region}")
+
+    # Verify members created for existing Organization accounts
+    LOGGER.info(f"Checking for missing members. DetectorID: {detector_id} Region: {region}")
+    missing_members: list = check_members(regional_guardduty, detector_id, accounts)
+    if len(missing_members) > 0:
+        LOGGER.info(f"Check members failure in {region}: {missing_members}")
+        raise ValueError("Check members failure")
+    update_member_detectors(
+        regional_guardduty,
+        detector_id,
+        account_ids,
+        gd_features,
+    )
+
+
+def configure_guardduty(  # noqa: CFQ002
     session: boto3.Session,
     delegated_account_id: str,
     gd_features: dict,
@@ -482,8 +585,9 @@ def configure_guardduty(  # noqa: CFQ002, CFQ001
     finding_publishing_frequency: str,
     kms_key_arn: str,
     publishing_destination_arn: str,
+    max_workers: int = REGION_MAX_WORKERS,
 ) -> None:
-    """Configure GuardDuty with provided parameters.
+    """Configure GuardDuty with provided parameters, configuring the regions concurrently.
 
     Args:
         session: boto3 session
@@ -493,76 +597,43 @@ def configure_guardduty(  # noqa: CFQ002, CFQ001
         finding_publishing_frequency: Finding publishing frequency
         kms_key_arn: KMS Key ARN
         publishing_destination_arn: Publishing Destination ARN (S3 Bucket)
+        max_workers: Maximum number of regions configured at the same time
 
     Raises:
-        ValueError: "Check members failure"
+        ValueError: GuardDuty configuration failed in one or more regions
     """
     accounts = common.get_all_organization_accounts([delegated_account_id])
     account_ids = common.get_account_ids(accounts)
+    regional_clients: Dict[str, GuardDutyClient] = {
+        region: session.client("guardduty", region_name=region, config=BOTO3_CONFIG) for region in region_list
+    }
 
-    # Loop through the regions and enable GuardDuty
-    for region in region_list:
-        LOGGER.info(f"Configuring GuardDuty in {region}")
-        regional_guardduty: GuardDutyClient = session.client("guardduty", region_name=region, config=BOTO3_CONFIG)
-        detectors = regional_guardduty.list_detectors()
-
-        if detectors["DetectorIds"]:
-            detector_id = detectors["DetectorIds"][0]
-            LOGGER.info(f"DetectorID: {detector_id} Region: {region}")
-
-            # Update Publish Destination
-            destinations = regional_guardduty.list_publishing_destinations(DetectorId=detector_id)
-
-            if "Destinations" in destinations and len(destinations["Destinations"]) == 1:
-                destination_id = destinations["Destinations"][0]["DestinationId"]
-
-                regional_guardduty.update_publishing_destination(
-                    DetectorId=detector_id,
-                    DestinationId=destination_id,
-                    DestinationProperties={
-                        "DestinationArn": publishing_destination_arn,
-                        "KmsKeyArn": kms_key_arn,
-                    },
-                )
-            else:
-                # Create Publish Destination
-                regional_guardduty.create_publishing_destination(
-                    DetectorId=detector_id,
-                    DestinationType="S3",
-                    DestinationProperties={
-                        "DestinationArn": publishing_destination_arn,
-                        "KmsKeyArn": kms_key_arn,
-                    },
-                )
-
-            # Set GuardDuty Organization configuration to auto-enable selected features
-            update_guardduty_configuration(
+    failed_regions: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                configure_guardduty_in_region,
                 regional_guardduty,
+                region,
                 gd_features,
-                detector_id,
+                accounts,
+                account_ids,
                 finding_publishing_frequency,
-            )
-
-            # Create members for existing Organization accounts
-            create_members(regional_guardduty, detector_id, accounts)
-            LOGGER.info(f"Creating members for existing accounts: {accounts} in {region}")
+                kms_key_arn,
+                publishing_destination_arn,
+            ): region
+            for region, regional_guardduty in regional_clients.items()
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as error:
+                LOGGER.exception(f"Failed to configure GuardDuty in {futures[future]}")
+                failed_regions[futures[future]] = str(error)
 
-    # Verify members created for existing Organization accounts
-    for region in region_list:
-        detectors = regional_guardduty.list_detectors()
-        if detectors["DetectorIds"]:
-            detector_id = detectors["DetectorIds"][0]
-            LOGGER.info(f"Checking for missing members. DetectorID: {detector_id} Region: {region}")
-        missing_members: list = check_members(regional_guardduty, detector_id, accounts)
-        if len(missing_members) > 0:
-            LOGGER.info(f"Check members failure: {missing_members}")
-            raise ValueError("Check members failure")
-        update_member_detectors(
-            regional_guardduty,
-            detector_id,
-            account_ids,
-            gd_features,
-        )
+    if failed_regions:
+        LOGGER.error({"Configure GuardDuty failed regions": failed_regions})
+        raise ValueError(f"GuardDuty configuration failed in regions: {', '.join(sorted(failed_regions))}")
 
 
 def check_for_detectors(session: boto3.Session, regions: list) -> bool:  # noqa: CCR001 (cognitive complexity)
@@ -593,7 +664,9 @@ def check_for_detectors(session: boto3.Session, regions: list) -> bool:  # noqa:
     return all(value for _, value in region_detectors.items())
 
 
-def process_delete_event(params: dict, regions: list, account_ids: list, include_members: bool = False) -> None:
+def process_delete_event(
+    params: dict, regions: list, account_ids: list, include_members: bool = False, accounts_per_message: int = CLEANUP_ACCOUNTS_PER_MESSAGE
+) -> None:
     """Delete GuardDuty solution resources.
 
     Args:
@@ -601,6 +674,7 @@ def process_delete_event(params: dict, regions: list, account_ids: list, include
         regions: AWS regions
         account_ids: AWS account IDs
         include_members: Include Members
+        accounts_per_message: Number of member accounts to cleanup per SNS message
     """
     delegated_admin_session = common.assume_role(params["CONFIGURATION_ROLE_NAME"], "DeleteGuardDuty", params["DELEGATED_ADMIN_ACCOUNT_ID"])
     # Loop through the regions and disable GuardDuty in the delegated admin account
@@ -615,17 +689,17 @@ def process_delete_event(params: dict, regions: list, account_ids: list, include
     deregister_delegated_administrator(params["DELEGATED_ADMIN_ACCOUNT_ID"], SERVICE_NAME)
 
     if include_members:
-        management_sns_client: SNSClient = MANAGEMENT_ACCOUNT_SESSION.client("sns", config=BOTO3_CONFIG)
-        for account_id in account_ids:
+        sns_messages = []
+        for index in range(0, len(account_ids), accounts_per_message):
             sns_message = {
-                "AccountId": account_id,
+                "AccountIds": account_ids[index : index + accounts_per_message],
                 "Regions": regions,
                 "DeleteDetectorRoleName": params["DELETE_DETECTOR_ROLE_NAME"],
                 "Action": "delete-member",
             }
-            LOGGER.info(f"Publishing message to cleanup GuardDuty in {account_id}")
-            LOGGER.info(f"{json.dumps(sns_message)}")
-            management_sns_client.publish(TopicArn=params["SNS_TOPIC_ARN"], Message=json.dumps(sns_message))
+            LOGGER.info(f"Publishing message to cleanup GuardDuty in {sns_message['AccountIds']}")
+            sns_messages.append({"Id": str(len(sns_messages)), "Message": json.dumps(sns_message)})
+        common.publish_sns_messages(SNS_CLIENT, sns_messages, params["SNS_TOPIC_ARN"])
 
 
 def disable_aws_service_access(service_principal: str) -> None:
@@ -654,15 +728,46 @@ def cleanup_member_account(account_id: str, delete_detector_role_name: str, regi
         Account ID
     """
     session = common.assume_role(delete_detector_role_name, "sra-delete-guardduty", account_id)
+    regional_clients: Dict[str, GuardDutyClient] = {
+        region: session.client("guardduty", region_name=region, config=BOTO3_CONFIG) for region in regions
+    }
 
-    for region in regions:
-        LOGGER.info(f"Deleting GuardDuty detector in {account_id} {region}")
-        guardduty_client: GuardDutyClient = session.client("guardduty", region_name=region, config=BOTO3_CONFIG)
-        delete_detectors(guardduty_client, region, False)
+    LOGGER.info(f"Deleting GuardDuty detectors in {account_id} {regions}")
+    with ThreadPoolExecutor(max_workers=REGION_MAX_WORKERS) as executor:
+        futures = [executor.submit(delete_detectors, guardduty_client, region, False) for region, guardduty_client in regional_clients.items()]
+    for future in futures:
+        future.result()
 
     return {"AccountId": account_id}
 
 
+def cleanup_member_accounts(account_ids: list, delete_detector_role_name: str, regions: list, max_workers: int = CLEANUP_ACCOUNT_MAX_WORKERS) -> None:
+    """Cleanup member accounts concurrently, continuing with the other accounts when one fails.
+
+    Args:
+        account_ids: Account IDs
+        delete_detector_role_name: Delete Detector Role Name
+        regions: AWS Regions
+        max_workers: Maximum number of accounts cleaned up at the same time
+
+    Raises:
+        ValueError: Cleanup failed in one or more accounts
+    """
+    failed_accounts: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(cleanup_member_account, account_id, delete_detector_role_name, regions): account_id for account_id in account_ids}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as error:
+                LOGGER.exception(f"Failed to cleanup GuardDuty in {futures[future]}")
+                failed_accounts[futures[future]] = str(error)
+
+    if failed_accounts:
+        LOGGER.error({"Cleanup GuardDuty failed accounts": failed_accounts})
+        raise ValueError(f"GuardDuty cleanup failed in accounts: {', '.join(sorted(failed_accounts))}")
+
+
 def delete_detectors(guardduty_client: GuardDutyClient, region: str, is_delegated_admin: bool = False) -> None:
     """Delete GuardDuty Detectors.
 
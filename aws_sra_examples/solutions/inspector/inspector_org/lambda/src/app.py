@@ -13,7 +13,6 @@ import json
 import logging
 import os
 import re
-from time import sleep
 from typing import TYPE_CHECKING, Any, Dict, Literal, Optional
 
 import boto3
@@ -27,7 +26,6 @@ if TYPE_CHECKING:
     from mypy_boto3_inspector2.type_defs import AutoEnableTypeDef
     from mypy_boto3_organizations import OrganizationsClient
     from mypy_boto3_sns import SNSClient
-    from mypy_boto3_sns.type_defs import PublishBatchResponseTypeDef
 
 LOGGER = logging.getLogger("sra")
 log_level: str = os.environ.get("LOG_LEVEL", "ERROR")
@@ -35,8 +33,8 @@ LOGGER.setLevel(log_level)
 
 UNEXPECTED = "Unexpected!"
 SERVICE_NAME = "inspector2.amazonaws.com"
-SNS_PUBLISH_BATCH_MAX = 10
 ALL_INSPECTOR_SCAN_COMPONENTS = ["EC2", "ECR", "LAMBDA", "LAMBDA_CODE"]
+READINESS_DEADLINE_SECONDS = 120
 
 helper = CfnResource(json_logging=True, log_level=log_level, boto_level="CRITICAL", sleep_on_delete=120)
 
@@ -360,9 +358,9 @@ def setup_inspector_global(params: dict, regions: list, accounts: list) -> None:
 
     register_delegated_administrator(params["DELEGATED_ADMIN_ACCOUNT_ID"], SERVICE_NAME)
 
-    inspector.create_service_linked_role(params["MANAGEMENT_ACCOUNT_ID"], params["CONFIGURATION_ROLE_NAME"])
-    for account in accounts:
-        inspector.create_service_linked_role(account["AccountId"], params["CONFIGURATION_ROLE_NAME"])
+    inspector.create_service_linked_roles(
+        [params["MANAGEMENT_ACCOUNT_ID"]] + [account["AccountId"] for account in accounts], params["CONFIGURATION_ROLE_NAME"]
+    )
 
     create_sns_messages(accounts, regions, params["SNS_TOPIC_ARN"], "configure")
 
@@ -406,8 +404,12 @@ def setup_inspector_in_region(
     )
 
     inspector.set_inspector_delegated_admin_in_mgmt(delegated_admin_account, region)
-    LOGGER.info("Waiting 20 seconds before configuring inspector org auto-enable.")
-    sleep(20)
+    if not common.wait_until_ready(
+        f"Inspector delegated admin in {region}",
+        lambda: inspector.is_delegated_admin_ready(delegated_admin_account, region),
+        READINESS_DEADLINE_SECONDS,
+    ):
+        LOGGER.warning(f"Inspector delegated admin was not ready in {region} in the allowed time. Continuing with the organization configuration.")
 
     inspector.set_auto_enable_inspector_in_org(region, configuration_role_name, delegated_admin_account, scan_component_dict)
 
@@ -417,14 +419,18 @@ def setup_inspector_in_region(
     inspector.associate_inspector_member_accounts(configuration_role_name, delegated_admin_account, accounts, region)
 
     inspector.enable_inspector2_in_member_accounts(region, configuration_role_name, delegated_admin_account, scan_components, accounts)
-    LOGGER.info("Waiting 20 seconds before checking for components that need to be disabled.")
-    sleep(20)
 
     all_accounts: list = []
     for account in accounts:
         all_accounts.append(account["AccountId"])
     all_accounts.append(management_account)
     all_accounts.append(delegated_admin_account)
+    if not common.wait_until_ready(
+        f"Inspector account statuses in {region}",
+        lambda: inspector.are_account_statuses_settled(configuration_role_name, delegated_admin_account, all_accounts, region),
+        READINESS_DEADLINE_SECONDS,
+    ):
+        LOGGER.warning(f"Inspector account statuses did not settle in {region} in the allowed time. Continuing with the scan component checks.")
     inspector.check_scan_component_enablement_for_accounts(
         all_accounts, delegated_admin_account, disabled_components, configuration_role_name, region
     )
@@ -481,40 +487,7 @@ def create_sns_messages(accounts: list, regions: list, sns_topic_arn: str, actio
             }
         )
 
-    process_sns_message_batches(sns_messages, sns_topic_arn)
-
-
-def publish_sns_message_batch(message_batch: list, sns_topic_arn: str) -> None:
-    """Publish SNS Message Batches.
-
-    Args:
-        message_batch: Batch of SNS messages
-        sns_topic_arn: SNS Topic ARN
-    """
-    LOGGER.info("Publishing SNS Message Batch")
-    LOGGER.info({"SNSMessageBatch": message_batch})
-    response: PublishBatchResponseTypeDef = SNS_CLIENT.publish_batch(TopicArn=sns_topic_arn, PublishBatchRequestEntries=message_batch)
-    api_call_details = {"API_Call": "sns:PublishBatch", "API_Response": response}
-    LOGGER.info(api_call_details)
-
-
-def process_sns_message_batches(sns_messages: list, sns_topic_arn: str) -> None:
-    """Process SNS Message Batches for Publishing.
-
-    Args:
-        sns_messages: SNS messages to be batched.
-        sns_topic_arn: SNS Topic ARN
-    """
-    message_batches = []
-    for i in range(
-        SNS_PUBLISH_BATCH_MAX,
-        len(sns_messages) + SNS_PUBLISH_BATCH_MAX,
-        SNS_PUBLISH_BATCH_MAX,
-    ):
-        message_batches.append(sns_messages[i - SNS_PUBLISH_BATCH_MAX : i])
-
-    for batch in message_batches:
-        publish_sns_message_batch(batch, sns_topic_arn)
+    common.publish_sns_messages(SNS_CLIENT, sns_messages, sns_topic_arn)
 
 
 def process_event_sns(event: dict) -> None:
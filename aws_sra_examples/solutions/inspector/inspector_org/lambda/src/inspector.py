@@ -10,15 +10,15 @@ from __future__ import annotations
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Dict, Literal
 
 import boto3
 import common
 
 if TYPE_CHECKING:
-    from mypy_boto3_iam import IAMClient
-    from mypy_boto3_inspector2 import Inspector2Client, ListDelegatedAdminAccountsPaginator
+    from mypy_boto3_inspector2 import Inspector2Client
     from mypy_boto3_inspector2.type_defs import (
         AssociateMemberResponseTypeDef,
         AutoEnableTypeDef,
@@ -36,9 +36,10 @@ LOGGER.setLevel(log_level)
 
 
 UNEXPECTED = "Unexpected!"
-INSPECTOR_THROTTLE_PERIOD = 0.2
 ENABLE_RETRY_ATTEMPTS = 10
 ENABLE_RETRY_SLEEP_INTERVAL = 10
+BATCH_GET_ACCOUNT_STATUS_MAX = 10
+ACCOUNT_STATUS_MAX_WORKERS = 8
 
 try:
     MANAGEMENT_ACCOUNT_SESSION = boto3.Session()
@@ -58,12 +59,10 @@ def is_admin_account_enabled(inspector_client: Inspector2Client, admin_account_i
     Returns:
         True or False
     """
-    paginator: ListDelegatedAdminAccountsPaginator = inspector_client.get_paginator("list_delegated_admin_accounts")
-    for page in paginator.paginate():
+    for page in common.rate_limited_paginate(inspector_client, "list_delegated_admin_accounts"):
         for admin_account in page["delegatedAdminAccounts"]:
             if admin_account["accountId"] == admin_account_id and admin_account["status"] == "ENABLED":
                 return True
-        sleep(INSPECTOR_THROTTLE_PERIOD)
     return False
 
 
@@ -75,15 +74,15 @@ def disable_organization_admin_account(regions: list) -> None:
     """
     for region in regions:
         inspector_client: Inspector2Client = MANAGEMENT_ACCOUNT_SESSION.client("inspector2", region)
-        paginator: ListDelegatedAdminAccountsPaginator = inspector_client.get_paginator("list_delegated_admin_accounts")
-        for page in paginator.paginate():
+        for page in common.rate_limited_paginate(inspector_client, "list_delegated_admin_accounts"):
             for admin_account in page["delegatedAdminAccounts"]:
                 if admin_account["status"] == "ENABLED":
-                    response = inspector_client.disable_delegated_admin_account(delegatedAdminAccountId=admin_account["accountId"])
+                    response = common.rate_limited_call(
+                        inspector_client, "disable_delegated_admin_account", delegatedAdminAccountId=admin_account["accountId"]
+                    )
                     api_call_details = {"API_Call": "inspector2:DisableDelegatedAdminAccount", "API_Response": response}
                     LOGGER.info(api_call_details)
                     LOGGER.info(f"Admin Account {admin_account['accountId']} Disabled in {region}")
-            sleep(INSPECTOR_THROTTLE_PERIOD)
 
 
 def disable_inspector_in_associated_member_accounts(
@@ -210,6 +209,77 @@ def set_inspector_delegated_admin_in_mgmt(admin_account_id: str, region: str) ->
             raise
 
 
+def is_delegated_admin_ready(admin_account_id: str, region: str) -> bool:
+    """Check if the delegated admin account is enabled in the given region.
+
+    Args:
+        admin_account_id: Admin account ID
+        region: AWS Region
+
+    Returns:
+        True or False
+    """
+    inspector2_client: Inspector2Client = MANAGEMENT_ACCOUNT_SESSION.client("inspector2", region)
+    return is_admin_account_enabled(inspector2_client, admin_account_id)
+
+
+def get_account_scan_component_states(inspector2_client: Inspector2Client, account_ids: list) -> Dict[str, dict]:
+    """Get the inspector and scan component statuses of many accounts, BATCH_GET_ACCOUNT_STATUS_MAX accounts per concurrent call.
+
+    Args:
+        inspector2_client: Inspector2 client
+        account_ids: AWS account IDs
+
+    Returns:
+        Account ID -> {"status": inspector status, "resourceState": {scan component: status}}
+    """
+    account_id_chunks = [
+        account_ids[index : index + BATCH_GET_ACCOUNT_STATUS_MAX] for index in range(0, len(account_ids), BATCH_GET_ACCOUNT_STATUS_MAX)
+    ]
+    with ThreadPoolExecutor(max_workers=ACCOUNT_STATUS_MAX_WORKERS) as executor:
+        responses = list(
+            executor.map(lambda account_id_chunk: inspector2_client.batch_get_account_status(accountIds=account_id_chunk), account_id_chunks)
+        )
+
+    account_states: Dict[str, dict] = {}
+    for response in responses:
+        api_call_details = {"API_Call": "inspector:BatchGetAccountStatus", "API_Response": response}
+        LOGGER.info(api_call_details)
+        for account_status in response["accounts"]:
+            resource_states = account_status["resourceState"].items()  # type: ignore
+            account_states[account_status["accountId"]] = {
+                "status": account_status["state"]["status"],
+                "resourceState": {scan_component: resource_state["status"] for scan_component, resource_state in resource_states},
+            }
+        if response.get("failedAccounts"):
+            LOGGER.info(f"Unable to get inspector status for accounts: {response['failedAccounts']}")
+    return account_states
+
+
+def are_account_statuses_settled(configuration_role_name: str, delegated_admin_account_id: str, account_ids: list, region: str) -> bool:
+    """Check that inspector and its scan components are no longer enabling or disabling in the given accounts.
+
+    Args:
+        configuration_role_name: Configuration Role Name
+        delegated_admin_account_id: Delegated Admin Account ID
+        account_ids: AWS account IDs
+        region: AWS Region
+
+    Returns:
+        True or False
+    """
+    delegated_admin_session = common.assume_role(configuration_role_name, "sra-enable-inspector", delegated_admin_account_id)
+    inspector2_client: Inspector2Client = delegated_admin_session.client("inspector2", region)
+    transitional_statuses = ("ENABLING", "DISABLING")
+    for account_id, account_state in get_account_scan_component_states(inspector2_client, account_ids).items():
+        if account_state["status"] in transitional_statuses or any(
+            status in transitional_statuses for status in account_state["resourceState"].values()
+        ):
+            LOGGER.info(f"Inspector status is still changing in the {account_id} account in {region}")
+            return False
+    return True
+
+
 def disable_inspector2(inspector2_client: Inspector2Client, account_id: str, scan_components: list) -> DisableResponseTypeDef:
     """Disable inspector for the given account.
 
@@ -340,36 +410,29 @@ def check_scan_component_enablement_for_accounts(
     LOGGER.info(f"creating delegated admin session with ({configuration_role_name}) and account ({delegated_admin_account_id}) to disable inspector")
     inspector_delegated_admin_region_client: Inspector2Client = delegated_admin_session.client("inspector2", region)
 
-    for account in all_accounts:
-        check_for_updates_to_scan_components(inspector_delegated_admin_region_client, account, disabled_components)
+    account_states = get_account_scan_component_states(inspector_delegated_admin_region_client, all_accounts)
+    for account_id, account_state in account_states.items():
+        check_for_updates_to_scan_components(inspector_delegated_admin_region_client, account_id, account_state, disabled_components)
 
 
-def check_for_updates_to_scan_components(inspector2_client: Inspector2Client, account_id: str, disabled_components: list) -> None:
-    """Fetch the enablement status of inspector in an AWS account.
+def check_for_updates_to_scan_components(
+    inspector2_client: Inspector2Client, account_id: str, account_state: dict, disabled_components: list
+) -> None:
+    """Disable the scan components that should be disabled but are enabled in an AWS account.
 
     Args:
         inspector2_client: Inspector2 client
         account_id: Account ID
+        account_state: Inspector and scan component statuses of the account
         disabled_components: list of scan components that should be disabled
     """
     LOGGER.info(f"check_for_updates_to_scan_components: disabled components - ({disabled_components}) - in account ({account_id})")
-    LOGGER.info(f"Checking inspector service status for {account_id} account...")
-    disablement: bool = False
-    inspector_status_response = inspector2_client.batch_get_account_status(accountIds=[account_id])
-    api_call_details = {"API_Call": "inspector:BatchGetAccountStatus", "API_Response": inspector_status_response}
-    LOGGER.info(api_call_details)
-    for status in inspector_status_response["accounts"]:
-        if status["state"]["status"] == "ENABLED":
-            LOGGER.info(f"Status: {status['state']['status']}")
-            for scan_component in disabled_components:
-                LOGGER.info(f"{scan_component} status: {status['resourceState'][scan_component]['status']}")  # type: ignore
-                if status["resourceState"][scan_component]["status"] != "ENABLED":  # type: ignore
-                    LOGGER.info(f"{scan_component} scan component is disabled...")
-                else:
-                    LOGGER.info(f"{scan_component} scan component is enabled (disablement required)...")
-                    disablement = True
-    if disablement is True:
-        LOGGER.info("Disabling some scan components...")
+    if account_state["status"] != "ENABLED":
+        return
+
+    enabled_components = [scan_component for scan_component in disabled_components if account_state["resourceState"].get(scan_component) == "ENABLED"]
+    if enabled_components:
+        LOGGER.info(f"{enabled_components} scan components are enabled (disablement required), disabling some scan components...")
         disable_inspector2(
             inspector2_client, account_id, [common.camel_to_snake_upper(disabled_component) for disabled_component in disabled_components]
         )
@@ -561,19 +624,22 @@ def associate_inspector_member_accounts(configuration_role_name: str, delegated_
             LOGGER.info(associate_account(inspector_delegated_admin_region_client, account["AccountId"]))
 
 
-def create_service_linked_role(account_id: str, configuration_role_name: str) -> None:
-    """Create service linked role in the given account.
+def create_service_linked_roles(account_ids: list, configuration_role_name: str) -> dict:
+    """Create service linked role in the given accounts.
 
     Args:
-        account_id (str): Account ID
+        account_ids (list): Account IDs
         configuration_role_name (str): IAM configuration role name
+
+    Returns:
+        dict: Account ID -> "existing" or "created"
     """
-    LOGGER.info(f"creating service linked role for account {account_id}")
-    account_session: boto3.Session = common.assume_role(configuration_role_name, "sra-configure-inspector", account_id)
-    iam_client: IAMClient = account_session.client("iam")
-    common.create_service_linked_role(
+    LOGGER.info(f"creating service linked role for accounts {account_ids}")
+    return common.provision_service_linked_roles(
+        account_ids,
+        configuration_role_name,
+        "sra-configure-inspector",
         "AWSServiceRoleForAmazonInspector2",
         "inspector2.amazonaws.com",
         "A service-linked role required for AWS Inspector to access your resources.",
-        iam_client,
     )
@@ -11,14 +11,21 @@ from __future__ import annotations
 
 import logging
 import os
-from time import sleep
-from typing import TYPE_CHECKING
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Any, Iterator
 
 import boto3
+import botocore.session
+import jmespath
+from botocore import xform_name
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
 if TYPE_CHECKING:
+    from botocore.client import BaseClient
     from mypy_boto3_iam.client import IAMClient
     from mypy_boto3_organizations import OrganizationsClient
     from mypy_boto3_ssm.client import SSMClient
@@ -33,19 +40,75 @@ LOGGER.setLevel(log_level)
 CLOUDFORMATION_PAGE_SIZE = 20
 CLOUDFORMATION_THROTTLE_PERIOD = 0.2
 ORG_PAGE_SIZE = 20  # Max page size for list_accounts
-ORG_THROTTLE_PERIOD = 0.2
 BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "standard"})
 UNEXPECTED = "Unexpected!"
-
+SESSION_REFRESH_WINDOW = timedelta(minutes=5)  # Refresh cached assumed role credentials this long before they expire
+SESSION_CACHE_LOCK = threading.Lock()
+ASSUMED_ROLE_CREDENTIALS: dict = {}  # (account, role, partition, session name) -> STS credentials, reused across warm invocations
+CALLER_ARNS: dict = {}  # access key -> {"Arn": caller identity ARN, "Time": when it was cached}
+CALLER_ARN_TTL_SECONDS = 3600  # Evict caller identities of credentials that are no longer in use
+REGION_PROBE_MAX_WORKERS = 16
+ENABLED_REGIONS_CACHE_TTL_SECONDS = 900  # Reuse probed regions across warm invocations
+ENABLED_REGIONS_CACHE_LOCK = threading.Lock()
+ENABLED_REGIONS_CACHE: dict = {}  # (customer regions, control tower regions only) -> (probe time, enabled regions)
+ORG_BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "adaptive"})  # Client-side rate limiting instead of fixed page sleeps
+ORG_ACCOUNTS_CACHE_TTL_SECONDS = 300  # Reuse the account inventory across warm invocations
+ORG_ACCOUNTS_CACHE_LOCK = threading.Lock()
+ORG_ACCOUNTS_CACHE: dict = {}  # {"Accounts": {account ID: account}, "Time": list time}
+RATE_LIMIT_INITIAL_RATE = 5.0  # Requests per second each (service, operation, region) token bucket starts at
+RATE_LIMIT_MIN_RATE = 0.5
+RATE_LIMIT_MAX_RATE = 50.0
+RATE_LIMIT_ADDITIVE_INCREASE = 0.2  # Requests per second added after each successful call
+RATE_LIMIT_MULTIPLICATIVE_DECREASE = 0.5  # Rate multiplier applied after each throttling error
+RATE_LIMIT_MAX_THROTTLE_RETRIES = 5
+THROTTLING_ERROR_CODES = {"ThrottlingException", "TooManyRequestsException", "Throttling", "TooManyRequests"}
+RATE_LIMIT_LOCK = threading.Lock()
+RATE_LIMIT_BUCKETS: dict = {}  # (service, operation, region) -> {"Rate": requests per second, "Tokens": available tokens, "Time": last refill}
+RATE_LIMIT_LISTENER_ID = "sra-rate-limit-throttle-listener"  # Keeps the needs-retry listener registered once per client
+BOTOCORE_SESSION = botocore.session.get_session()  # Loads the paginator models used to follow pagination tokens
 
 try:
     MANAGEMENT_ACCOUNT_SESSION = boto3.Session()
+    ORG_CLIENT: OrganizationsClient = MANAGEMENT_ACCOUNT_SESSION.client("organizations", config=ORG_BOTO3_CONFIG)
     SSM_CLIENT: SSMClient = MANAGEMENT_ACCOUNT_SESSION.client("ssm")
 except Exception:
     LOGGER.exception(UNEXPECTED)
     raise ValueError("Unexpected error executing Lambda function. Review CloudWatch logs for details.") from None
 
 
+def evict_expired_sessions() -> None:
+    """Remove expired assumed role credentials and stale caller identities so the warm invocation caches stay bounded."""
+    now = datetime.now(timezone.utc)
+    with SESSION_CACHE_LOCK:
+        for cache_key in [key for key, credentials in ASSUMED_ROLE_CREDENTIALS.items() if credentials["Expiration"] <= now]:
+            CALLER_ARNS.pop(ASSUMED_ROLE_CREDENTIALS.pop(cache_key)["AccessKeyId"], None)
+        for access_key in [key for key, caller in CALLER_ARNS.items() if monotonic() - caller["Time"] >= CALLER_ARN_TTL_SECONDS]:
+            del CALLER_ARNS[access_key]
+
+
+def get_caller_arn(session: boto3.Session) -> str:
+    """Get the caller identity ARN for the session, calling STS once per set of credentials.
+
+    Args:
+        session: Boto3 session
+
+    Returns:
+        Caller identity ARN
+    """
+    access_key = session.get_credentials().access_key
+    evict_expired_sessions()
+    with SESSION_CACHE_LOCK:
+        caller = CALLER_ARNS.get(access_key)
+    if caller:
+        return caller["Arn"]
+    sts_client: STSClient = session.client("sts", config=BOTO3_CONFIG)
+    sts_arn = sts_client.get_caller_identity()["Arn"]
+    LOGGER.info(f"USER: {sts_arn}")
+    with SESSION_CACHE_LOCK:
+        CALLER_ARNS[access_key] = {"Arn": sts_arn, "Time": monotonic()}
+    return sts_arn
+
+
 def assume_role(role: str, role_session_name: str, account: str = None, session: boto3.Session = None) -> boto3.Session:
     """Assumes the provided role in the given account and returns a session.
 
@@ -60,23 +123,64 @@ def assume_role(role: str, role_session_name: str, account: str = None, session:
     """
     if not session:
         session = boto3.Session()
-    sts_client: STSClient = session.client("sts", config=BOTO3_CONFIG)
-    sts_arn = sts_client.get_caller_identity()["Arn"]
-    LOGGER.info(f"USER: {sts_arn}")
+    sts_arn = get_caller_arn(session)
     if not account:
         account = sts_arn.split(":")[4]
     partition = sts_arn.split(":")[1]
-    role_arn = f"arn:{partition}:iam::{account}:role/{role}"
+    cache_key = (account, role, partition, role_session_name)
+
+    with SESSION_CACHE_LOCK:
+        cached_credentials = ASSUMED_ROLE_CREDENTIALS.get(cache_key)
+    if not cached_credentials or cached_credentials["Expiration"] - SESSION_REFRESH_WINDOW <= datetime.now(timezone.utc):
+        role_arn = f"arn:{partition}:iam::{account}:role/{role}"
+        sts_client: STSClient = session.client("sts", config=BOTO3_CONFIG)
+        response = sts_client.assume_role(RoleArn=role_arn, RoleSessionName=role_session_name)
+        LOGGER.info(f"ASSUMED ROLE: {response['AssumedRoleUser']['Arn']}")
+        cached_credentials = response["Credentials"]
+        with SESSION_CACHE_LOCK:
+            ASSUMED_ROLE_CREDENTIALS[cache_key] = cached_credentials
 
-    response = sts_client.assume_role(RoleArn=role_arn, RoleSessionName=role_session_name)
-    LOGGER.info(f"ASSUMED ROLE: {response['AssumedRoleUser']['Arn']}")
     return boto3.Session(
-        aws_access_key_id=response["Credentials"]["AccessKeyId"],
-        aws_secret_access_key=response["Credentials"]["SecretAccessKey"],
-        aws_session_token=response["Credentials"]["SessionToken"],
+        aws_access_key_id=cached_credentials["AccessKeyId"],
+        aws_secret_access_key=cached_credentials["SecretAccessKey"],
+        aws_session_token=cached_credentials["SessionToken"],
     )
 
 
+def get_organization_account_inventory() -> dict:
+    """Get the AWS Organization account inventory, listing accounts only when the cached inventory is missing or stale.
+
+    Returns:
+        Accounts keyed by account ID
+    """
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        if ORG_ACCOUNTS_CACHE and monotonic() - ORG_ACCOUNTS_CACHE["Time"] < ORG_ACCOUNTS_CACHE_TTL_SECONDS:
+            return ORG_ACCOUNTS_CACHE["Accounts"]
+
+    accounts: dict = {}
+    paginator = ORG_CLIENT.get_paginator("list_accounts")
+    for page in paginator.paginate(PaginationConfig={"PageSize": ORG_PAGE_SIZE}):
+        for account in page["Accounts"]:
+            accounts[account["Id"]] = account
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        ORG_ACCOUNTS_CACHE.update({"Accounts": accounts, "Time": monotonic()})
+    return accounts
+
+
+def update_organization_account_inventory(account_id: str) -> None:
+    """Refresh a single account in the cached inventory after a CreateAccountResult or AcceptHandshake event.
+
+    Args:
+        account_id: AWS account ID
+    """
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        if not ORG_ACCOUNTS_CACHE:
+            return
+    account = ORG_CLIENT.describe_account(AccountId=account_id)["Account"]
+    with ORG_ACCOUNTS_CACHE_LOCK:
+        ORG_ACCOUNTS_CACHE["Accounts"] = {**ORG_ACCOUNTS_CACHE["Accounts"], account_id: account}
+
+
 def get_all_organization_accounts(exclude_accounts: list = None) -> list:
     """Get all the active AWS Organization accounts.
 
@@ -88,18 +192,10 @@ def get_all_organization_accounts(exclude_accounts: list = None) -> list:
     """
     if exclude_accounts is None:
         exclude_accounts = ["00000000000"]
-    accounts = []
-    management_account_session = boto3.Session()
-    org_client: OrganizationsClient = management_account_session.client("organizations", config=BOTO3_CONFIG)
-    paginator = org_client.get_paginator("list_accounts")
-
-    for page in paginator.paginate(PaginationConfig={"PageSize": ORG_PAGE_SIZE}):
-        for acct in page["Accounts"]:
-            if acct["Status"] == "ACTIVE" and acct["Id"] not in exclude_accounts:  # Store active accounts in a dict
-                account_record = {"AccountId": acct["Id"], "Email": acct["Email"]}
-                accounts.append(account_record)
-        sleep(ORG_THROTTLE_PERIOD)
-
+    accounts: list[dict] = []
+    for account in get_organization_account_inventory().values():
+        if account["Status"] == "ACTIVE" and account["Id"] not in exclude_accounts:
+            accounts.append({"AccountId": account["Id"], "Email": account["Email"]})
     return accounts
 
 
@@ -134,6 +230,32 @@ def get_control_tower_regions() -> list:  # noqa: CCR001
     return list(customer_regions)
 
 
+def probe_region(sts_client: STSClient, region: str) -> str:
+    """Test whether a region is enabled by calling STS in the region.
+
+    Args:
+        sts_client: Regional STS client
+        region: AWS region
+
+    Returns:
+        Region status: enabled, disabled, invalid, or error
+    """
+    try:
+        sts_client.get_caller_identity()
+        return "enabled"
+    except ClientError as error:
+        LOGGER.error(f"Error {error.response['Error']} occurred testing region {region}")
+        if error.response["Error"]["Code"] == "InvalidClientTokenId":
+            return "disabled"
+    except Exception as error:
+        if "Could not connect to the endpoint URL" in str(error):
+            LOGGER.error(f"Region: '{region}' is not valid")
+            LOGGER.error(f"{error}")
+            return "invalid"
+        LOGGER.error(f"{error}")
+    return "error"
+
+
 def get_enabled_regions(customer_regions: str, control_tower_regions_only: bool = False) -> list:  # noqa: CCR001
     """Query STS to identify enabled regions.
 
@@ -144,6 +266,13 @@ def get_enabled_regions(customer_regions: str, control_tower_regions_only: bool
     Returns:
         Enabled regions
     """
+    cache_key = (customer_regions.strip(), control_tower_regions_only)
+    with ENABLED_REGIONS_CACHE_LOCK:
+        cached_regions = ENABLED_REGIONS_CACHE.get(cache_key)
+    if cached_regions and monotonic() - cached_regions[0] < ENABLED_REGIONS_CACHE_TTL_SECONDS:
+        LOGGER.info({"Cached_Enabled_Regions": cached_regions[1]})
+        return list(cached_regions[1])
+
     if customer_regions.strip():
         LOGGER.debug(f"CUSTOMER PROVIDED REGIONS: {str(customer_regions)}")
         region_list = [value.strip() for value in customer_regions.split(",") if value != ""]
@@ -156,27 +285,26 @@ def get_enabled_regions(customer_regions: str, control_tower_regions_only: bool
         LOGGER.info({"Default_Available_Regions": default_available_regions})
         region_list = default_available_regions
 
-    enabled_regions = []
-    disabled_regions = []
-    invalid_regions = []
     region_session = boto3.Session()
-    for region in region_list:
-        try:
-            sts_client = region_session.client("sts", endpoint_url=f"https://sts.{region}.amazonaws.com", region_name=region, config=BOTO3_CONFIG)
-            sts_client.get_caller_identity()
-            enabled_regions.append(region)
-        except ClientError as error:
-            if error.response["Error"]["Code"] == "InvalidClientTokenId":
-                disabled_regions.append(region)
-            LOGGER.error(f"Error {error.response['Error']} occurred testing region {region}")
-        except Exception as error:
-            if "Could not connect to the endpoint URL" in str(error):
-                invalid_regions.append(region)
-                LOGGER.error(f"Region: '{region}' is not valid")
-            LOGGER.error(f"{error}")
+    sts_clients = [
+        region_session.client("sts", endpoint_url=f"https://sts.{region}.amazonaws.com", region_name=region, config=BOTO3_CONFIG)
+        for region in region_list
+    ]
+    with ThreadPoolExecutor(max_workers=REGION_PROBE_MAX_WORKERS) as executor:
+        region_statuses = dict(zip(region_list, executor.map(probe_region, sts_clients, region_list)))
+    enabled_regions = [region for region, status in region_statuses.items() if status == "enabled"]
+    disabled_regions = [region for region, status in region_statuses.items() if status == "disabled"]
+    invalid_regions = [region for region, status in region_statuses.items() if status == "invalid"]
+    error_regions = [region for region, status in region_statuses.items() if status == "error"]
     LOGGER.info({"Disabled_Regions": disabled_regions})
     LOGGER.info({"Invalid_Regions": invalid_regions})
-    return enabled_regions
+    LOGGER.info({"Error_Regions": error_regions})
+    if error_regions:
+        LOGGER.warning(f"Not caching enabled regions because probing failed in: {', '.join(error_regions)}")
+    else:
+        with ENABLED_REGIONS_CACHE_LOCK:
+            ENABLED_REGIONS_CACHE[cache_key] = (monotonic(), enabled_regions)
+    return list(enabled_regions)
 
 
 def create_service_linked_role(service_linked_role_name: str, service_name: str, description: str = "") -> None:
@@ -192,3 +320,158 @@ def create_service_linked_role(service_linked_role_name: str, service_name: str,
         iam_client.get_role(RoleName=service_linked_role_name)
     except iam_client.exceptions.NoSuchEntityException:
         iam_client.create_service_linked_role(AWSServiceName=service_name, Description=description)
+
+
+def get_rate_limit_key(client: BaseClient, operation: str) -> tuple:
+    """Get the token bucket key for a client operation.
+
+    Args:
+        client: boto3 client
+        operation: Client method name
+
+    Returns:
+        (service, operation, region) tuple
+    """
+    return (client.meta.service_model.service_name, operation, client.meta.region_name)
+
+
+def acquire_rate_limit_token(client: BaseClient, operation: str) -> None:
+    """Wait until the token bucket for the client operation allows another request.
+
+    Args:
+        client: boto3 client
+        operation: Client method name
+    """
+    key = get_rate_limit_key(client, operation)
+    with RATE_LIMIT_LOCK:
+        now = monotonic()
+        bucket = RATE_LIMIT_BUCKETS.setdefault(key, {"Rate": RATE_LIMIT_INITIAL_RATE, "Tokens": RATE_LIMIT_INITIAL_RATE, "Time": now})
+        bucket["Tokens"] = min(bucket["Rate"], bucket["Tokens"] + (now - bucket["Time"]) * bucket["Rate"]) - 1
+        bucket["Time"] = now
+        wait_seconds = -bucket["Tokens"] / bucket["Rate"] if bucket["Tokens"] < 0 else 0
+    if wait_seconds:
+        sleep(wait_seconds)
+
+
+def update_rate_limit(client: BaseClient, operation: str, throttled: bool) -> None:
+    """Adjust the token bucket rate, increasing it additively on success and decreasing it multiplicatively when throttled.
+
+    Args:
+        client: boto3 client
+        operation: Client method name
+        throttled: True if the request was throttled
+    """
+    key = get_rate_limit_key(client, operation)
+    with RATE_LIMIT_LOCK:
+        bucket = RATE_LIMIT_BUCKETS.get(key)
+        if not bucket:
+            return
+        if throttled:
+            bucket["Rate"] = max(RATE_LIMIT_MIN_RATE, bucket["Rate"] * RATE_LIMIT_MULTIPLICATIVE_DECREASE)
+            bucket["Tokens"] = min(bucket["Tokens"], 0)
+            LOGGER.info(f"Throttled on {key}, reducing rate to {bucket['Rate']} requests per second")
+        else:
+            bucket["Rate"] = min(RATE_LIMIT_MAX_RATE, bucket["Rate"] + RATE_LIMIT_ADDITIVE_INCREASE)
+
+
+def is_throttling_error(error: ClientError) -> bool:
+    """Check if the error is a throttling error.
+
+    Args:
+        error: botocore ClientError
+
+    Returns:
+        True or False
+    """
+    return error.response["Error"]["Code"] in THROTTLING_ERROR_CODES
+
+
+def register_throttle_listener(client: BaseClient) -> None:
+    """Record every throttled attempt in the token bucket, including the attempts botocore retries internally.
+
+    Args:
+        client: boto3 client
+    """
+
+    def record_throttle(response: Any = None, operation: Any = None, **kwargs: Any) -> None:  # noqa U100
+        if response is not None and response[1].get("Error", {}).get("Code") in THROTTLING_ERROR_CODES:
+            update_rate_limit(client, xform_name(operation.name), throttled=True)
+
+    client.meta.events.register_first("needs-retry", record_throttle, unique_id=RATE_LIMIT_LISTENER_ID)
+
+
+def rate_limited_call(client: BaseClient, operation: str, **kwargs: Any) -> Any:
+    """Call a client operation through its token bucket, retrying throttling errors at the reduced rate.
+
+    Args:
+        client: boto3 client
+        operation: Client method name
+        kwargs: Operation parameters
+
+    Raises:
+        ClientError: botocore ClientError
+
+    Returns:
+        Operation response
+    """
+    register_throttle_listener(client)
+    throttle_retries = 0
+    while True:
+        acquire_rate_limit_token(client, operation)
+        try:
+            response = getattr(client, operation)(**kwargs)
+        except ClientError as error:
+            if not is_throttling_error(error):
+                raise
+            if throttle_retries >= RATE_LIMIT_MAX_THROTTLE_RETRIES:
+                raise
+            throttle_retries += 1
+            continue
+        update_rate_limit(client, operation, throttled=False)
+        return response
+
+
+def get_pagination_tokens(client: BaseClient, operation: str) -> tuple:
+    """Get the pagination token names and more results expression for a client operation from the botocore paginator model.
+
+    Args:
+        client: boto3 client
+        operation: Client method name
+
+    Returns:
+        (input tokens, output tokens, more results) tuple
+    """
+    service_model = client.meta.service_model
+    paginator_model = BOTOCORE_SESSION.get_paginator_model(service_model.service_name, service_model.api_version)
+    paginator_config = paginator_model.get_paginator(client.meta.method_to_api_mapping[operation])
+    input_tokens = paginator_config["input_token"]
+    output_tokens = paginator_config["output_token"]
+    return (
+        input_tokens if isinstance(input_tokens, list) else [input_tokens],
+        output_tokens if isinstance(output_tokens, list) else [output_tokens],
+        paginator_config.get("more_results"),
+    )
+
+
+def rate_limited_paginate(client: BaseClient, operation: str, **kwargs: Any) -> Iterator[Any]:
+    """Paginate a client operation, fetching each page through its token bucket and retrying throttled pages at the reduced rate.
+
+    Args:
+        client: boto3 client
+        operation: Client method name
+        kwargs: Operation parameters
+
+    Yields:
+        Response pages
+    """
+    input_tokens, output_tokens, more_results = get_pagination_tokens(client, operation)
+    page_kwargs = dict(kwargs)
+    while True:
+        page = rate_limited_call(client, operation, **page_kwargs)
+        yield page
+        if more_results and not jmespath.search(more_results, page):
+            return
+        next_tokens = [jmespath.search(output_token, page) or None for output_token in output_tokens]  # Empty tokens end pagination
+        if all(next_token is None for next_token in next_tokens):
+            return
+        page_kwargs.update(zip(input_tokens, next_tokens))
@@ -11,8 +11,9 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from time import sleep
-from typing import TYPE_CHECKING, Literal, Union
+from typing import TYPE_CHECKING, Dict, Literal, Union
 
 import boto3
 import common
@@ -31,6 +32,9 @@ LOGGER = logging.getLogger("sra")
 # Global variables
 SERVICE_NAME = "macie.amazonaws.com"
 SLEEP_SECONDS = 30
+REGION_MAX_WORKERS = 8
+MEMBER_MAX_WORKERS = 5  # Member creation is also paced by the macie2 CreateMember token bucket
+MEMBER_RETRY_SLEEP_SECONDS = 10
 UNEXPECTED = "Unexpected!"
 BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "standard"})
 
@@ -87,27 +91,92 @@ def process_organization_admin_account(admin_account_id: str, regions: list) ->
             LOGGER.info(f"Delegated admin '{admin_account_id}' enabled in {region}")
 
 
-def create_members(macie2_client: Macie2Client, accounts: list) -> None:
-    """Create members with existing accounts.
+def create_member(macie2_client: Macie2Client, account: dict) -> None:
+    """Create a member with an existing account.
+
+    Args:
+        macie2_client: Macie2Client
+        account: Existing AWS account
+    """
+    create_member_response = common.rate_limited_call(
+        macie2_client, "create_member", account={"accountId": account["AccountId"], "email": account["Email"]}
+    )
+    api_call_details = {"API_Call": "macie2:CreateMember", "API_Response": create_member_response}
+    LOGGER.info(api_call_details)
+
+
+def create_member_batch(macie2_client: Macie2Client, accounts: list, max_workers: int) -> list:
+    """Create members concurrently.
+
+    Args:
+        macie2_client: Macie2Client
+        accounts: Existing AWS accounts
+        max_workers: Maximum number of members created at the same time
+
+    Returns:
+        Accounts that could not be added as members
+    """
+    failed_accounts = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(create_member, macie2_client, account): account for account in accounts}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except ClientError as error:
+                LOGGER.info(f"Error creating member {futures[future]['AccountId']} - {error}")
+                failed_accounts.append(futures[future])
+    return failed_accounts
+
+
+def create_members(macie2_client: Macie2Client, accounts: list, max_workers: int = MEMBER_MAX_WORKERS) -> None:
+    """Create members with the existing accounts that are not members yet.
 
     Args:
         macie2_client: Macie2Client
         accounts: Existing AWS accounts
+        max_workers: Maximum number of members created at the same time
+
+    Raises:
+        ValueError: Members could not be created
     """
     LOGGER.info("...Creating members")
-    for account in accounts:
-        try:
-            create_member_response = macie2_client.create_member(account={"accountId": account["AccountId"], "email": account["Email"]})
-            api_call_details = {"API_Call": "macie2:CreateMember", "API_Response": create_member_response}
-            LOGGER.info(api_call_details)
-            sleep(1)  # Sleeping 1 second to avoid max API call error
-        except ClientError as error:
-            LOGGER.info(f"Error creating member {account['AccountId']} - {error}")
-            LOGGER.info("...Waiting 10 seconds to try adding member again.")
-            sleep(10)  # Wait for delegated admin to get configured
-            create_member_response = macie2_client.create_member(account={"accountId": account["AccountId"], "email": account["Email"]})
-            api_call_details = {"API_Call": "macie2:CreateMember", "API_Response": create_member_response}
-            LOGGER.info(api_call_details)
+    member_account_ids = set(get_enabled_members(macie2_client))
+    missing_accounts = [account for account in accounts if account["AccountId"] not in member_account_ids]
+    LOGGER.info(f"{len(accounts) - len(missing_accounts)} accounts are already enabled members, creating {len(missing_accounts)} members")
+
+    failed_accounts = create_member_batch(macie2_client, missing_accounts, max_workers)
+    if failed_accounts:
+        LOGGER.info(f"...Waiting {MEMBER_RETRY_SLEEP_SECONDS} seconds to try adding {len(failed_accounts)} members again.")
+        sleep(MEMBER_RETRY_SLEEP_SECONDS)  # Wait for delegated admin to get configured
+        failed_accounts = create_member_batch(macie2_client, failed_accounts, max_workers)
+    if failed_accounts:
+        raise ValueError(f"Error creating members: {', '.join(sorted(account['AccountId'] for account in failed_accounts))}")
+
+
+def configure_macie_in_region(
+    regional_client: Macie2Client,
+    accounts: list,
+    s3_bucket_name: str,
+    kms_key_arn: str,
+    finding_publishing_frequency: Union[Literal["FIFTEEN_MINUTES"], Literal["ONE_HOUR"], Literal["SIX_HOURS"]],
+) -> None:
+    """Configure Macie in a single region.
+
+    Args:
+        regional_client: Macie2Client for the region
+        accounts: Existing AWS accounts
+        s3_bucket_name: S3 Bucket Name
+        kms_key_arn: KMS Key ARN
+        finding_publishing_frequency: Finding Publishing Frequency
+    """
+    regional_client.update_macie_session(findingPublishingFrequency=finding_publishing_frequency, status="ENABLED")
+    regional_client.put_classification_export_configuration(configuration={"s3Destination": {"bucketName": s3_bucket_name, "kmsKeyArn": kms_key_arn}})
+
+    # Create members for existing Organization accounts
+    create_members(regional_client, accounts)
+
+    # Update Organization configuration to automatically enable new accounts
+    regional_client.update_organization_configuration(autoEnable=True)
 
 
 def configure_macie(
@@ -117,6 +186,7 @@ def configure_macie(
     s3_bucket_name: str,
     kms_key_arn: str,
     finding_publishing_frequency: Union[Literal["FIFTEEN_MINUTES"], Literal["ONE_HOUR"], Literal["SIX_HOURS"]],
+    max_workers: int = REGION_MAX_WORKERS,
 ) -> None:
     """Configure Macie with provided parameters.
 
@@ -127,26 +197,35 @@ def configure_macie(
         s3_bucket_name: S3 Bucket Name
         kms_key_arn: KMS Key ARN
         finding_publishing_frequency: Finding Publishing Frequency
+        max_workers: Maximum number of regions configured at the same time
+
+    Raises:
+        ValueError: Macie configuration failed in one or more regions
     """
     accounts = common.get_all_organization_accounts([delegated_account_id])
+    LOGGER.info(f"Existing Accounts: {accounts}")
 
     LOGGER.info(f"...Waiting {SLEEP_SECONDS} seconds for the delegated admin to get configured.")
     sleep(SLEEP_SECONDS)  # Wait for delegated admin to get configured
 
-    # Loop through the regions and enable Macie
-    for region in regions:
-        regional_client: Macie2Client = session.client("macie2", region_name=region, config=BOTO3_CONFIG)
-        regional_client.update_macie_session(findingPublishingFrequency=finding_publishing_frequency, status="ENABLED")
-        regional_client.put_classification_export_configuration(
-            configuration={"s3Destination": {"bucketName": s3_bucket_name, "kmsKeyArn": kms_key_arn}}
-        )
+    regional_clients: Dict[str, Macie2Client] = {region: session.client("macie2", region_name=region, config=BOTO3_CONFIG) for region in regions}
 
-        # Create members for existing Organization accounts
-        LOGGER.info(f"Existing Accounts: {accounts}")
-        create_members(regional_client, accounts)
+    failed_regions: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(configure_macie_in_region, regional_client, accounts, s3_bucket_name, kms_key_arn, finding_publishing_frequency): region
+            for region, regional_client in regional_clients.items()
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as error:
+                LOGGER.exception(f"Failed to configure Macie in {futures[future]}")
+                failed_regions[futures[future]] = str(error)
 
-        # Update Organization configuration to automatically enable new accounts
-        regional_client.update_organization_configuration(autoEnable=True)
+    if failed_regions:
+        LOGGER.error({"Configure Macie failed regions": failed_regions})
+        raise ValueError(f"Macie configuration failed in regions: {', '.join(sorted(failed_regions))}")
 
 
 def enable_macie(
@@ -172,10 +251,11 @@ def enable_macie(
     for region in regions:
         regional_client: Macie2Client = account_session.client("macie2", region_name=region, config=BOTO3_CONFIG)
         try:
-            enable_macie_response = regional_client.enable_macie(findingPublishingFrequency=finding_publishing_frequency, status="ENABLED")
+            enable_macie_response = common.rate_limited_call(
+                regional_client, "enable_macie", findingPublishingFrequency=finding_publishing_frequency, status="ENABLED"
+            )
             api_call_details = {"API_Call": "macie2:EnableMacie", "API_Response": enable_macie_response}
             LOGGER.info(api_call_details)
-            sleep(0.2)  # Sleeping .2 second to avoid max API call error
         except regional_client.exceptions.ConflictException:
             LOGGER.info(f"Macie already enabled in {region}.")
 
@@ -275,9 +355,7 @@ def get_associated_members(macie2_client: Macie2Client) -> list:
     """
     account_ids = []
     try:
-        paginator = macie2_client.get_paginator("list_members")
-
-        for page in paginator.paginate(onlyAssociated="false"):
+        for page in common.rate_limited_paginate(macie2_client, "list_members", onlyAssociated="false"):
             for member in page["members"]:
                 account_ids.append(member["accountId"])
     except macie2_client.exceptions.AccessDeniedException:
@@ -286,6 +364,26 @@ def get_associated_members(macie2_client: Macie2Client) -> list:
     return account_ids
 
 
+def get_enabled_members(macie2_client: Macie2Client) -> list:
+    """Get Macie members with an Enabled relationship status.
+
+    Members that are Removed, Resigned, Paused or otherwise not enabled are excluded so they get associated again.
+
+    Args:
+        macie2_client: Macie2Client
+
+    Returns:
+        account_ids
+    """
+    account_ids = []
+    for page in common.rate_limited_paginate(macie2_client, "list_members", onlyAssociated="false"):
+        for member in page["members"]:
+            if member["relationshipStatus"] == "Enabled":
+                account_ids.append(member["accountId"])
+
+    return account_ids
+
+
 def deregister_delegated_administrator(delegated_admin_account_id: str, service_principal: str = SERVICE_NAME) -> None:
     """Deregister the delegated administrator account for the provided service principal within AWS Organizations.
 
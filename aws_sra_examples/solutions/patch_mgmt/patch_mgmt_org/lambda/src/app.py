@@ -13,6 +13,9 @@ from __future__ import annotations
 import logging
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from time import monotonic, sleep
 from typing import TYPE_CHECKING, Any, Dict, List
 
 import boto3
@@ -43,6 +46,14 @@ helper = CfnResource(json_logging=True, log_level=log_level, boto_level="CRITICA
 # Global variables
 UNEXPECTED = "Unexpected!"
 boto3_config = Config(retries={"max_attempts": 10, "mode": "standard"})
+ACCOUNT_REGION_MAX_WORKERS = 10  # Account/region pairs provisioned at the same time
+ACCOUNT_REGION_MAX_ATTEMPTS = 2  # Failed account/region pairs are rolled back and retried once
+ACCOUNT_REGION_RETRY_SLEEP_SECONDS = 10
+WINDOW_NUMBERS = (1, 2, 3)
+MAINTENANCE_WINDOW_PAGE_SIZE = 100  # Max page size for describe_maintenance_windows
+DOCUMENT_HASH_CACHE_TTL_SECONDS = 900  # Reuse AWS-owned document hashes across accounts and warm invocations
+DOCUMENT_HASH_CACHE_LOCK = threading.Lock()
+DOCUMENT_HASH_CACHE: dict = {}  # (document name, region) -> (describe time, document hash)
 
 
 def get_account_id() -> str:
@@ -57,7 +68,9 @@ def get_account_id() -> str:
 
 def get_document_hash(session: boto3.Session, region: str, document_name: str) -> str:
     """
-    Get the latest document hash for a given document name and region.
+    Get the latest document hash for a given document name and region, calling DescribeDocument once per cache period.
+
+    The run command documents are AWS-owned, so the hash in a region is the same in every account.
 
     Args:
         session (boto3.session.Session): The AWS session object
@@ -67,9 +80,37 @@ def get_document_hash(session: boto3.Session, region: str, document_name: str) -
     Returns:
         str: The latest document hash
     """
+    cache_key = (document_name, region)
+    with DOCUMENT_HASH_CACHE_LOCK:
+        cached_hash = DOCUMENT_HASH_CACHE.get(cache_key)
+    if cached_hash and monotonic() - cached_hash[0] < DOCUMENT_HASH_CACHE_TTL_SECONDS:
+        return cached_hash[1]
+
     ssm_client = session.client("ssm", region_name=region, config=boto3_config)
     response = ssm_client.describe_document(Name=document_name)
-    return response["Document"]["Hash"]
+    document_hash = response["Document"]["Hash"]
+    with DOCUMENT_HASH_CACHE_LOCK:
+        DOCUMENT_HASH_CACHE[cache_key] = (monotonic(), document_hash)
+    return document_hash
+
+
+def get_maintenance_window_index(ssmclient: SSMClient, window_names: list) -> Dict[str, str]:
+    """Get the IDs of the named maintenance windows in a region with a single paginated DescribeMaintenanceWindows call.
+
+    Args:
+        ssmclient (SSMClient): AWS Systems Manager client
+        window_names (list): Maintenance window names
+
+    Returns:
+        Dict[str, str]: Maintenance window ID keyed by window name, for the windows that exist
+    """
+    window_index: Dict[str, str] = {}
+    paginator = ssmclient.get_paginator("describe_maintenance_windows")
+    for page in paginator.paginate(Filters=[{"Key": "Name", "Values": window_names}], PaginationConfig={"PageSize": MAINTENANCE_WINDOW_PAGE_SIZE}):
+        for window in page["WindowIdentities"]:
+            if window["Name"] in window_names and window["Name"] not in window_index:
+                window_index[window["Name"]] = window["WindowId"]
+    return window_index
 
 
 def create_maintenance_window_1(account_id: str, session: boto3.Session, region: str, params: dict) -> dict:
@@ -210,36 +251,6 @@ def create_maintenance_window_3(account_id: str, session: boto3.Session, region:
     }
 
 
-def create_maint_window(params: dict, account_id: str, regions: list) -> dict:
-    """Create all maintenance windows in all regions in an account.
-
-    Args:
-        params (dict): Parameters
-        account_id (str): Account ID
-        regions (list): Regions to do this in
-
-    Returns:
-        dict: Maintenance Info Created
-    """
-    session = common.assume_role(
-        params["ROLE_NAME_TO_ASSUME"],
-        "sra-patch-mgmt-lambda",
-        account_id,
-    )
-
-    window1_ids = []
-    window2_ids = []
-    window3_ids = []
-
-    for region in regions:
-        LOGGER.info(f"Creating Maintenance Windows in {account_id} account {region} region")
-        window1_ids.append(create_maintenance_window_1(account_id, session, region, params))
-        window2_ids.append(create_maintenance_window_2(account_id, session, region, params))
-        window3_ids.append(create_maintenance_window_3(account_id, session, region, params))
-
-    return {"window1_ids": window1_ids, "window2_ids": window2_ids, "window3_ids": window3_ids}
-
-
 def define_mw_targets(params: dict, win1_id_resp: list, win2_id_resp: list, win3_id_resp: list, account_id: str) -> dict[str, list]:
     """Define Maintenance Window Targets.
 
@@ -573,6 +584,148 @@ def def_mw_tasks(
     }
 
 
+def delete_maintenance_windows(session: boto3.Session, region: str, window_ids: list) -> None:
+    """Delete maintenance windows, along with their targets and tasks, to roll back a partially provisioned region.
+
+    Args:
+        session (boto3.Session): Boto3 Session
+        region (str): Region
+        window_ids (list): Maintenance window IDs to delete
+    """
+    ssmclient = session.client("ssm", region_name=region, config=boto3_config)
+    for window_id in window_ids:
+        try:
+            ssmclient.delete_maintenance_window(WindowId=window_id)
+            LOGGER.info(f"Rolled back maintenance window {window_id} in {region}")
+        except Exception:
+            LOGGER.exception(f"Unable to roll back maintenance window {window_id} in {region}")
+
+
+def provision_account_region(params: dict, account_id: str, region: str) -> dict:
+    """Create the maintenance windows, targets, and tasks in a single account and region.
+
+    Windows created before a failure are deleted so the account/region pair can be retried without leaving duplicates.
+
+    Args:
+        params (dict): Cloudformation Params
+        account_id (str): Account ID
+        region (str): Region
+
+    Returns:
+        dict: Window IDs, Targets, and Tasks created in the region
+    """
+    session = common.assume_role(
+        params["ROLE_NAME_TO_ASSUME"],
+        "sra-patch-mgmt-lambda",
+        account_id,
+    )
+    create_functions = {1: create_maintenance_window_1, 2: create_maintenance_window_2, 3: create_maintenance_window_3}
+    window_id_response: dict = {f"window{window_num}_ids": [] for window_num in WINDOW_NUMBERS}
+    try:
+        LOGGER.info(f"Creating Maintenance Windows in {account_id} account {region} region")
+        for window_num in WINDOW_NUMBERS:
+            window_id_response[f"window{window_num}_ids"].append(create_functions[window_num](account_id, session, region, params))
+        window_target_response = define_mw_targets(
+            params,
+            window_id_response["window1_ids"],
+            window_id_response["window2_ids"],
+            window_id_response["window3_ids"],
+            account_id,
+        )
+        window_task_response = def_mw_tasks(params, window_id_response, window_target_response, account_id)
+    except Exception:
+        created_window_ids = [
+            window[f"window{window_num}Id"] for window_num in WINDOW_NUMBERS for window in window_id_response[f"window{window_num}_ids"]
+        ]
+        delete_maintenance_windows(session, region, created_window_ids)
+        raise
+    return {"window_ids": window_id_response, "window_targets": window_target_response, "window_tasks": window_task_response}
+
+
+def aggregate_window_results(results: dict, account_ids: list, regions: list) -> Dict:
+    """Merge the per account/region results into the per account window, target, and task lists.
+
+    Args:
+        results (dict): Results from provision_account_region keyed by (account ID, region)
+        account_ids (list): Account IDs in the order they are reported
+        regions (list): Regions in the order they are reported
+
+    Returns:
+        Dict: Dictionary of Window IDs, Targets, and Tasks
+    """
+    all_window_ids: list = []
+    all_window_targets: list = []
+    all_window_tasks: list = []
+    for account_id in account_ids:
+        account_results = [results[(account_id, region)] for region in regions if (account_id, region) in results]
+        if regions and not account_results:
+            continue
+        for window_num in WINDOW_NUMBERS:
+            all_window_ids.append([window for result in account_results for window in result["window_ids"][f"window{window_num}_ids"]])
+        all_window_targets.append(
+            {
+                f"window{window_num}_targets": [
+                    target for result in account_results for target in result["window_targets"][f"window{window_num}_targets"]
+                ]
+                for window_num in WINDOW_NUMBERS
+            }
+        )
+        all_window_tasks.append(
+            {
+                f"window{window_num}_tasks": [task for result in account_results for task in result["window_tasks"][f"window{window_num}_tasks"]]
+                for window_num in WINDOW_NUMBERS
+            }
+        )
+    return {"window_ids": all_window_ids, "window_targets": all_window_targets, "window_tasks": all_window_tasks}
+
+
+def provision_maintenance_windows(params: dict, account_ids: list, regions: list, max_workers: int = ACCOUNT_REGION_MAX_WORKERS) -> Dict:
+    """Create the maintenance windows, targets, and tasks in all accounts and regions concurrently.
+
+    Each account/region pair is provisioned independently, so a failure in one pair does not stop the others.
+    Failed pairs are retried after a short sleep.
+
+    Args:
+        params (dict): Cloudformation Params
+        account_ids (list): Account IDs
+        regions (list): Regions to perform our work in.
+        max_workers (int): Maximum number of account/region pairs provisioned at the same time
+
+    Raises:
+        ValueError: One or more account/region pairs failed on every attempt
+
+    Returns:
+        Dict: Dictionary of Window IDs, Targets, and Tasks
+    """
+    results: dict = {}
+    pending = [(account_id, region) for account_id in account_ids for region in regions]
+    attempt = 0
+    while pending and attempt < ACCOUNT_REGION_MAX_ATTEMPTS:
+        attempt += 1
+        if attempt > 1:
+            LOGGER.info({"Retrying_Account_Regions": pending, "Attempt": attempt})
+            sleep(ACCOUNT_REGION_RETRY_SLEEP_SECONDS)
+        failed: list = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            futures = {executor.submit(provision_account_region, params, account_id, region): (account_id, region) for account_id, region in pending}
+            for future in as_completed(futures):
+                account_id, region = futures[future]
+                try:
+                    results[(account_id, region)] = future.result()
+                    LOGGER.info({"Checkpoint": "Maintenance Windows", "Account": account_id, "Region": region, "Status": "COMPLETED"})
+                except Exception:
+                    LOGGER.exception(f"Maintenance window provisioning failed in {account_id} account {region} region")
+                    failed.append((account_id, region))
+        pending = failed
+
+    window_results = aggregate_window_results(results, account_ids, regions)
+    LOGGER.debug(window_results)
+    if pending:
+        failed_pairs = ", ".join(f"{account_id}/{region}" for account_id, region in sorted(pending))
+        raise ValueError(f"Maintenance window provisioning failed in account/regions: {failed_pairs}")
+    return window_results
+
+
 def parameter_pattern_validator(parameter_name: str, parameter_value: str, pattern: str) -> None:
     """Validate CloudFormation Custom Resource Parameters.
 
@@ -601,25 +754,11 @@ def process_create_update_event(params: dict, regions: list) -> Dict:
         Dict: Dictionary of Window IDs, Targets, and Tasks
     """
     account_ids = common.get_account_ids([], params["DELEGATED_ADMIN_ACCOUNT_ID"])
-    all_window_ids = []
-    all_window_targets = []
-    all_window_tasks = []
     if (params.get("DISABLE_PATCHMGMT", "false")).lower() in "true" and params["action"] == "Update":
         LOGGER.info("Deleting Maintenance Windows and Default Host Management Configuration...")
         patchmgmt.disable_patchmgmt(params, boto3_config)
-
-    else:
-        for account_id in account_ids:
-            window_ids_raw = create_maint_window(params, account_id, regions)
-            all_window_ids.append(window_ids_raw["window1_ids"])
-            all_window_ids.append(window_ids_raw["window2_ids"])
-            all_window_ids.append(window_ids_raw["window3_ids"])
-            window_target_response = define_mw_targets(
-                params, window_ids_raw["window1_ids"], window_ids_raw["window2_ids"], window_ids_raw["window3_ids"], account_id
-            )
-            all_window_targets.append(window_target_response)
-            all_window_tasks.append(def_mw_tasks(params, window_ids_raw, window_target_response, account_id))
-    return {"window_ids": all_window_ids, "window_targets": all_window_targets, "window_tasks": all_window_tasks}
+        return {"window_ids": [], "window_targets": [], "window_tasks": []}
+    return provision_maintenance_windows(params, account_ids, regions)
 
 
 def process_account(account_id: str, params: dict, regions: list) -> Dict:
@@ -633,20 +772,7 @@ def process_account(account_id: str, params: dict, regions: list) -> Dict:
     Returns:
         Dict: Dictionary of Window IDs, Targets, and Tasks
     """
-    all_window_ids = []
-    all_window_targets = []
-    all_window_tasks = []
-
-    window_ids_raw = create_maint_window(params, account_id, regions)
-    all_window_ids.append(window_ids_raw["window1_ids"])
-    all_window_ids.append(window_ids_raw["window2_ids"])
-    all_window_ids.append(window_ids_raw["window3_ids"])
-    window_target_response = define_mw_targets(
-        params, window_ids_raw["window1_ids"], window_ids_raw["window2_ids"], window_ids_raw["window3_ids"], account_id
-    )
-    all_window_targets.append(window_target_response)
-    all_window_tasks.append(def_mw_tasks(params, window_ids_raw, window_target_response, account_id))
-    return {"window_ids": all_window_ids, "window_targets": all_window_targets, "window_tasks": all_window_tasks}
+    return provision_maintenance_windows(params, [account_id], regions)
 
 
 def check_and_update_maintenance_window(params: dict, regions: list, account_id: str) -> None:
@@ -663,40 +789,22 @@ def check_and_update_maintenance_window(params: dict, regions: list, account_id:
         "sra-patch-mgmt-lambda",
         account_id,
     )
+    window_prefixes = {params[f"MAINTENANCE_WINDOW{window_num}_NAME"]: f"MAINTENANCE_WINDOW{window_num}" for window_num in WINDOW_NUMBERS}
     for region in regions:
         ssmclient = session.client("ssm", region_name=region, config=boto3_config)
-
-        # Check if Window 1 exists
-        window1_name = params["MAINTENANCE_WINDOW1_NAME"]
-        existing_window1 = ssmclient.describe_maintenance_windows(Filters=[{"Key": "Name", "Values": [window1_name]}])
-        if existing_window1["WindowIdentities"]:
-            window1_id = existing_window1["WindowIdentities"][0]["WindowId"]
-            LOGGER.info(f"Maintenance window '{window1_name}' already exists in {account_id}/{region} with ID {window1_id}. Updating...")
-            update_maintenance_window(ssmclient, window1_id, params, "MAINTENANCE_WINDOW1")
-        else:
-            LOGGER.info(f"Maintenance window '{window1_name}' does not exist in {account_id}/{region}. Creating...")
-            process_account(account_id, params, [region])
-
-        # Check if Window 2 exists
-        window2_name = params["MAINTENANCE_WINDOW2_NAME"]
-        existing_window2 = ssmclient.describe_maintenance_windows(Filters=[{"Key": "Name", "Values": [window2_name]}])
-        if existing_window2["WindowIdentities"]:
-            window2_id = existing_window2["WindowIdentities"][0]["WindowId"]
-            LOGGER.info(f"Maintenance window '{window2_name}' already exists in {account_id}/{region} with ID {window2_id}. Updating...")
-            update_maintenance_window(ssmclient, window2_id, params, "MAINTENANCE_WINDOW2")
-        else:
-            LOGGER.info(f"Maintenance window '{window2_name}' does not exist in {account_id}/{region}. Creating...")
-            process_account(account_id, params, [region])
-
-        # Check if Window 3 exists
-        window3_name = params["MAINTENANCE_WINDOW3_NAME"]
-        existing_window3 = ssmclient.describe_maintenance_windows(Filters=[{"Key": "Name", "Values": [window3_name]}])
-        if existing_window3["WindowIdentities"]:
-            window3_id = existing_window3["WindowIdentities"][0]["WindowId"]
-            LOGGER.info(f"Maintenance window '{window3_name}' already exists in {account_id}/{region} with ID {window3_id}. Updating...")
-            update_maintenance_window(ssmclient, window3_id, params, "MAINTENANCE_WINDOW3")
-        else:
-            LOGGER.info(f"Maintenance window '{window3_name}' does not exist in {account_id}/{region}. Creating...")
+        window_index = get_maintenance_window_index(ssmclient, list(window_prefixes))
+
+        missing_windows = []
+        for window_name, window_prefix in window_prefixes.items():
+            if window_name in window_index:
+                window_id = window_index[window_name]
+                LOGGER.info(f"Maintenance window '{window_name}' already exists in {account_id}/{region} with ID {window_id}. Updating...")
+                update_maintenance_window(ssmclient, window_id, params, window_prefix)
+            else:
+                LOGGER.info(f"Maintenance window '{window_name}' does not exist in {account_id}/{region}. Creating...")
+                missing_windows.append(window_name)
+
+        if missing_windows:
             process_account(account_id, params, [region])
 
 
@@ -891,10 +999,12 @@ def process_event_organizations(event: dict) -> None:
         for party in event["detail"]["responseElements"]["handshake"]["parties"]:
             if party["type"] == "ACCOUNT":
                 aws_account_id = party["id"]
+                common.update_organization_account_inventory(aws_account_id)
                 process_account(aws_account_id, params, regions)
                 break
     elif event["detail"]["eventName"] == "CreateAccountResult":
         aws_account_id = event["detail"]["serviceEventDetails"]["createAccountStatus"]["accountId"]
+        common.update_organization_account_inventory(aws_account_id)
         process_account(aws_account_id, params, regions)
     else:
         LOGGER.info("Organization event does not match expected values.")
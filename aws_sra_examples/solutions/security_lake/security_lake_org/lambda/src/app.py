@@ -12,7 +12,8 @@ from __future__ import annotations
 import logging
 import os
 import re
-from typing import TYPE_CHECKING, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Callable
 
 import boto3
 import common
@@ -43,6 +44,7 @@ HOME_REGION = ssm.get_home_region()
 AUDIT_ACCT_ID = ssm.get_security_acct()
 AWS_LOG_SOURCES = ["ROUTE53", "VPC_FLOW", "SH_FINDINGS", "CLOUD_TRAIL_MGMT", "LAMBDA_EXECUTION", "S3_DATA", "EKS_AUDIT", "WAF"]
 CLOUDFORMATION_PAGE_SIZE = 20
+REGION_MAX_WORKERS = 8
 
 try:
     MANAGEMENT_ACCOUNT_SESSION = boto3.Session()
@@ -68,15 +70,11 @@ def process_add_event(params: dict, regions: list, accounts: dict) -> None:
 
     if params["action"] in ["Add"]:
         enable_and_configure_security_lake(params, regions, accounts)
-        for region in regions:
-            delegated_admin_session = common.assume_role(
-                params["CONFIGURATION_ROLE_NAME"], "sra-process-audit-acct-subscriber", params["DELEGATED_ADMIN_ACCOUNT_ID"]
-            )
-            sl_client = delegated_admin_session.client("securitylake", region)
-            if params["SET_AUDIT_ACCT_DATA_SUBSCRIBER"]:
-                add_audit_acct_data_subscriber(sl_client, params, region)
-            if params["SET_AUDIT_ACCT_QUERY_SUBSCRIBER"]:
-                add_audit_acct_query_subscriber(sl_client, params, region)
+        delegated_admin_session = common.assume_role(
+            params["CONFIGURATION_ROLE_NAME"], "sra-process-audit-acct-subscriber", params["DELEGATED_ADMIN_ACCOUNT_ID"]
+        )
+        sl_clients = get_regional_clients(delegated_admin_session, "securitylake", regions)
+        process_regions("Add audit account subscribers", regions, lambda region: add_audit_acct_subscribers(sl_clients[region], params, region))
 
         if params["SET_AUDIT_ACCT_QUERY_SUBSCRIBER"] and params["CREATE_RESOURCE_LINK"]:
             configure_audit_acct_for_query_access(params, regions)
@@ -282,9 +280,56 @@ def enable_and_configure_security_lake(params: dict, regions: list, accounts: di
     security_lake.register_delegated_admin(params["DELEGATED_ADMIN_ACCOUNT_ID"], HOME_REGION, SERVICE_NAME)
     provision_security_lake(params, regions)
     add_log_sources(params, regions, accounts)
-    for region in regions:
-        key_id = f'alias/{params["KEY_ALIAS"]}-{region}'
-        security_lake.encrypt_sqs_queues(params["CONFIGURATION_ROLE_NAME"], params["DELEGATED_ADMIN_ACCOUNT_ID"], region, key_id)
+    process_regions(
+        "Encrypt SQS queues",
+        regions,
+        lambda region: security_lake.encrypt_sqs_queues(
+            params["CONFIGURATION_ROLE_NAME"], params["DELEGATED_ADMIN_ACCOUNT_ID"], region, f'alias/{params["KEY_ALIAS"]}-{region}'
+        ),
+    )
+
+
+def get_regional_clients(session: boto3.Session, service_name: str, regions: list) -> dict:
+    """Create a client for each region from one session, before any regional work is started.
+
+    Args:
+        session: boto3 session
+        service_name: AWS service name
+        regions: AWS regions
+
+    Returns:
+        region -> boto3 client
+    """
+    return {region: session.client(service_name, region, config=BOTO3_CONFIG) for region in regions}  # type: ignore
+
+
+def process_regions(action: str, regions: list, regional_action: Callable[[str], None], max_workers: int = REGION_MAX_WORKERS) -> None:
+    """Run a regional action in all regions concurrently, logging a checkpoint as each region completes.
+
+    Args:
+        action: Action name used in the checkpoint logs
+        regions: AWS regions
+        regional_action: Callable run with each region
+        max_workers: Maximum number of regions processed at the same time
+
+    Raises:
+        ValueError: The action failed in one or more regions
+    """
+    failed_regions: dict = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(regional_action, region): region for region in regions}
+        for future in as_completed(futures):
+            region = futures[future]
+            try:
+                future.result()
+                LOGGER.info({"Checkpoint": action, "Region": region, "Status": "COMPLETED"})
+            except Exception as error:
+                LOGGER.exception(f"{action} failed in {region}")
+                failed_regions[region] = str(error)
+
+    if failed_regions:
+        LOGGER.error({"Checkpoint": action, "Failed_Regions": failed_regions})
+        raise ValueError(f"{action} failed in regions: {', '.join(sorted(failed_regions))}")
 
 
 def provision_security_lake(params: dict, regions: list) -> None:
@@ -318,28 +363,39 @@ def update_security_lake(params: dict, regions: list) -> None:
         params: parameters
         regions: AWS regions
     """
-    for region in regions:
-        delegated_admin_session = common.assume_role(
-            params["CONFIGURATION_ROLE_NAME"],
-            "sra-update-security-lake",
-            params["DELEGATED_ADMIN_ACCOUNT_ID"],
-        )
-        sl_client = delegated_admin_session.client("securitylake", region)
-        LOGGER.info(f"Checking if Security Lake is enabled in {region} region...")
+    delegated_admin_session = common.assume_role(
+        params["CONFIGURATION_ROLE_NAME"],
+        "sra-update-security-lake",
+        params["DELEGATED_ADMIN_ACCOUNT_ID"],
+    )
+    sl_clients = get_regional_clients(delegated_admin_session, "securitylake", regions)
+    sl_client = delegated_admin_session.client("securitylake", HOME_REGION)
+    process_regions("Update Security Lake", regions, lambda region: update_security_lake_in_region(sl_clients[region], params, region))
+    process_org_configuration(sl_client, params["SET_ORG_CONFIGURATION"], params["ORG_CONFIGURATION_SOURCES"], regions, params["SOURCE_VERSION"])
+
+
+def update_security_lake_in_region(sl_client: SecurityLakeClient, params: dict, region: str) -> None:
+    """Enable Security Lake in a region where it is not enabled yet.
+
+    Args:
+        sl_client: boto3 client
+        params: parameters
+        region: AWS region
+    """
+    LOGGER.info(f"Checking if Security Lake is enabled in {region} region...")
+    lake_exists = security_lake.check_data_lake_exists(sl_client, region)
+    if lake_exists:
+        LOGGER.info(f"Security Lake already enabled in {region} region.")
+    else:
+        LOGGER.info(f"Security Lake not found in {region} region. Enabling Security Lake...")
+        key_id = f'alias/{params["KEY_ALIAS"]}-{region}'
+        sl_configurations = [{"encryptionConfiguration": {"kmsKeyId": key_id}, "region": region}]
+        role_arn = f"arn:{PARTITION}:iam::{params['DELEGATED_ADMIN_ACCOUNT_ID']}:role/service-role/{params['META_STORE_MANAGER_ROLE_NAME']}"
+        security_lake.create_security_lake(sl_client, sl_configurations, role_arn)
         lake_exists = security_lake.check_data_lake_exists(sl_client, region)
         if lake_exists:
-            LOGGER.info(f"Security Lake already enabled in {region} region.")
-        else:
-            LOGGER.info(f"Security Lake not found in {region} region. Enabling Security Lake...")
-            key_id = f'alias/{params["KEY_ALIAS"]}-{region}'
-            sl_configurations = [{"encryptionConfiguration": {"kmsKeyId": key_id}, "region": region}]
-            role_arn = f"arn:{PARTITION}:iam::{params['DELEGATED_ADMIN_ACCOUNT_ID']}:role/service-role/{params['META_STORE_MANAGER_ROLE_NAME']}"
-            security_lake.create_security_lake(sl_client, sl_configurations, role_arn)
-            lake_exists = security_lake.check_data_lake_exists(sl_client, region)
-            if lake_exists:
-                LOGGER.info(f"Security Lake is enabled in {region}.")
-            security_lake.encrypt_sqs_queues(params["CONFIGURATION_ROLE_NAME"], params["DELEGATED_ADMIN_ACCOUNT_ID"], region, key_id)
-    process_org_configuration(sl_client, params["SET_ORG_CONFIGURATION"], params["ORG_CONFIGURATION_SOURCES"], regions, params["SOURCE_VERSION"])
+            LOGGER.info(f"Security Lake is enabled in {region}.")
+        security_lake.encrypt_sqs_queues(params["CONFIGURATION_ROLE_NAME"], params["DELEGATED_ADMIN_ACCOUNT_ID"], region, key_id)
 
 
 def process_org_configuration(
@@ -371,6 +427,25 @@ def process_org_configuration(
             LOGGER.info("Deleted Organization Configuration")
 
 
+def get_requested_log_sources(params: dict, org_accounts_ids: list) -> dict:
+    """Get the accounts requested for each AWS log and event source.
+
+    Args:
+        params: Configuration parameters
+        org_accounts_ids: AWS account IDs in the organization
+
+    Returns:
+        source name -> requested accounts, empty when the source is not requested
+    """
+    requested_log_sources: dict = {}
+    for log_source in AWS_LOG_SOURCES:
+        if params[log_source] == "ALL":
+            requested_log_sources[log_source] = org_accounts_ids
+        else:
+            requested_log_sources[log_source] = [account.strip() for account in params[log_source].split(",") if account.strip()]
+    return requested_log_sources
+
+
 def add_log_sources(params: dict, regions: list, org_accounts: dict) -> None:
     """Configure aws log sources.
 
@@ -379,17 +454,14 @@ def add_log_sources(params: dict, regions: list, org_accounts: dict) -> None:
         regions: A list of AWS regions.
         org_accounts: A list of AWS accounts.
     """
-    aws_log_sources = []
     org_accounts_ids = [account["AccountId"] for account in org_accounts]
     delegated_admin_session = common.assume_role(params["CONFIGURATION_ROLE_NAME"], "sra-add-log-sources", params["DELEGATED_ADMIN_ACCOUNT_ID"])
     sl_client = delegated_admin_session.client("securitylake", HOME_REGION)
-    for log_source in AWS_LOG_SOURCES:
-        if params[log_source] != "":
-            accounts = params[log_source].split(",") if params[log_source] != "ALL" else org_accounts_ids
-            configurations = {"accounts": accounts, "regions": regions, "sourceName": log_source, "sourceVersion": params["SOURCE_VERSION"]}
-            aws_log_sources.append(configurations)
-    if aws_log_sources:
-        security_lake.add_aws_log_source(sl_client, aws_log_sources)
+    requested_log_sources = {log_source: accounts for log_source, accounts in get_requested_log_sources(params, org_accounts_ids).items() if accounts}
+    configurations_to_create, _ = security_lake.plan_log_sources(
+        sl_client, requested_log_sources, org_accounts_ids, regions, params["SOURCE_VERSION"]
+    )
+    security_lake.apply_log_source_plan(sl_client, configurations_to_create, [])
     for region in regions:
         formatted_region = region.replace("-", "_")
         lf_client = delegated_admin_session.client("lakeformation", region)
@@ -411,17 +483,10 @@ def update_log_sources(params: dict, regions: list, org_accounts: dict) -> None:
     org_accounts_ids = [account["AccountId"] for account in org_accounts]
     delegated_admin_session = common.assume_role(params["CONFIGURATION_ROLE_NAME"], "sra-update-log-sources", params["DELEGATED_ADMIN_ACCOUNT_ID"])
     sl_client = delegated_admin_session.client("securitylake", HOME_REGION)
-    for log_source in AWS_LOG_SOURCES:
-        if params[log_source] != "":
-            accounts = params[log_source].split(",") if params[log_source] != "ALL" else org_accounts_ids
-            security_lake.update_aws_log_source(sl_client, regions, log_source, accounts, org_accounts_ids, params["SOURCE_VERSION"])
-        elif params[log_source] == "":
-            result = security_lake.check_log_source_enabled(sl_client, [], org_accounts_ids, regions, log_source, params["SOURCE_VERSION"])
-            accounts = list(result.accounts_to_disable)
-            if result.source_exists:
-                security_lake.delete_aws_log_source(sl_client, regions, log_source, accounts, params["SOURCE_VERSION"])
-        else:
-            LOGGER.info(f"Error reading value for {log_source} parameter")
+    configurations_to_create, configurations_to_delete = security_lake.plan_log_sources(
+        sl_client, get_requested_log_sources(params, org_accounts_ids), org_accounts_ids, regions, params["SOURCE_VERSION"]
+    )
+    security_lake.apply_log_source_plan(sl_client, configurations_to_create, configurations_to_delete)
 
 
 def update_audit_acct_data_subscriber(params: dict, regions: list) -> None:
@@ -431,28 +496,31 @@ def update_audit_acct_data_subscriber(params: dict, regions: list) -> None:
         params: parameters
         regions: AWS regions
     """
-    s3_access = "S3"
     sources = [source for source in AWS_LOG_SOURCES if params[source]]
     if sources == []:
         LOGGER.info("No log sources selected for data access subscriber. Skipping...")
     else:
-        for region in regions:
-            subscriber_name = params["AUDIT_ACCT_DATA_SUBSCRIBER"] + "-" + region
-            delegated_admin_session = common.assume_role(
-                params["CONFIGURATION_ROLE_NAME"], "sra-process-audit-acct-subscriber", params["DELEGATED_ADMIN_ACCOUNT_ID"]
-            )
-            sl_client = delegated_admin_session.client("securitylake", region, config=BOTO3_CONFIG)
-            subscriber_exists, subscriber_id, external_id = security_lake.check_subscriber_exists(sl_client, subscriber_name)
-            if subscriber_exists:
-                security_lake.update_subscriber(
-                    sl_client, subscriber_id, sources, external_id, AUDIT_ACCT_ID, subscriber_name, params["SOURCE_VERSION"]
-                )
-            else:
-                external_id = params["DATA_SUBSCRIBER_EXTERNAL_ID"]
-                LOGGER.info(f"Creating Audit account subscriber '{subscriber_name}' in {region} region...")
-                subscriber_id, _ = security_lake.create_subscribers(
-                    sl_client, s3_access, sources, external_id, AUDIT_ACCT_ID, subscriber_name, params["SOURCE_VERSION"]
-                )
+        delegated_admin_session = common.assume_role(
+            params["CONFIGURATION_ROLE_NAME"], "sra-process-audit-acct-subscriber", params["DELEGATED_ADMIN_ACCOUNT_ID"]
+        )
+        sl_clients = get_regional_clients(delegated_admin_session, "securitylake", regions)
+        process_regions(
+            "Update audit account data subscriber", regions, lambda region: add_audit_acct_data_subscriber(sl_clients[region], params, region)
+        )
+
+
+def add_audit_acct_subscribers(sl_client: SecurityLakeClient, params: dict, region: str) -> None:
+    """Configure the Audit (Security Tooling) account subscribers selected in the parameters.
+
+    Args:
+        sl_client: boto3 client
+        params: configuration parameters
+        region: AWS region
+    """
+    if params["SET_AUDIT_ACCT_DATA_SUBSCRIBER"]:
+        add_audit_acct_data_subscriber(sl_client, params, region)
+    if params["SET_AUDIT_ACCT_QUERY_SUBSCRIBER"]:
+        add_audit_acct_query_subscriber(sl_client, params, region)
 
 
 def add_audit_acct_data_subscriber(sl_client: SecurityLakeClient, params: dict, region: str) -> None:
@@ -486,39 +554,53 @@ def update_audit_acct_query_subscriber(params: dict, regions: list) -> None:
         params: parameters
         regions: AWS regions
     """
-    lakeformation_access = "LAKEFORMATION"
     sources = [source for source in AWS_LOG_SOURCES if params[source]]
     if sources == []:
         LOGGER.info("No log sources selected for query access subscriber. Skipping...")
     else:
-        for region in regions:
-            subscriber_name = params["AUDIT_ACCT_QUERY_SUBSCRIBER"] + "-" + region
-            delegated_admin_session = common.assume_role(
-                params["CONFIGURATION_ROLE_NAME"], "sra-process-audit-acct-subscriber", params["DELEGATED_ADMIN_ACCOUNT_ID"]
-            )
-            sl_client = delegated_admin_session.client("securitylake", region)
-            subscriber_exists, subscriber_id, external_id = security_lake.check_subscriber_exists(sl_client, subscriber_name)
-            if subscriber_exists:
-                LOGGER.info(f"Audit account subscriber '{subscriber_name}' exists in {region} region. Updating subscriber...")
-                resource_share_arn = security_lake.update_subscriber(
-                    sl_client, subscriber_id, sources, external_id, AUDIT_ACCT_ID, subscriber_name, params["SOURCE_VERSION"]
-                )
-            else:
-                external_id = params["QUERY_SUBSCRIBER_EXTERNAL_ID"]
-                LOGGER.info(f"Audit account subscriber '{subscriber_name}' does not exist in {region} region. Creating subscriber...")
-                subscriber_id, resource_share_arn = security_lake.create_subscribers(
-                    sl_client, lakeformation_access, sources, external_id, AUDIT_ACCT_ID, subscriber_name, params["SOURCE_VERSION"]
-                )
-            if params["CREATE_RESOURCE_LINK"]:
-                configure_query_subscriber_on_update(
-                    params["SUBSCRIBER_ROLE_NAME"],
-                    AUDIT_ACCT_ID,
-                    subscriber_name,
-                    params["DELEGATED_ADMIN_ACCOUNT_ID"],
-                    region,
-                    resource_share_arn,
-                    params["SUBSCRIBER_ROLE_NAME"],
-                )
+        delegated_admin_session = common.assume_role(
+            params["CONFIGURATION_ROLE_NAME"], "sra-process-audit-acct-subscriber", params["DELEGATED_ADMIN_ACCOUNT_ID"]
+        )
+        sl_clients = get_regional_clients(delegated_admin_session, "securitylake", regions)
+        process_regions(
+            "Update audit account query subscriber",
+            regions,
+            lambda region: update_audit_acct_query_subscriber_in_region(sl_clients[region], params, region, sources),
+        )
+
+
+def update_audit_acct_query_subscriber_in_region(sl_client: SecurityLakeClient, params: dict, region: str, sources: list) -> None:
+    """Create or update the Audit (Security tooling) account query access subscriber in a region.
+
+    Args:
+        sl_client: boto3 client
+        params: parameters
+        region: AWS region
+        sources: AWS log sources
+    """
+    subscriber_name = params["AUDIT_ACCT_QUERY_SUBSCRIBER"] + "-" + region
+    subscriber_exists, subscriber_id, external_id = security_lake.check_subscriber_exists(sl_client, subscriber_name)
+    if subscriber_exists:
+        LOGGER.info(f"Audit account subscriber '{subscriber_name}' exists in {region} region. Updating subscriber...")
+        resource_share_arn = security_lake.update_subscriber(
+            sl_client, subscriber_id, sources, external_id, AUDIT_ACCT_ID, subscriber_name, params["SOURCE_VERSION"]
+        )
+    else:
+        external_id = params["QUERY_SUBSCRIBER_EXTERNAL_ID"]
+        LOGGER.info(f"Audit account subscriber '{subscriber_name}' does not exist in {region} region. Creating subscriber...")
+        subscriber_id, resource_share_arn = security_lake.create_subscribers(
+            sl_client, "LAKEFORMATION", sources, external_id, AUDIT_ACCT_ID, subscriber_name, params["SOURCE_VERSION"]
+        )
+    if params["CREATE_RESOURCE_LINK"]:
+        configure_query_subscriber_on_update(
+            params["SUBSCRIBER_ROLE_NAME"],
+            AUDIT_ACCT_ID,
+            subscriber_name,
+            params["DELEGATED_ADMIN_ACCOUNT_ID"],
+            region,
+            resource_share_arn,
+            params["SUBSCRIBER_ROLE_NAME"],
+        )
 
 
 def add_audit_acct_query_subscriber(sl_client: SecurityLakeClient, params: dict, region: str) -> None:
@@ -546,25 +628,39 @@ def configure_audit_acct_for_query_access(params: dict, regions: list) -> None:
         params: configuration parameters
         regions: AWS regions
     """
-    for region in regions:
-        subscriber_name = params["AUDIT_ACCT_QUERY_SUBSCRIBER"] + "-" + region
-        delegated_admin_session = common.assume_role(
-            params["CONFIGURATION_ROLE_NAME"], "sra-process-audit-acct-subscriber", params["DELEGATED_ADMIN_ACCOUNT_ID"]
-        )
-        sl_client = delegated_admin_session.client("securitylake", region)
-        subscriber_created, resource_share_arn = security_lake.get_subscriber_resourceshare_arn(sl_client, subscriber_name)
-        if subscriber_created:
-            LOGGER.info(f"Configuring Audit (Security tooling) account subscriber '{subscriber_name}' ({region})")
-            if params["CREATE_RESOURCE_LINK"]:
-                configure_query_subscriber_on_update(
-                    params["SUBSCRIBER_ROLE_NAME"],
-                    AUDIT_ACCT_ID,
-                    subscriber_name,
-                    params["DELEGATED_ADMIN_ACCOUNT_ID"],
-                    region,
-                    resource_share_arn,
-                    params["SUBSCRIBER_ROLE_NAME"],
-                )
+    delegated_admin_session = common.assume_role(
+        params["CONFIGURATION_ROLE_NAME"], "sra-process-audit-acct-subscriber", params["DELEGATED_ADMIN_ACCOUNT_ID"]
+    )
+    sl_clients = get_regional_clients(delegated_admin_session, "securitylake", regions)
+    process_regions(
+        "Configure audit account query access",
+        regions,
+        lambda region: configure_audit_acct_for_query_access_in_region(sl_clients[region], params, region),
+    )
+
+
+def configure_audit_acct_for_query_access_in_region(sl_client: SecurityLakeClient, params: dict, region: str) -> None:
+    """Configure resources for query access in Audit account in a region.
+
+    Args:
+        sl_client: boto3 client
+        params: configuration parameters
+        region: AWS region
+    """
+    subscriber_name = params["AUDIT_ACCT_QUERY_SUBSCRIBER"] + "-" + region
+    subscriber_created, resource_share_arn = security_lake.get_subscriber_resourceshare_arn(sl_client, subscriber_name)
+    if subscriber_created:
+        LOGGER.info(f"Configuring Audit (Security tooling) account subscriber '{subscriber_name}' ({region})")
+        if params["CREATE_RESOURCE_LINK"]:
+            configure_query_subscriber_on_update(
+                params["SUBSCRIBER_ROLE_NAME"],
+                AUDIT_ACCT_ID,
+                subscriber_name,
+                params["DELEGATED_ADMIN_ACCOUNT_ID"],
+                region,
+                resource_share_arn,
+                params["SUBSCRIBER_ROLE_NAME"],
+            )
 
 
 def configure_query_subscriber_on_update(
@@ -589,14 +685,13 @@ def configure_query_subscriber_on_update(
     """
     subscriber_session = common.assume_role(configuration_role_name, "sra-create-resource-share", subscriber_acct)
     ram_client = subscriber_session.client("ram", region)
+    glue_client = subscriber_session.client("glue", region)
     LOGGER.info(f"Configuring resource share link for subscriber '{subscriber_name}' ({region})")
     security_lake.configure_resource_share_in_subscriber_acct(ram_client, resource_share_arn)
     shared_db_name, shared_tables = security_lake.get_shared_resource_names(ram_client, resource_share_arn)
     if shared_tables == "" or shared_db_name == "":
         LOGGER.info(f"No shared resource names found for subscriber '{subscriber_name}' ({region})")
     else:
-        subscriber_session = common.assume_role(configuration_role_name, "sra-create-resource-share-link", subscriber_acct)
-        glue_client = subscriber_session.client("glue", region)
         LOGGER.info(f"Creating database '{shared_db_name}_subscriber' for subscriber '{subscriber_name}' ({region})")
         security_lake.create_db_in_data_catalog(glue_client, subscriber_acct, shared_db_name, region, subscriber_role)
         security_lake.create_table_in_data_catalog(glue_client, shared_db_name, shared_tables, security_lake_acct, region)
@@ -610,28 +705,39 @@ def disable_security_lake(params: dict, regions: list, accounts: dict) -> None:
         regions: AWS regions
         accounts: AWS accounts
     """
-    for region in regions:
-        delegated_admin_session = common.assume_role(
-            params["CONFIGURATION_ROLE_NAME"], "sra-delete-security-lake-subscribers", params["DELEGATED_ADMIN_ACCOUNT_ID"]
-        )
-        sl_client = delegated_admin_session.client("securitylake", region)
-        if params["SET_AUDIT_ACCT_DATA_SUBSCRIBER"]:
-            subscriber_name = params["AUDIT_ACCT_DATA_SUBSCRIBER"] + "-" + region
-            security_lake.delete_subscriber(sl_client, subscriber_name, region)
-        if params["SET_AUDIT_ACCT_QUERY_SUBSCRIBER"]:
-            subscriber_name = params["AUDIT_ACCT_QUERY_SUBSCRIBER"] + "-" + region
-            security_lake.delete_subscriber(sl_client, subscriber_name, region)
-
-        org_configuration_exists, existing_org_configuration = security_lake.get_org_configuration(sl_client)
-        if org_configuration_exists:
-            LOGGER.info(f"Deleting Organization Configuration in {region} region...")
-            security_lake.delete_organization_configuration(sl_client, existing_org_configuration)
+    delegated_admin_session = common.assume_role(
+        params["CONFIGURATION_ROLE_NAME"], "sra-delete-security-lake-subscribers", params["DELEGATED_ADMIN_ACCOUNT_ID"]
+    )
+    sl_clients = get_regional_clients(delegated_admin_session, "securitylake", regions)
+    sl_client = delegated_admin_session.client("securitylake", HOME_REGION)
+    process_regions("Disable Security Lake", regions, lambda region: disable_security_lake_in_region(sl_clients[region], params, region))
 
     all_accounts = [account["AccountId"] for account in accounts]
     for source in AWS_LOG_SOURCES:
         security_lake.delete_aws_log_source(sl_client, regions, source, all_accounts, params["SOURCE_VERSION"])
 
 
+def disable_security_lake_in_region(sl_client: SecurityLakeClient, params: dict, region: str) -> None:
+    """Delete the Audit account subscribers and the Organization Configuration in a region.
+
+    Args:
+        sl_client: boto3 client
+        params: Configuration Parameters
+        region: AWS region
+    """
+    if params["SET_AUDIT_ACCT_DATA_SUBSCRIBER"]:
+        subscriber_name = params["AUDIT_ACCT_DATA_SUBSCRIBER"] + "-" + region
+        security_lake.delete_subscriber(sl_client, subscriber_name, region)
+    if params["SET_AUDIT_ACCT_QUERY_SUBSCRIBER"]:
+        subscriber_name = params["AUDIT_ACCT_QUERY_SUBSCRIBER"] + "-" + region
+        security_lake.delete_subscriber(sl_client, subscriber_name, region)
+
+    org_configuration_exists, existing_org_configuration = security_lake.get_org_configuration(sl_client)
+    if org_configuration_exists:
+        LOGGER.info(f"Deleting Organization Configuration in {region} region...")
+        security_lake.delete_organization_configuration(sl_client, existing_org_configuration)
+
+
 def orchestrator(event: dict[str, Any], context: Any) -> None:
     """Orchestration.
 
@@ -11,7 +11,9 @@ from __future__ import annotations
 
 import logging
 import os
-from time import sleep
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, sleep
 from typing import TYPE_CHECKING, List, Literal, Sequence, Union
 
 import boto3
@@ -45,7 +47,6 @@ LOGGER.setLevel(log_level)
 
 BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "standard"})
 UNEXPECTED = "Unexpected!"
-EMPTY_STRING = ""
 SECURITY_LAKE_THROTTLE_PERIOD = 0.2
 ENABLE_RETRY_ATTEMPTS = 10
 ENABLE_RETRY_SLEEP_INTERVAL = 10
@@ -53,6 +54,15 @@ MAX_RETRY = 5
 SLEEP_SECONDS = 10
 KEY = "sra-solution"
 VALUE = "sra-security-lake"
+LIST_SUBSCRIBERS_PAGE_SIZE = 100  # Max page size for list_subscribers
+LIST_LOG_SOURCES_PAGE_SIZE = 100  # Max page size for list_log_sources
+LOG_SOURCE_ACCOUNTS_BATCH_MAX = 50
+LOG_SOURCE_CONFIGURATIONS_MAX = 50  # Max log source configurations per CreateAwsLogSource/DeleteAwsLogSource call
+SHARED_RESOURCES_POLL_INITIAL_DELAY = 1.0
+RESOURCE_LINK_MAX_WORKERS = 5
+SUBSCRIBER_INDEX_TTL_SECONDS = 300  # Reuse listed subscribers across lookups and warm invocations
+SUBSCRIBER_INDEX_LOCK = threading.Lock()
+SUBSCRIBER_INDEX: dict = {}  # (account, region) -> (list time, {subscriber name: (subscriber id, external id, resource share ARN)})
 
 try:
     MANAGEMENT_ACCOUNT_SESSION = boto3.Session()
@@ -273,71 +283,99 @@ def encrypt_sqs_queues(configuration_role_name: str, account: str, region: str,
             LOGGER.error(e)
 
 
-class CheckLogSourceResult:
-    """Log source check result."""
+def get_log_source_state(sl_client: SecurityLakeClient, regions: list, source_version: str) -> set:
+    """Get the enabled AWS log and event sources of every account in the given regions, in one pass over list_log_sources.
 
-    def __init__(self, source_exists: bool, accounts_to_enable: list, accounts_to_disable: list, regions_to_enable: list):
-        """Set result attributes.
+    Args:
+        sl_client: SecurityLakeClient
+        regions: AWS regions
+        source_version: log source version
+
+    Returns:
+        set: (account, region, source name) entries that are enabled
+    """
+    enabled_log_sources: set = set()
+    list_log_sources_paginator: ListLogSourcesPaginator = sl_client.get_paginator("list_log_sources")
+    for page in list_log_sources_paginator.paginate(regions=regions, PaginationConfig={"PageSize": LIST_LOG_SOURCES_PAGE_SIZE}):
+        for log_source in page["sources"]:
+            for log_source_resource in log_source.get("sources", []):
+                aws_log_source = log_source_resource.get("awsLogSource")
+                if aws_log_source and aws_log_source.get("sourceVersion", source_version) == source_version:
+                    enabled_log_sources.add((log_source["account"], log_source["region"], aws_log_source["sourceName"]))
+    return enabled_log_sources
 
-        Args:
-            source_exists: source exists
-            accounts_to_enable: accounts to enable
-            accounts_to_disable: accounts to disable
-            regions_to_enable: regions to enable
-        """
-        self.source_exists = source_exists
-        self.accounts_to_enable = accounts_to_enable
-        self.accounts_to_disable = accounts_to_disable
-        self.regions_to_enable = regions_to_enable
 
+def build_log_source_configurations(log_sources: set, source_version: str) -> list:
+    """Group (account, region, source name) entries into as few log source configurations as possible.
 
-def check_log_source_enabled(
-    sl_client: SecurityLakeClient,
-    requested_accounts: list,
-    org_accounts: list,
-    requested_regions: list,
-    log_source_name: AwsLogSourceNameType,
-    log_source_version: str,
-) -> CheckLogSourceResult:
-    """Check if AWS log and event source enabled.
+    Accounts of a source that need the same set of regions share configurations of up to LOG_SOURCE_ACCOUNTS_BATCH_MAX accounts.
+
+    Args:
+        log_sources: (account, region, source name) entries
+        source_version: log source version
+
+    Returns:
+        list: AwsLogSourceConfigurationTypeDef entries
+    """
+    regions_by_source_account: dict = {}
+    for account, region, source in log_sources:
+        regions_by_source_account.setdefault((source, account), set()).add(region)
+    accounts_by_source_regions: dict = {}
+    for (source, account), regions in regions_by_source_account.items():
+        accounts_by_source_regions.setdefault((source, tuple(sorted(regions))), []).append(account)
+
+    configurations: List[AwsLogSourceConfigurationTypeDef] = []
+    for (source, regions), accounts in sorted(accounts_by_source_regions.items()):
+        accounts.sort()
+        for index in range(0, len(accounts), LOG_SOURCE_ACCOUNTS_BATCH_MAX):
+            configurations.append(
+                {
+                    "accounts": accounts[index : index + LOG_SOURCE_ACCOUNTS_BATCH_MAX],
+                    "regions": list(regions),
+                    "sourceName": source,
+                    "sourceVersion": source_version,
+                }
+            )
+    return configurations
+
+
+def plan_log_sources(sl_client: SecurityLakeClient, requested_log_sources: dict, org_accounts: list, regions: list, source_version: str) -> tuple:
+    """Compare the requested AWS log and event sources with the enabled ones.
 
     Args:
         sl_client: SecurityLakeClient
-        requested_accounts: requested accounts
+        requested_log_sources: source name -> requested accounts. An empty account list disables the source.
         org_accounts: organization accounts
-        requested_regions: requested regions
-        log_source_name: log source name
-        log_source_version: log source version
+        regions: requested regions
+        source_version: log source version
 
     Returns:
-        CheckLogSourceResult
+        tuple: (configurations to create, configurations to delete)
     """
-    accounts_to_enable: list = []
-    accounts_to_disable_log_source: list = []
-    regions_with_source_enabled: list = []
-    list_log_sources_paginator: ListLogSourcesPaginator = sl_client.get_paginator("list_log_sources")
-    for page in list_log_sources_paginator.paginate(
-        accounts=org_accounts,
-        regions=requested_regions,
-        sources=[{"awsLogSource": {"sourceName": log_source_name, "sourceVersion": log_source_version}}],
-    ):
-        if not page["sources"]:  # noqa R505
-            return CheckLogSourceResult(False, requested_accounts, accounts_to_disable_log_source, requested_regions)
-        else:
-            enabled_accounts = {s["account"] for s in page["sources"] if s["account"] in org_accounts}
-            regions_with_source_enabled = list({s["region"] for s in page["sources"]})
-            accounts_to_enable = [account for account in requested_accounts if account not in enabled_accounts]
-            accounts_to_disable_log_source = [account for account in enabled_accounts if account not in requested_accounts]
-            regions_to_enable = [region for region in requested_regions if region not in regions_with_source_enabled]
-
-            if accounts_to_enable:
-                LOGGER.info(f"AWS log and event source {log_source_name} will be enabled in {', '.join(accounts_to_enable)} account(s)")
-            if accounts_to_disable_log_source:
-                LOGGER.info(f"AWS log and event source {log_source_name} will be deleted in {', '.join(accounts_to_disable_log_source)} account(s)")
-            if regions_to_enable:
-                LOGGER.info(f"AWS log and event source {log_source_name} will be enabled in {', '.join(regions_to_enable)} region(s)")
+    enabled_log_sources = get_log_source_state(sl_client, regions, source_version)
+    requested = {(account, region, source) for source, accounts in requested_log_sources.items() for account in accounts for region in regions}
+    org_account_ids = set(org_accounts)
+    log_sources_to_create = requested - enabled_log_sources
+    log_sources_to_delete = {
+        (account, region, source)
+        for account, region, source in enabled_log_sources - requested
+        if source in requested_log_sources and account in org_account_ids
+    }
 
-    return CheckLogSourceResult(True, accounts_to_enable, accounts_to_disable_log_source, regions_to_enable)
+    for source in requested_log_sources:
+        accounts_to_enable = sorted({account for account, _, log_source in log_sources_to_create if log_source == source})
+        accounts_to_disable = sorted({account for account, _, log_source in log_sources_to_delete if log_source == source})
+        if accounts_to_enable:
+            LOGGER.info(f"AWS log and event source {source} will be enabled in {', '.join(accounts_to_enable)} account(s)")
+        if accounts_to_disable:
+            LOGGER.info(f"AWS log and event source {source} will be deleted in {', '.join(accounts_to_disable)} account(s)")
+    if not log_sources_to_create and not log_sources_to_delete:
+        LOGGER.info("Log and event sources already configured. No changes to apply")
+
+    return (
+        build_log_source_configurations(log_sources_to_create, source_version),
+        build_log_source_configurations(log_sources_to_delete, source_version),
+    )
 
 
 def add_aws_log_source(sl_client: SecurityLakeClient, aws_log_sources: list) -> None:
@@ -379,46 +417,18 @@ def add_aws_log_source(sl_client: SecurityLakeClient, aws_log_sources: list) ->
         raise ValueError("Failed to create log events sources")
 
 
-def update_aws_log_source(
-    sl_client: SecurityLakeClient,
-    requested_regions: list,
-    source: AwsLogSourceNameType,
-    requested_accounts: list,
-    org_accounts: list,
-    source_version: str,
-) -> None:
-    """Create AWS log and event sources.
+def apply_log_source_plan(sl_client: SecurityLakeClient, configurations_to_create: list, configurations_to_delete: list) -> None:
+    """Create and delete AWS log and event sources, LOG_SOURCE_CONFIGURATIONS_MAX configurations per call.
 
     Args:
         sl_client: boto3 client
-        requested_regions: list of AWS regions
-        source: AWS log and event source name
-        requested_accounts: list of AWS accounts
-        org_accounts: list of all AWS accounts in organization
-        source_version: log source version
+        configurations_to_create: log source configurations to create
+        configurations_to_delete: log source configurations to delete
     """
-    result = check_log_source_enabled(sl_client, requested_accounts, org_accounts, requested_regions, source, source_version)
-    accounts = list(result.accounts_to_enable)
-    accounts_to_delete = list(result.accounts_to_disable)
-    regions_to_enable = list(result.regions_to_enable)
-
-    configurations: AwsLogSourceConfigurationTypeDef = {
-        "accounts": requested_accounts,
-        "regions": requested_regions,
-        "sourceName": source,
-        "sourceVersion": source_version,
-    }
-    if result.source_exists and accounts:
-        configurations.update({"accounts": accounts})
-
-    if result.source_exists and not accounts and not regions_to_enable:
-        LOGGER.info("Log and event source already configured. No changes to apply")
-
-    else:
-        add_aws_log_source(sl_client, [configurations])
-
-    if accounts_to_delete:
-        delete_aws_log_source(sl_client, requested_regions, source, accounts_to_delete, source_version)
+    for index in range(0, len(configurations_to_create), LOG_SOURCE_CONFIGURATIONS_MAX):
+        add_aws_log_source(sl_client, configurations_to_create[index : index + LOG_SOURCE_CONFIGURATIONS_MAX])
+    for index in range(0, len(configurations_to_delete), LOG_SOURCE_CONFIGURATIONS_MAX):
+        delete_aws_log_sources(sl_client, configurations_to_delete[index : index + LOG_SOURCE_CONFIGURATIONS_MAX])
 
 
 def get_org_configuration(sl_client: SecurityLakeClient) -> tuple:
@@ -528,80 +538,103 @@ def delete_organization_configuration(sl_client: SecurityLakeClient, existing_or
         LOGGER.info(api_call_details)
 
 
-def check_subscriber_exists(sl_client: SecurityLakeClient, subscriber_name: str, next_token: str = EMPTY_STRING) -> tuple:  # noqa: CFQ004
-    """List Security Lake subscribers.
+def get_subscriber_index_key(sl_client: SecurityLakeClient) -> tuple:
+    """Get the subscriber index cache key of the account the client's credentials belong to and the client's region.
+
+    Args:
+        sl_client: boto3 client
+
+    Returns:
+        (account, region) tuple
+    """
+    credentials = sl_client._get_credentials().get_frozen_credentials()  # type: ignore
+    session = boto3.Session(
+        aws_access_key_id=credentials.access_key, aws_secret_access_key=credentials.secret_key, aws_session_token=credentials.token
+    )
+    return (common.get_caller_arn(session).split(":")[4], sl_client.meta.region_name)
+
+
+def get_subscriber_index(sl_client: SecurityLakeClient) -> dict:
+    """Get the Security Lake subscribers of the client's account and region, listing them only when the cached index is missing or stale.
 
     Args:
         sl_client: boto3 client
-        subscriber_name: subscriber name
-        next_token: next token. Defaults to EMPTY_STRING.
 
     Raises:
         ClientError: If there is an issue listing subscribers
 
     Returns:
-        tuple: (bool, str, str)
+        dict: subscriber name -> (subscriber id, external id, resource share ARN)
     """
-    subscriber_exists = False
-    subscriber_id = ""
-    external_id = ""
-    try:
-        if next_token != EMPTY_STRING:
-            response = sl_client.list_subscribers(maxResults=10, nextToken=next_token)
-        else:
-            response = sl_client.list_subscribers(maxResults=10)
-        if response["subscribers"]:  # noqa R505
-            subscriber = next((subscriber for subscriber in response["subscribers"] if subscriber_name == subscriber["subscriberName"]), None)
-            if subscriber:
-                subscriber_id = subscriber["subscriberId"]
-                external_id = subscriber["subscriberIdentity"]["externalId"]
-                subscriber_exists = True
-                return subscriber_exists, subscriber_id, external_id
-
-            if "nextToken" in response:
-                subscriber_exists, subscriber_id, external_id = check_subscriber_exists(sl_client, subscriber_name, response["nextToken"])
-            return subscriber_exists, subscriber_id, external_id
-        else:
-            return subscriber_exists, subscriber_id, external_id
+    index_key = get_subscriber_index_key(sl_client)
+    with SUBSCRIBER_INDEX_LOCK:
+        cached_index = SUBSCRIBER_INDEX.get(index_key)
+    if cached_index and monotonic() - cached_index[0] < SUBSCRIBER_INDEX_TTL_SECONDS:
+        return cached_index[1]
 
+    subscriber_index = {}
+    try:
+        paginator = sl_client.get_paginator("list_subscribers")
+        for page in paginator.paginate(PaginationConfig={"PageSize": LIST_SUBSCRIBERS_PAGE_SIZE}):
+            for subscriber in page["subscribers"]:
+                subscriber_index[subscriber["subscriberName"]] = (
+                    subscriber["subscriberId"],
+                    subscriber["subscriberIdentity"]["externalId"],
+                    subscriber.get("resourceShareArn", ""),
+                )
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
-        if error_code == "ResourceNotFoundException":  # noqa: R505
-            LOGGER.info(f"Error calling ListSubscribers: {e}. Skipping...")
-            return subscriber_exists, subscriber_id, external_id
-        else:
+        if error_code != "ResourceNotFoundException":
             LOGGER.error(f"Error calling ListSubscribers: {e}.")
             raise
+        LOGGER.info(f"Error calling ListSubscribers: {e}. Skipping...")
+
+    with SUBSCRIBER_INDEX_LOCK:
+        SUBSCRIBER_INDEX[index_key] = (monotonic(), subscriber_index)
+    return subscriber_index
 
 
-def get_subscriber_resourceshare_arn(sl_client: SecurityLakeClient, subscriber_name: str, next_token: str = EMPTY_STRING) -> tuple:  # noqa S107
-    """List Security Lake subscribers.
+def invalidate_subscriber_index(sl_client: SecurityLakeClient) -> None:
+    """Drop the cached Security Lake subscribers of the client's account and region after a subscriber is created, updated or deleted.
+
+    Args:
+        sl_client: boto3 client
+    """
+    with SUBSCRIBER_INDEX_LOCK:
+        SUBSCRIBER_INDEX.pop(get_subscriber_index_key(sl_client), None)
+
+
+def check_subscriber_exists(sl_client: SecurityLakeClient, subscriber_name: str) -> tuple:
+    """Check if a Security Lake subscriber exists.
 
     Args:
         sl_client: boto3 client
         subscriber_name: subscriber name
-        next_token: next token. Defaults to EMPTY_STRING.
 
     Returns:
         tuple: (bool, str, str)
     """
-    resource_share_arn = ""
-    subscriber_exists = False
-    if next_token != EMPTY_STRING:
-        response = sl_client.list_subscribers(maxResults=10, nextToken=next_token)
-    else:
-        response = sl_client.list_subscribers(maxResults=10)
-    if response["subscribers"]:  # noqa R505
-        for subscriber in response["subscribers"]:
-            if subscriber_name == subscriber["subscriberName"]:
-                resource_share_arn = subscriber.get("resourceShareArn", "")
-                subscriber_exists = True
-                return subscriber_exists, resource_share_arn
-        if "nextToken" in response:
-            subscriber_exists, resource_share_arn = get_subscriber_resourceshare_arn(sl_client, subscriber_name, response["nextToken"])
-        return subscriber_exists, resource_share_arn
-    else:
-        return subscriber_exists, resource_share_arn
+    subscriber = get_subscriber_index(sl_client).get(subscriber_name)
+    if subscriber:
+        subscriber_id, external_id, _ = subscriber
+        return True, subscriber_id, external_id
+    return False, "", ""
+
+
+def get_subscriber_resourceshare_arn(sl_client: SecurityLakeClient, subscriber_name: str) -> tuple:
+    """Get the resource share ARN of a Security Lake subscriber.
+
+    Args:
+        sl_client: boto3 client
+        subscriber_name: subscriber name
+
+    Returns:
+        tuple: (bool, str)
+    """
+    subscriber = get_subscriber_index(sl_client).get(subscriber_name)
+    if subscriber:
+        return True, subscriber[2]
+    return False, ""
 
 
 def create_subscribers(
@@ -648,6 +681,7 @@ def create_subscribers(
             )
             api_call_details = {"API_Call": "securitylake:CreateSubscriber", "API_Response": response}
             LOGGER.info(api_call_details)
+            invalidate_subscriber_index(sl_client)
             subscriber_id = response["subscriber"]["subscriberId"]
             if data_access == "LAKEFORMATION":  # noqa R505
                 resource_share_arn = response["subscriber"]["resourceShareArn"]
@@ -703,6 +737,7 @@ def update_subscriber(
             )
             api_call_details = {"API_Call": "securitylake:UpdateSubscriber", "API_Response": response}
             LOGGER.info(api_call_details)
+            invalidate_subscriber_index(sl_client)
             LOGGER.info(f"Subscriber '{subscriber_name}' updated")
             if response["subscriber"]["accessTypes"] == ["LAKEFORMATION"]:
                 resource_share_arn = response["subscriber"]["resourceShareArn"]
@@ -811,18 +846,21 @@ def get_shared_resource_names(ram_client: RAMClient, resource_share_arn: str) ->
     table_names = []
     retry = 0
     resources_created = False
+    deadline = monotonic() + MAX_RETRY * SLEEP_SECONDS
     LOGGER.info("Getting shared resources")
-    while retry < MAX_RETRY:
+    while True:
         response = ram_client.list_resources(resourceOwner="OTHER-ACCOUNTS", resourceShareArns=[resource_share_arn])
         if response["resources"]:
             db_name = next((resource["arn"].split("/")[-1] for resource in response["resources"] if resource["type"] == "glue:Database"), "")
             table_names = [resource["arn"].split("/")[-1] for resource in response["resources"] if resource["type"] == "glue:Table"]
             resources_created = True
             break
-        else:
-            LOGGER.info(f"No shared resources found. Retrying {retry+1}")
-            retry += 1
-            sleep(SLEEP_SECONDS)
+        delay = min(SHARED_RESOURCES_POLL_INITIAL_DELAY * (2**retry), SLEEP_SECONDS, deadline - monotonic())
+        if delay <= 0:
+            break
+        retry += 1
+        LOGGER.info(f"No shared resources found. Retrying {retry} in {delay:.1f} seconds")
+        sleep(delay)
     if not resources_created:
         LOGGER.error("Max retries reached. Unable to retrieve resource names.")
     return db_name, table_names
@@ -859,42 +897,80 @@ def create_db_in_data_catalog(glue_client: GlueClient, subscriber_acct: str, sha
     set_lake_formation_permissions(lf_client, subscriber_acct, shared_db_name)
 
 
-def create_table_in_data_catalog(glue_client: GlueClient, shared_db_name: str, shared_table_names: str, security_lake_acct: str, region: str) -> None:
-    """Create table in data catalog.
+def get_resource_link_names(glue_client: GlueClient, subscriber_db_name: str) -> set:
+    """Get the names of the tables that already exist in the subscriber database.
+
+    Args:
+        glue_client: boto3 client
+        subscriber_db_name: name of the subscriber database
+
+    Returns:
+        set: table names
+    """
+    table_names = set()
+    try:
+        paginator = glue_client.get_paginator("get_tables")
+        for page in paginator.paginate(DatabaseName=subscriber_db_name):
+            table_names.update(table["Name"] for table in page["TableList"])
+    except ClientError as e:
+        LOGGER.info(f"Unable to list tables in '{subscriber_db_name}': {e}. Creating all resource links...")
+    return table_names
+
+
+def create_resource_link(glue_client: GlueClient, shared_db_name: str, table: str, security_lake_acct: str, region: str) -> None:
+    """Create a resource link table for a shared table.
 
     Args:
         glue_client: boto3 client
         shared_db_name: name of shared database
-        shared_table_names: name of shared tables
+        table: name of shared table
         security_lake_acct: Security Lake delegated administrator AWS account id
         region: AWS region
 
     Raises:
         ValueError: If there is an creating Glue table
     """
-    for table in shared_table_names:
-        table_name = "rl_" + table
-        try:
-            response = glue_client.create_table(
-                DatabaseName=shared_db_name + "_subscriber",
-                TableInput={
-                    "Name": table_name,
-                    "TargetTable": {"CatalogId": security_lake_acct, "DatabaseName": shared_db_name, "Name": table},
-                },
-            )
-            api_call_details = {"API_Call": "glue:CreateTable", "API_Response": response}
-            LOGGER.info(api_call_details)
-        except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "AlreadyExistsException":
-                LOGGER.info(f"Table '{table_name}' already exists in {region} region.")
-                continue
-            if error_code == "AccessDeniedException":  # noqa R505
-                LOGGER.info("'AccessDeniedException' error occurred. Review and update Lake Formation permission(s)")
-                LOGGER.info("Skipping...")
-                continue
-            else:
-                raise ValueError(f"Error calling glue:CreateTable {e}") from None
+    table_name = "rl_" + table
+    try:
+        response = glue_client.create_table(
+            DatabaseName=shared_db_name + "_subscriber",
+            TableInput={
+                "Name": table_name,
+                "TargetTable": {"CatalogId": security_lake_acct, "DatabaseName": shared_db_name, "Name": table},
+            },
+        )
+        api_call_details = {"API_Call": "glue:CreateTable", "API_Response": response}
+        LOGGER.info(api_call_details)
+    except ClientError as e:
+        error_code = e.response["Error"]["Code"]
+        if error_code == "AlreadyExistsException":
+            LOGGER.info(f"Table '{table_name}' already exists in {region} region.")
+        elif error_code == "AccessDeniedException":
+            LOGGER.info("'AccessDeniedException' error occurred. Review and update Lake Formation permission(s)")
+            LOGGER.info("Skipping...")
+        else:
+            raise ValueError(f"Error calling glue:CreateTable {e}") from None
+
+
+def create_table_in_data_catalog(
+    glue_client: GlueClient, shared_db_name: str, shared_table_names: list, security_lake_acct: str, region: str
+) -> None:
+    """Create table in data catalog.
+
+    Glue has no batch table create, so the existing tables are listed once and only the missing resource links are created, concurrently.
+
+    Args:
+        glue_client: boto3 client
+        shared_db_name: name of shared database
+        shared_table_names: name of shared tables
+        security_lake_acct: Security Lake delegated administrator AWS account id
+        region: AWS region
+    """
+    existing_table_names = get_resource_link_names(glue_client, shared_db_name + "_subscriber")
+    tables_to_create = [table for table in shared_table_names if "rl_" + table not in existing_table_names]
+    LOGGER.info(f"{len(shared_table_names) - len(tables_to_create)} resource link(s) already exist in {region} region")
+    with ThreadPoolExecutor(max_workers=RESOURCE_LINK_MAX_WORKERS) as executor:
+        list(executor.map(lambda table: create_resource_link(glue_client, shared_db_name, table, security_lake_acct, region), tables_to_create))
 
 
 def set_lake_formation_permissions_for_slr(lf_client: LakeFormationClient, account: str, principal_identifier: str, db_name: str) -> None:
@@ -972,6 +1048,7 @@ def delete_subscriber(sl_client: SecurityLakeClient, subscriber_name: str, regio
             response = sl_client.delete_subscriber(subscriberId=subscriber_id)
             api_call_details = {"API_Call": "securitylake:DeleteSubscriber", "API_Response": response}
             LOGGER.info(api_call_details)
+            invalidate_subscriber_index(sl_client)
         except sl_client.exceptions.ResourceNotFoundException as e:
             LOGGER.info(f"Subscriber not found in {region} region. {e}")
             pass
@@ -998,9 +1075,26 @@ def delete_aws_log_source(sl_client: SecurityLakeClient, regions: list, source:
         "sourceName": source,
         "sourceVersion": source_version,
     }
+    delete_aws_log_sources(sl_client, [configurations])
+
+
+def delete_aws_log_sources(sl_client: SecurityLakeClient, configurations: list) -> None:
+    """Delete AWS log and event sources.
+
+    Args:
+        sl_client: boto3 client
+        configurations: AWS log source configurations
+
+    Raises:
+        ClientError: If there is an issue interacting with the AWS API.
+    """
     try:
-        sl_client.delete_aws_log_source(sources=[configurations])
-        LOGGER.info(f"Deleted AWS log source {source} in {', '.join(accounts)} account(s) {', '.join(regions)} region(s)...")
+        sl_client.delete_aws_log_source(sources=configurations)
+        for configuration in configurations:
+            LOGGER.info(
+                f"Deleted AWS log source {configuration['sourceName']} in {', '.join(configuration['accounts'])} account(s)"
+                + f" {', '.join(configuration['regions'])} region(s)..."
+            )
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
         if error_code == "UnauthorizedException":
@@ -13,7 +13,6 @@ import json
 import logging
 import os
 import re
-from time import sleep
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import boto3
@@ -27,7 +26,6 @@ if TYPE_CHECKING:
     from aws_lambda_typing.events import CloudFormationCustomResourceEvent
     from mypy_boto3_organizations import OrganizationsClient
     from mypy_boto3_sns import SNSClient
-    from mypy_boto3_sns.type_defs import PublishBatchResponseTypeDef
 
 # Setup Default Logger
 LOGGER = logging.getLogger("sra")
@@ -37,9 +35,8 @@ LOGGER.setLevel(log_level)
 # Global variables
 UNEXPECTED = "Unexpected!"
 SERVICE_NAME = "securityhub.amazonaws.com"
-SLEEP_SECONDS = 60
-PRE_DISABLE_SLEEP_SECONDS = 30
-SNS_PUBLISH_BATCH_MAX = 10
+READINESS_DEADLINE_SECONDS = 120
+PRE_DISABLE_DEADLINE_SECONDS = 60
 BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "standard"})
 
 # Initialize the helper. `sleep_on_delete` allows time for the CloudWatch Logs to get captured.
@@ -91,36 +88,7 @@ def create_sns_messages(accounts: list, regions: list, sns_topic_arn: str, actio
         sns_message = {"AccountId": account["AccountId"], "Regions": regions, "Action": action}
         sns_messages.append({"Id": account["AccountId"], "Message": json.dumps(sns_message), "Subject": "Security Hub Configuration"})
 
-    process_sns_message_batches(sns_messages, sns_topic_arn)
-
-
-def publish_sns_message_batch(message_batch: list, sns_topic_arn: str) -> None:
-    """Publish SNS Message Batches.
-
-    Args:
-        message_batch: Batch of SNS messages
-        sns_topic_arn: SNS Topic ARN
-    """
-    LOGGER.info("Publishing SNS Message Batch")
-    LOGGER.info({"SNSMessageBatch": message_batch})
-    response: PublishBatchResponseTypeDef = SNS_CLIENT.publish_batch(TopicArn=sns_topic_arn, PublishBatchRequestEntries=message_batch)
-    api_call_details = {"API_Call": "sns:PublishBatch", "API_Response": response}
-    LOGGER.info(api_call_details)
-
-
-def process_sns_message_batches(sns_messages: list, sns_topic_arn: str) -> None:
-    """Process SNS Message Batches for Publishing.
-
-    Args:
-        sns_messages: SNS messages to be batched.
-        sns_topic_arn: SNS Topic ARN
-    """
-    message_batches = []
-    for i in range(SNS_PUBLISH_BATCH_MAX, len(sns_messages) + SNS_PUBLISH_BATCH_MAX, SNS_PUBLISH_BATCH_MAX):
-        message_batches.append(sns_messages[i - SNS_PUBLISH_BATCH_MAX : i])
-
-    for batch in message_batches:
-        publish_sns_message_batch(batch, sns_topic_arn)
+    common.publish_sns_messages(SNS_CLIENT, sns_messages, sns_topic_arn)
 
 
 def process_event_sns(event: dict) -> None:
@@ -194,8 +162,12 @@ def process_add_update_event(params: dict) -> str:
         securityhub.disable_organization_admin_account(regions)
         securityhub.disable_securityhub(params["DELEGATED_ADMIN_ACCOUNT_ID"], params["CONFIGURATION_ROLE_NAME"], regions)
 
-        LOGGER.info(f"Waiting {PRE_DISABLE_SLEEP_SECONDS} seconds before disabling member accounts.")
-        sleep(PRE_DISABLE_SLEEP_SECONDS)
+        if not common.wait_until_ready(
+            "Security Hub organization admin account disabled",
+            lambda: securityhub.is_organization_admin_account_disabled(regions),
+            PRE_DISABLE_DEADLINE_SECONDS,
+        ):
+            LOGGER.warning("Security Hub organization admin account was not disabled in the allowed time. Continuing to disable member accounts.")
         create_sns_messages(accounts, regions, params["SNS_TOPIC_ARN"], "disable")
         return "DISABLE_COMPLETE"
 
@@ -205,8 +177,12 @@ def process_add_update_event(params: dict) -> str:
     securityhub.enable_account_securityhub(
         params["MANAGEMENT_ACCOUNT_ID"], regions, params["CONFIGURATION_ROLE_NAME"], params["AWS_PARTITION"], get_standards_dictionary(params)
     )
-    LOGGER.info("Waiting 20 seconds before configuring the delegated admin account.")
-    sleep(20)
+    if not common.wait_until_ready(
+        "Security Hub management account standards",
+        lambda: securityhub.are_account_standards_ready(params["MANAGEMENT_ACCOUNT_ID"], params["CONFIGURATION_ROLE_NAME"], regions),
+        READINESS_DEADLINE_SECONDS,
+    ):
+        LOGGER.warning("Security Hub management account standards were not ready in the allowed time. Continuing with the delegated admin setup.")
 
     # Configure Security Hub Delegated Admin and Organizations
     securityhub.configure_delegated_admin_securityhub(
@@ -229,8 +205,12 @@ def process_add_update_event(params: dict) -> str:
     )
 
     if params["action"] == "Add":
-        LOGGER.info(f"Waiting {SLEEP_SECONDS} seconds before configuring member accounts.")
-        sleep(SLEEP_SECONDS)
+        if not common.wait_until_ready(
+            "Security Hub delegated admin account standards",
+            lambda: securityhub.are_account_standards_ready(params["DELEGATED_ADMIN_ACCOUNT_ID"], params["CONFIGURATION_ROLE_NAME"], regions),
+            READINESS_DEADLINE_SECONDS,
+        ):
+            LOGGER.warning("Security Hub delegated admin account standards were not ready in the allowed time. Continuing with the member accounts.")
     create_sns_messages(accounts, regions, params["SNS_TOPIC_ARN"], "configure")
     return "ADD_UPDATE_COMPLETE"
 
@@ -355,12 +335,14 @@ def process_event_organizations(event: dict) -> None:
         for party in event["responseElements"]["handshake"]["parties"]:
             if party["type"] == "ACCOUNT":
                 aws_account_id = party["id"]
+                common.update_organization_account_inventory(aws_account_id)
                 securityhub.enable_account_securityhub(
                     aws_account_id, regions, params["CONFIGURATION_ROLE_NAME"], params["AWS_PARTITION"], get_standards_dictionary(params)
                 )
                 break
     elif event["detail"]["eventName"] == "CreateAccountResult":
         aws_account_id = event["detail"]["serviceEventDetails"]["createAccountStatus"]["accountId"]
+        common.update_organization_account_inventory(aws_account_id)
         securityhub.enable_account_securityhub(
             aws_account_id, regions, params["CONFIGURATION_ROLE_NAME"], params["AWS_PARTITION"], get_standards_dictionary(params)
         )
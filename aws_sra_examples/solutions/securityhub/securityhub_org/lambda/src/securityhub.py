@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 from typing import TYPE_CHECKING, Any
 
@@ -22,7 +23,7 @@ from botocore.exceptions import ClientError
 if TYPE_CHECKING:
     from mypy_boto3_config import ConfigServiceClient
     from mypy_boto3_iam import IAMClient
-    from mypy_boto3_securityhub import GetEnabledStandardsPaginator, ListMembersPaginator, ListOrganizationAdminAccountsPaginator, SecurityHubClient
+    from mypy_boto3_securityhub import GetEnabledStandardsPaginator, SecurityHubClient
     from mypy_boto3_securityhub.type_defs import CreateMembersResponseTypeDef, DeleteMembersResponseTypeDef
 
 # Setup Default Logger
@@ -33,10 +34,13 @@ LOGGER.setLevel(log_level)
 # Global variables
 UNEXPECTED = "Unexpected!"
 MAX_RETRY = 5
-SECURITY_HUB_THROTTLE_PERIOD = 0.2
 BOTO3_CONFIG = Config(retries={"max_attempts": 10, "mode": "standard"})
 AWS_DEFAULT_SBP_VERSION = "1.0.0"
 AWS_DEFAULT_CIS_VERSION = "1.2.0"
+REGION_MAX_WORKERS = 8  # Regions configured concurrently for each account
+STANDARDS_TRANSITIONAL_STATUSES = ("PENDING", "DELETING")
+STANDARDS_READY_DEADLINE_SECONDS = 300
+STANDARDS_ENABLE_DEADLINE_SECONDS = 120  # Retries InvalidInputException while Security Hub finishes enabling or disabling standards
 
 try:
     MANAGEMENT_ACCOUNT_SESSION = boto3.Session()
@@ -55,12 +59,10 @@ def is_admin_account_enabled(securityhub_client: SecurityHubClient, admin_accoun
     Returns:
         True or False
     """
-    paginator: ListOrganizationAdminAccountsPaginator = securityhub_client.get_paginator("list_organization_admin_accounts")
-    for page in paginator.paginate():
+    for page in common.rate_limited_paginate(securityhub_client, "list_organization_admin_accounts"):
         for admin_account in page["AdminAccounts"]:
             if admin_account["AccountId"] == admin_account_id and admin_account["Status"] == "ENABLED":
                 return True
-        sleep(SECURITY_HUB_THROTTLE_PERIOD)
     return False
 
 
@@ -102,15 +104,32 @@ def disable_organization_admin_account(regions: list) -> None:
     """
     for region in regions:
         securityhub_client: SecurityHubClient = MANAGEMENT_ACCOUNT_SESSION.client("securityhub", region, config=BOTO3_CONFIG)
-        paginator: ListOrganizationAdminAccountsPaginator = securityhub_client.get_paginator("list_organization_admin_accounts")
-        for page in paginator.paginate():
+        for page in common.rate_limited_paginate(securityhub_client, "list_organization_admin_accounts"):
             for admin_account in page["AdminAccounts"]:
                 if admin_account["Status"] == "ENABLED":
-                    response = securityhub_client.disable_organization_admin_account(AdminAccountId=admin_account["AccountId"])
+                    response = common.rate_limited_call(
+                        securityhub_client, "disable_organization_admin_account", AdminAccountId=admin_account["AccountId"]
+                    )
                     api_call_details = {"API_Call": "securityhub:DisableOrganizationAdminAccount", "API_Response": response}
                     LOGGER.info(api_call_details)
                     LOGGER.info(f"Admin Account {admin_account['AccountId']} Disabled in {region}")
-            sleep(SECURITY_HUB_THROTTLE_PERIOD)
+
+
+def is_organization_admin_account_disabled(regions: list) -> bool:
+    """Check that no organization admin account is enabled in the given regions.
+
+    Args:
+        regions: AWS Region List
+
+    Returns:
+        True or False
+    """
+    for region in regions:
+        securityhub_client: SecurityHubClient = MANAGEMENT_ACCOUNT_SESSION.client("securityhub", region, config=BOTO3_CONFIG)
+        for page in common.rate_limited_paginate(securityhub_client, "list_organization_admin_accounts"):
+            if any(admin_account["Status"] == "ENABLED" for admin_account in page["AdminAccounts"]):
+                return False
+    return True
 
 
 def disable_securityhub(account_id: str, configuration_role_name: str, regions: list) -> None:  # noqa: CCR001
@@ -160,13 +179,11 @@ def get_associated_members(securityhub_client: SecurityHubClient) -> list:
         ClientError: botocore Client Error
     """
     account_ids = []
-    paginator: ListMembersPaginator = securityhub_client.get_paginator("list_members")
 
     try:
-        for page in paginator.paginate(OnlyAssociated=False):
+        for page in common.rate_limited_paginate(securityhub_client, "list_members", OnlyAssociated=False):
             for member in page["Members"]:
                 account_ids.append(member["AccountId"])
-        sleep(SECURITY_HUB_THROTTLE_PERIOD)
     except securityhub_client.exceptions.InternalException:
         LOGGER.info("No associated members")
     except ClientError as error:
@@ -233,8 +250,38 @@ def create_members(security_hub_client: SecurityHubClient, accounts: list) -> No
     LOGGER.info(f"Member accounts created: {len(accounts)}")
 
 
+def enable_securityhub_in_region(
+    securityhub_client: SecurityHubClient,
+    config_client: ConfigServiceClient,
+    account_id: str,
+    region: str,
+    standard_dict: dict,
+    standards_to_enable: dict,
+) -> None:
+    """Enable Security Hub and process the standards in a region.
+
+    Args:
+        securityhub_client: SecurityHubClient for the region
+        config_client: ConfigServiceClient for the region
+        account_id: Account ID
+        region: AWS Region
+        standard_dict: Standard Dictionary
+        standards_to_enable: Dictionary of standards to enable
+    """
+    try:
+        enable_security_hub_response: Any = securityhub_client.enable_security_hub(EnableDefaultStandards=False)
+        api_call_details = {"API_Call": "securityhub:EnableSecurityHub", "API_Response": enable_security_hub_response}
+        LOGGER.info(api_call_details)
+        LOGGER.info(f"SecurityHub enabled in {account_id} {region}")
+    except securityhub_client.exceptions.ResourceConflictException:
+        LOGGER.info(f"SecurityHub already enabled in {account_id} {region}")
+
+    if is_config_enabled(config_client):
+        process_standards(securityhub_client, standard_dict, standards_to_enable)
+
+
 def enable_account_securityhub(account_id: str, regions: list, configuration_role_name: str, aws_partition: str, standards_user_input: dict) -> None:
-    """Enable account SecurityHub.
+    """Enable account SecurityHub, configuring the regions concurrently.
 
     Args:
         account_id: Account ID
@@ -252,29 +299,34 @@ def enable_account_securityhub(account_id: str, regions: list, configuration_rol
         iam_client,
     )
 
-    for region in regions:
-        standard_dict: dict = get_standard_dictionary(
-            account_id,
-            region,
-            aws_partition,
-            standards_user_input["SecurityBestPracticesVersion"],
-            standards_user_input["CISVersion"],
-            standards_user_input["PCIVersion"],
-            standards_user_input["NISTVersion"],
-        )
-        securityhub_client: SecurityHubClient = account_session.client("securityhub", region, config=BOTO3_CONFIG)
-
-        try:
-            enable_security_hub_response: Any = securityhub_client.enable_security_hub(EnableDefaultStandards=False)
-            api_call_details = {"API_Call": "securityhub:EnableSecurityHub", "API_Response": enable_security_hub_response}
-            LOGGER.info(api_call_details)
-            LOGGER.info(f"SecurityHub enabled in {account_id} {region}")
-        except securityhub_client.exceptions.ResourceConflictException:
-            LOGGER.info(f"SecurityHub already enabled in {account_id} {region}")
-
-        config_client: ConfigServiceClient = account_session.client("config", region, config=BOTO3_CONFIG)
-        if is_config_enabled(config_client):
-            process_standards(securityhub_client, standard_dict, standards_user_input["StandardsToEnable"])
+    # boto3 sessions are not thread safe, so the regional clients are created before starting the workers
+    regional_clients = {
+        region: (account_session.client("securityhub", region, config=BOTO3_CONFIG), account_session.client("config", region, config=BOTO3_CONFIG))
+        for region in regions
+    }
+    with ThreadPoolExecutor(max_workers=REGION_MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(
+                enable_securityhub_in_region,
+                securityhub_client,
+                config_client,
+                account_id,
+                region,
+                get_standard_dictionary(
+                    account_id,
+                    region,
+                    aws_partition,
+                    standards_user_input["SecurityBestPracticesVersion"],
+                    standards_user_input["CISVersion"],
+                    standards_user_input["PCIVersion"],
+                    standards_user_input["NISTVersion"],
+                ),
+                standards_user_input["StandardsToEnable"],
+            )
+            for region, (securityhub_client, config_client) in regional_clients.items()
+        ]
+    for future in futures:
+        future.result()
 
 
 def configure_delegated_admin_securityhub(
@@ -315,15 +367,7 @@ def configure_delegated_admin_securityhub(
             standards_user_input["NISTVersion"],
         )
 
-        for i in range(10):
-            standards_subscriptions = get_enabled_standards(securityhub_delegated_admin_region_client)
-            if (
-                all_standards_in_status(standards_subscriptions, "READY", securityhub_delegated_admin_region_client)
-                and len(standards_subscriptions) != 0
-            ):
-                break
-            LOGGER.info(f"Waiting 20 seconds before checking if delegated admin default standards are in READY status. {i} of 10")
-            sleep(20)
+        wait_for_standards(securityhub_delegated_admin_region_client, require_subscriptions=True)
 
         # Manually disable Security Hub default standards in Admin Account
         batch_disable_standards_response = securityhub_delegated_admin_region_client.batch_disable_standards(
@@ -354,7 +398,7 @@ def configure_delegated_admin_securityhub(
 
 
 def configure_member_account(account_id: str, configuration_role_name: str, regions: list, standards_user_input: dict, aws_partition: str) -> None:
-    """Configure Member Account.
+    """Configure Member Account, configuring the regions concurrently.
 
     Args:
         account_id: Account ID
@@ -367,20 +411,72 @@ def configure_member_account(account_id: str, configuration_role_name: str, regi
 
     account_session = common.assume_role(configuration_role_name, "sra-configure-security-hub", account_id)
 
-    for region in regions:
-        securityhub_client: SecurityHubClient = account_session.client("securityhub", region, config=BOTO3_CONFIG)
-        standard_dict: dict = get_standard_dictionary(
-            account_id,
-            region,
-            aws_partition,
-            standards_user_input["SecurityBestPracticesVersion"],
-            standards_user_input["CISVersion"],
-            standards_user_input["PCIVersion"],
-            standards_user_input["NISTVersion"],
-        )
-        config_client: ConfigServiceClient = account_session.client("config", region, config=BOTO3_CONFIG)
-        if is_config_enabled(config_client):
-            process_standards(securityhub_client, standard_dict, standards_user_input["StandardsToEnable"])
+    regional_clients = {
+        region: (account_session.client("securityhub", region, config=BOTO3_CONFIG), account_session.client("config", region, config=BOTO3_CONFIG))
+        for region in regions
+    }
+    with ThreadPoolExecutor(max_workers=REGION_MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(
+                configure_member_account_in_region,
+                securityhub_client,
+                config_client,
+                get_standard_dictionary(
+                    account_id,
+                    region,
+                    aws_partition,
+                    standards_user_input["SecurityBestPracticesVersion"],
+                    standards_user_input["CISVersion"],
+                    standards_user_input["PCIVersion"],
+                    standards_user_input["NISTVersion"],
+                ),
+                standards_user_input["StandardsToEnable"],
+            )
+            for region, (securityhub_client, config_client) in regional_clients.items()
+        ]
+    for future in futures:
+        future.result()
+
+
+def configure_member_account_in_region(
+    securityhub_client: SecurityHubClient, config_client: ConfigServiceClient, standard_dict: dict, standards_to_enable: dict
+) -> None:
+    """Process the standards in a member account region when Config is enabled.
+
+    Args:
+        securityhub_client: SecurityHubClient for the region
+        config_client: ConfigServiceClient for the region
+        standard_dict: Standard Dictionary
+        standards_to_enable: Dictionary of standards to enable
+    """
+    if is_config_enabled(config_client):
+        process_standards(securityhub_client, standard_dict, standards_to_enable)
+
+
+def get_standard_arns(region: str, aws_partition: str, sbp_version: str, cis_version: str, pci_version: str, nist_version: str) -> dict:
+    """Get the standard ARNs for a partition and region, which are the same for every account.
+
+    Args:
+        region: AWS Region
+        aws_partition: AWS Partition
+        sbp_version: AWS Security Best Practices Standard Version
+        cis_version: CIS Standard Version
+        pci_version: PCI Standard Version
+        nist_version: NIST version
+
+    Returns:
+        Standard ARNs keyed by standard short name
+    """
+    cis_standard_arn: str = f"arn:{aws_partition}:securityhub:::ruleset/cis-aws-foundations-benchmark/v/{cis_version}"
+    if cis_version != "1.2.0":
+        cis_standard_arn = f"arn:{aws_partition}:securityhub:{region}::standards/cis-aws-foundations-benchmark/v/{cis_version}"
+
+    return {
+        "cis": cis_standard_arn,
+        "pci": f"arn:{aws_partition}:securityhub:{region}::standards/pci-dss/v/{pci_version}",
+        "nist": f"arn:{aws_partition}:securityhub:{region}::standards/nist-800-53/v/{nist_version}",
+        "sbp": f"arn:{aws_partition}:securityhub:{region}::standards/aws-foundational-security-best-practices/v/{sbp_version}",
+    }
 
 
 def get_standard_dictionary(
@@ -400,33 +496,31 @@ def get_standard_dictionary(
     Returns:
         Standard ARN Dictionary
     """
-    cis_standard_arn: str = f"arn:{aws_partition}:securityhub:::ruleset/cis-aws-foundations-benchmark/v/{cis_version}"
-    if cis_version != "1.2.0":
-        cis_standard_arn = f"arn:{aws_partition}:securityhub:{region}::standards/cis-aws-foundations-benchmark/v/{cis_version}"
+    standard_arns = get_standard_arns(region, aws_partition, sbp_version, cis_version, pci_version, nist_version)
 
     return {
         "cis": {
             "name": "CIS AWS Foundations Benchmark Security Standard",
             "enabled": False,
-            "standard_arn": cis_standard_arn,
+            "standard_arn": standard_arns["cis"],
             "subscription_arn": f"arn:{aws_partition}:securityhub:{region}:{account_id}:subscription/cis-aws-foundations-benchmark/v/{cis_version}",
         },
         "pci": {
             "name": "Payment Card Industry Data Security Standard (PCI DSS)",
             "enabled": False,
-            "standard_arn": f"arn:{aws_partition}:securityhub:{region}::standards/pci-dss/v/{pci_version}",
+            "standard_arn": standard_arns["pci"],
             "subscription_arn": f"arn:{aws_partition}:securityhub:{region}:{account_id}:subscription/pci-dss/v/{pci_version}",
         },
         "nist": {
             "name": "National Institute of Standards and Technology (NIST) SP 800-53 Rev. 5",
             "enabled": False,
-            "standard_arn": f"arn:{aws_partition}:securityhub:{region}::standards/nist-800-53/v/{nist_version}",
+            "standard_arn": standard_arns["nist"],
             "subscription_arn": f"arn:{aws_partition}:securityhub:{region}:{account_id}:subscription/nist-800-53/v/{nist_version}",
         },
         "sbp": {
             "name": "AWS Foundational Security Best Practices Standard",
             "enabled": False,
-            "standard_arn": f"arn:{aws_partition}:securityhub:{region}::standards/aws-foundational-security-best-practices/v/{sbp_version}",
+            "standard_arn": standard_arns["sbp"],
             "subscription_arn": (
                 f"arn:{aws_partition}:securityhub:{region}:{account_id}:subscription/aws-foundational-security-best-practices/v/{sbp_version}"
             ),
@@ -455,114 +549,50 @@ def get_enabled_standards(securityhub_client: SecurityHubClient) -> list:
     return standards_subscriptions
 
 
-def disable_then_enable_standard(securityhub_client: SecurityHubClient, standards_subscription_arn: str, standards_arn: str) -> bool:
-    """Disable and then re-enable standard.
-
-    Args:
-        securityhub_client: Security Hub boto3 client
-        standards_subscription_arn: Standard subscription ARN
-        standards_arn: Standard ARN
-
-    Returns:
-        bool: True if no error when re-enabling standard; false if there was a problem doing so.
-    """
-    LOGGER.info("Entered disable_then_enable_standard function...")
-    LOGGER.info(f"...disabling {standards_subscription_arn} standard")
-    securityhub_client.batch_disable_standards(
-        StandardsSubscriptionArns=[
-            standards_subscription_arn,
-        ]
-    )
-    sleep(5)
-    standard_enable_retry_sleep = 5
-    standard_enable_retry = 0
-    while standard_enable_retry < 10:
-        try:
-            LOGGER.info(f"...enabling {standards_subscription_arn} standard")
-            securityhub_client.batch_enable_standards(
-                StandardsSubscriptionRequests=[
-                    {
-                        "StandardsArn": standards_arn,
-                    },
-                ]
-            )
-            return True
-        except securityhub_client.exceptions.InvalidInputException as error:
-            standard_enable_retry = standard_enable_retry + 1
-            LOGGER.error(
-                f"Retry {standard_enable_retry} due to InvalidInputException "
-                + f"while enabling standard: {error.response['Error']['Code']} - {error.response['Error']['Message']}"
-            )
-            sleep(standard_enable_retry_sleep)
-    return False
-
-
-def all_standards_in_status(standards_subscriptions: list, standards_status: str, securityhub_client: SecurityHubClient) -> bool:
-    """All standards in status.
+def are_account_standards_ready(account_id: str, configuration_role_name: str, regions: list) -> bool:
+    """Check that all enabled standards are in READY status in the given account and regions.
 
     Args:
-        standards_subscriptions: list of standards subscriptions
-        standards_status: standards status 'PENDING'|'READY'|'FAILED'|'DELETING'|'INCOMPLETE'
-        securityhub_client: Security hub boto3 client
+        account_id: Account ID
+        configuration_role_name: Configuration Role Name
+        regions: AWS Region List
 
     Returns:
-        bool: True or False
+        True or False
     """
-    for standards_subscription in standards_subscriptions:  # noqa: SIM111
-        LOGGER.info("entered all_standards_in_status function...")
-        LOGGER.info(f"standard - {standards_subscription} : {standards_subscription.get('StandardsStatus')}")
-        incomplete_status_resolved = True
-        if standards_subscription.get("StandardsStatus") == "INCOMPLETE":
-            incomplete_status_resolved = disable_then_enable_standard(
-                securityhub_client, standards_subscription.get("StandardsSubscriptionArn"), standards_subscription.get("StandardsArn")
-            )
-        if standards_subscription.get("StandardsStatus") != standards_status and standards_subscription.get("StandardsStatus") != "INCOMPLETE":
-            return False
-        if incomplete_status_resolved is False:
-            return False
+    account_session: boto3.Session = common.assume_role(configuration_role_name, "sra-configure-security-hub", account_id)
+    for region in regions:
+        securityhub_client: SecurityHubClient = account_session.client("securityhub", region, config=BOTO3_CONFIG)
+        for standards_subscription in get_enabled_standards(securityhub_client):
+            if standards_subscription["StandardsStatus"] != "READY":
+                LOGGER.info(
+                    f"Standard {standards_subscription['StandardsArn']} is {standards_subscription['StandardsStatus']} in {account_id} {region}"
+                )
+                return False
     return True
 
 
-def get_current_enabled_standards(securityhub_client: SecurityHubClient, standard_dict: dict) -> dict:  # noqa: CCR001 (cognitive complexity)
-    """Get current enabled standards.
+def wait_for_standards(securityhub_client: SecurityHubClient, require_subscriptions: bool = False) -> list:
+    """Wait until no standards subscription is pending or deleting.
 
     Args:
         securityhub_client: SecurityHubClient
-        standard_dict: Standard Dictionary
+        require_subscriptions: Keep waiting while there are no standards subscriptions
 
     Returns:
-        Standard Dictionary
+        standards subscriptions list
     """
-    standards_subscriptions = get_enabled_standards(securityhub_client)
-    if all_standards_in_status(standards_subscriptions, "READY", securityhub_client):
-        for item in standards_subscriptions:
-            if standard_dict["sbp"]["standard_arn"] == item["StandardsArn"]:
-                standard_dict["sbp"]["enabled"] = True
-            if standard_dict["cis"]["standard_arn"] == item["StandardsArn"]:
-                standard_dict["cis"]["enabled"] = True
-            if standard_dict["pci"]["standard_arn"] == item["StandardsArn"]:
-                standard_dict["pci"]["enabled"] = True
-            if standard_dict["nist"]["standard_arn"] == item["StandardsArn"]:
-                standard_dict["nist"]["enabled"] = True
-    return standard_dict
-
-
-def all_standards_ready(securityhub_client: SecurityHubClient) -> bool:
-    """All Standards Ready.
+    standards_subscriptions: list = []
 
-    Args:
-        securityhub_client: SecurityHubClient
+    def is_settled() -> bool:
+        standards_subscriptions[:] = get_enabled_standards(securityhub_client)
+        if require_subscriptions and not standards_subscriptions:
+            return False
+        return all(subscription["StandardsStatus"] not in STANDARDS_TRANSITIONAL_STATUSES for subscription in standards_subscriptions)
 
-    Returns:
-        True or False
-    """
-    for i in range(10):
-        standards_subscriptions = get_enabled_standards(securityhub_client)
-        if all_standards_in_status(standards_subscriptions, "READY", securityhub_client):
-            return True
-        LOGGER.info(f"Waiting 20 seconds before checking if standards are in READY status. {i} of 10")
-        sleep(20)
-    return False
+    if not common.wait_until_ready(f"Security Hub standards in {securityhub_client.meta.region_name}", is_settled, STANDARDS_READY_DEADLINE_SECONDS):
+        LOGGER.warning(f"Security Hub standards did not settle in {securityhub_client.meta.region_name} in the allowed time.")
+    return standards_subscriptions
 
 
 def process_standards(
@@ -570,54 +600,62 @@ def process_standards(
     standard_dict: dict,
     standards_to_enable: dict,
 ) -> None:
-    """Process Standards.
+    """Reconcile the standards subscriptions with the standards to enable.
+
+    The desired and current subscriptions are compared once, the disable and enable requests are each sent in a single batch, and all
+    changed subscriptions are then polled together. INCOMPLETE subscriptions of standards to enable are disabled and enabled again.
 
     Args:
         securityhub_client: SecurityHubClient
         standard_dict: Standard Dictionary
         standards_to_enable: Dictionary of standards to enable
-    """
-    standard_dict = get_current_enabled_standards(securityhub_client, standard_dict)
-    for standard, status in standard_dict.items():
-        process_standard(securityhub_client, standards_to_enable, status, standard)
 
+    Raises:
+        ValueError: Standards could not be enabled before the deadline
+    """
+    current_subscriptions = {subscription["StandardsArn"]: subscription for subscription in wait_for_standards(securityhub_client)}
+    desired_standard_arns = {definition["standard_arn"] for name, definition in standard_dict.items() if standards_to_enable[name]}
+    managed_standard_arns = {definition["standard_arn"] for definition in standard_dict.values()}
+
+    reset_standard_arns = {
+        standard_arn
+        for standard_arn in desired_standard_arns & current_subscriptions.keys()
+        if current_subscriptions[standard_arn]["StandardsStatus"] == "INCOMPLETE"
+    }
+    subscription_arns_to_disable = [
+        current_subscriptions[standard_arn]["StandardsSubscriptionArn"]
+        for standard_arn in ((managed_standard_arns - desired_standard_arns) & current_subscriptions.keys()) | reset_standard_arns
+    ]
+    standard_arns_to_enable = (desired_standard_arns - current_subscriptions.keys()) | reset_standard_arns
+
+    if subscription_arns_to_disable:
+        response = securityhub_client.batch_disable_standards(StandardsSubscriptionArns=subscription_arns_to_disable)
+        api_call_details = {"API_Call": "securityhub:BatchDisableStandards", "API_Response": response}
+        LOGGER.info(api_call_details)
+        if reset_standard_arns:
+            wait_for_standards(securityhub_client)
 
-def process_standard(securityhub_client: SecurityHubClient, standards_to_enable: dict, standard_definition: dict, standard_short_name: str) -> bool:
-    """Process standard.
+    def enable_standards() -> bool:
+        try:
+            response = securityhub_client.batch_enable_standards(
+                StandardsSubscriptionRequests=[{"StandardsArn": standard_arn} for standard_arn in sorted(standard_arns_to_enable)]
+            )
+        except securityhub_client.exceptions.InvalidInputException as error:
+            LOGGER.info(f"InvalidInputException while enabling standards: {error.response['Error']['Message']}")
+            return False
+        api_call_details = {"API_Call": "securityhub:BatchEnableStandards", "API_Response": response}
+        LOGGER.info(api_call_details)
+        return True
 
-    Args:
-        securityhub_client: SecurityHubClient
-        standards_to_enable: Dictionary of standards to enable
-        standard_definition: Specific Standard Information like subscription and standard ARNs
-        standard_short_name: Standard short name
+    region = securityhub_client.meta.region_name
+    if standard_arns_to_enable and not common.wait_until_ready(
+        f"Security Hub standards enabled in {region}", enable_standards, STANDARDS_ENABLE_DEADLINE_SECONDS
+    ):
+        raise ValueError(f"Unable to enable standards {sorted(standard_arns_to_enable)} in {region}")
 
-    Returns:
-        True or False
-    """
-    if all_standards_ready(securityhub_client):
-        try:
-            if standards_to_enable[standard_short_name]:
-                if not standard_definition["enabled"]:
-                    response = securityhub_client.batch_enable_standards(
-                        StandardsSubscriptionRequests=[{"StandardsArn": standard_definition["standard_arn"]}]
-                    )
-                    api_call_details = {"API_Call": "securityhub:BatchEnableStandards", "API_Response": response}
-                    LOGGER.info(api_call_details)
-                    LOGGER.info(f"Enabled {standard_definition['name']}")
-                else:
-                    LOGGER.info(f"{standard_definition['name']} is already enabled")
-            else:  # Disable Standard
-                if standard_definition["enabled"]:
-                    LOGGER.info(f"Disabling {standard_definition['name']} in Account")
-                    response = securityhub_client.batch_disable_standards(StandardsSubscriptionArns=[standard_definition["subscription_arn"]])
-                    api_call_details = {"API_Call": "securityhub:BatchDisableStandards", "API_Response": response}
-                    LOGGER.info(api_call_details)
-                    LOGGER.info(f"Disabled {standard_definition['name']} in Account")
-                else:
-                    LOGGER.info(f"{standard_definition['name']} is already disabled")
-        except securityhub_client.exceptions.InvalidInputException:
-            LOGGER.error("InvalidInputException while enabling or disabling standard")
-    return True
+    if subscription_arns_to_disable or standard_arns_to_enable:
+        wait_for_standards(securityhub_client)
+    LOGGER.info(f"Standards enabled: {sorted(standard_arns_to_enable)}, standards subscriptions disabled: {subscription_arns_to_disable}")
 
 
 def create_finding_aggregator(securityhub_client: SecurityHubClient, region_linking_mode: str, regions: list, home_region: str) -> str:
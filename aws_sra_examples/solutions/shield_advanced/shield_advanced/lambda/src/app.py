@@ -13,7 +13,8 @@ from __future__ import annotations
 import logging
 import os
 import re
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
 import boto3
 import common
@@ -33,6 +34,7 @@ LOGGER.setLevel(log_level)
 
 UNEXPECTED: str = "Unexpected!"
 SERVICE_NAME: str = "shield.amazonaws.com"
+ACCOUNT_MAX_WORKERS: int = 8
 
 helper = CfnResource(json_logging=True, log_level=log_level, boto_level="CRITICAL", sleep_on_delete=120)
 
@@ -478,30 +480,73 @@ def get_validated_parameters(event: Dict[str, Any]) -> dict:  # noqa CFQ001
     return params
 
 
-def teardown_shield_service(params: dict, accounts: list) -> None:
-    """Primary function to disable the shield service.
+def get_accounts_to_protect(params: dict, accounts: list) -> list:
+    """Get the accounts selected in the SHIELD_ACCOUNTS_TO_PROTECT parameter.
 
     Args:
         params: Configuration Parameters
         accounts: list of accounts
+
+    Returns:
+        list of accounts
     """
     if params["SHIELD_ACCOUNTS_TO_PROTECT"] == "ALL":
         LOGGER.info("Protect all accounts")
-    else:
-        accounts = []
-        for account in params["SHIELD_ACCOUNTS_TO_PROTECT"].split(","):
-            accounts.append({"AccountId": account})
+        return accounts
+    return [{"AccountId": account} for account in params["SHIELD_ACCOUNTS_TO_PROTECT"].split(",")]
+
 
+def process_accounts(action: str, accounts: list, account_action: Callable[[str], None], max_workers: int = ACCOUNT_MAX_WORKERS) -> None:
+    """Run an account action in all accounts concurrently.
+
+    Args:
+        action: Action name used in the logs
+        accounts: list of accounts
+        account_action: Callable run with each account id
+        max_workers: Maximum number of accounts processed at the same time
+
+    Raises:
+        ValueError: The action failed in one or more accounts
+    """
+    failed_accounts: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(account_action, account["AccountId"]): account["AccountId"] for account in accounts}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as error:
+                LOGGER.exception(f"{action} failed in account {futures[future]}")
+                failed_accounts[futures[future]] = str(error)
+
+    if failed_accounts:
+        LOGGER.error({f"{action} failed accounts": failed_accounts})
+        raise ValueError(f"{action} failed in accounts: {', '.join(sorted(failed_accounts))}")
+
+
+def teardown_shield_service(params: dict, accounts: list) -> None:
+    """Primary function to disable the shield service.
+
+    Args:
+        params: Configuration Parameters
+        accounts: list of accounts
+    """
     LOGGER.info("Params \n")
     LOGGER.info(params)
-    for account in accounts:
-        LOGGER.info(f"Disable shield for {account}")
-        account_id = account["AccountId"]
-        shield.check_if_key_in_object(account_id, shield.RESOURCES_BY_ACCOUNT, "dict")
-        account_session: boto3.Session = common.assume_role(params["CONFIGURATION_ROLE_NAME"], "sra-configure-shield", account_id)
-        teardown_shield(account_session, account_id, params)
-        shield.disassociate_drt_role(account_session)
-        shield.delete_drt_role(account_session, params["SHIELD_DRT_ROLE_NAME"])
+    process_accounts("Disable shield", get_accounts_to_protect(params, accounts), lambda account_id: teardown_shield_account(account_id, params))
+
+
+def teardown_shield_account(account_id: str, params: dict) -> None:
+    """Disable the shield service in an account.
+
+    Args:
+        account_id: AWS Account Id
+        params: Configuration Parameters
+    """
+    LOGGER.info(f"Disable shield for {account_id}")
+    account_session: boto3.Session = common.assume_role(params["CONFIGURATION_ROLE_NAME"], "sra-configure-shield", account_id)
+    teardown_shield(account_session, account_id, params)
+    shield.disassociate_drt_role(account_session)
+    shield.delete_drt_role(account_session, params["SHIELD_DRT_ROLE_NAME"])
 
 
 def setup_shield_global(params: dict, accounts: list) -> None:
@@ -513,23 +558,23 @@ def setup_shield_global(params: dict, accounts: list) -> None:
     """
     LOGGER.info("Params \n")
     LOGGER.info(params)
-    if params["SHIELD_ACCOUNTS_TO_PROTECT"] == "ALL":
-        LOGGER.info("Protect all accounts")
-    else:
-        accounts = []
-        for account in params["SHIELD_ACCOUNTS_TO_PROTECT"].split(","):
-            accounts.append({"AccountId": account})
-    for account in accounts:
-        account_id = account["AccountId"]
-        LOGGER.info(f"Configuring account {account_id}")
-        shield.check_if_key_in_object(account_id, shield.RESOURCES_BY_ACCOUNT, "dict")
-
-        account_session: boto3.Session = common.assume_role(params["CONFIGURATION_ROLE_NAME"], "sra-configure-shield", account_id)
-        shield_client: ShieldClient = account_session.client("shield")
-        shield.create_subscription(shield_client)
-        role_arn = shield.create_drt_role(account_id, params["SHIELD_DRT_ROLE_NAME"], account_session)
-        shield.associate_drt_role(shield_client, role_arn)
-        setup_shield(account_session, account_id, params)
+    process_accounts("Configure shield", get_accounts_to_protect(params, accounts), lambda account_id: setup_shield_account(account_id, params))
+
+
+def setup_shield_account(account_id: str, params: dict) -> None:
+    """Enable the shield service and configure its settings in an account.
+
+    Args:
+        account_id: AWS Account Id
+        params: environment variables
+    """
+    LOGGER.info(f"Configuring account {account_id}")
+    account_session: boto3.Session = common.assume_role(params["CONFIGURATION_ROLE_NAME"], "sra-configure-shield", account_id)
+    shield_client: ShieldClient = account_session.client("shield")
+    shield.create_subscription(shield_client)
+    role_arn = shield.create_drt_role(account_id, params["SHIELD_DRT_ROLE_NAME"], account_session)
+    shield.associate_drt_role(shield_client, role_arn)
+    setup_shield(account_session, account_id, params)
 
 
 def teardown_shield(account_session: boto3.Session, account_id: str, params: dict) -> None:
@@ -540,23 +585,16 @@ def teardown_shield(account_session: boto3.Session, account_id: str, params: dic
         account_id: AWS Account Id
         params: environment variables
     """
-    buckets_processed: list = []
-    resources_processed: list = []
-
     LOGGER.info(f"Teardown shield in for account {account_id} in ")
-    shield.build_resources_by_account(account_session, params, account_id)
+    resources = shield.build_resources_by_account(account_session, params, account_id)
     shield_client = account_session.client("shield")
     shield.disable_proactive_engagement(shield_client)
 
-    while len(shield.RESOURCES_BY_ACCOUNT[account_id]["buckets"]) > 0:
-        bucket = shield.RESOURCES_BY_ACCOUNT[account_id]["buckets"].pop()
-        if bucket not in buckets_processed:
-            shield.disassociate_drt_log_bucket(shield_client, bucket)
-    while len(shield.RESOURCES_BY_ACCOUNT[account_id]["resources_to_protect"]) > 0:
-        resource = shield.RESOURCES_BY_ACCOUNT[account_id]["resources_to_protect"].pop()
-        if resource not in resources_processed:
-            shield.delete_protection(shield_client, resource)
-            resources_processed.append(resource)
+    for bucket in resources["buckets"]:
+        shield.disassociate_drt_log_bucket(shield_client, bucket)
+    protections_by_arn = shield.list_protections(shield_client)
+    for resource in resources["resources_to_protect"]:
+        shield.delete_protection(shield_client, resource, protections_by_arn)
     shield.delete_protection_group(shield_client, params, account_id)
     shield.update_emergency_contacts(shield_client, params, True)
 
@@ -569,26 +607,17 @@ def setup_shield(account_session: boto3.Session, account_id: str, params: dict)
         account_id: AWS Account Id
         params: environment variables
     """
-    buckets_processed: list = []
-    resources_processed: list = []
-
     LOGGER.info(f"setup shield in account: {account_id}")
-    shield.build_resources_by_account(account_session, params, account_id)
+    resources = shield.build_resources_by_account(account_session, params, account_id)
     shield_client = account_session.client("shield")
-    resources_already_protected = shield.list_protections(shield_client)
+    protection_plan = shield.build_protection_plan(resources, shield.list_protections(shield_client))
     shield.enable_proactive_engagement(shield_client, params)
-    while len(shield.RESOURCES_BY_ACCOUNT[account_id]["buckets"]) > 0:
-        bucket = shield.RESOURCES_BY_ACCOUNT[account_id]["buckets"].pop()
-        if bucket not in buckets_processed:
-            shield.associate_drt_log_bucket(shield_client, bucket)
-            buckets_processed.append(bucket)
-    while len(shield.RESOURCES_BY_ACCOUNT[account_id]["resources_to_protect"]) > 0:
-        resource = shield.RESOURCES_BY_ACCOUNT[account_id]["resources_to_protect"].pop()
-        if resource not in resources_already_protected and resource not in resources_processed:
-            shield.create_protection(shield_client, resource)
-            LOGGER.info(f"Create protection for {resource}")
-            resources_processed.append(resource)
-    if len(resources_already_protected) > 0 or len(resources_processed) > 0:
+    for bucket in protection_plan["buckets"]:
+        shield.associate_drt_log_bucket(shield_client, bucket)
+    for resource in protection_plan["resources_to_protect"]:
+        shield.create_protection(shield_client, resource)
+        LOGGER.info(f"Create protection for {resource}")
+    if protection_plan["resources_already_protected"] or protection_plan["resources_to_protect"]:
         shield.create_protection_group(shield_client, params, account_id)
 
 
@@ -21,13 +21,11 @@ if TYPE_CHECKING:
     from mypy_boto3_iam import IAMClient
     from mypy_boto3_organizations import OrganizationsClient
     from mypy_boto3_route53 import Route53Client
-    from mypy_boto3_route53.type_defs import ListHostedZonesResponseTypeDef
     from mypy_boto3_s3 import S3Client
     from mypy_boto3_shield import ShieldClient
     from mypy_boto3_shield.type_defs import (
         CreateProtectionResponseTypeDef,
         DescribeEmergencyContactSettingsResponseTypeDef,
-        DescribeProtectionResponseTypeDef,
         DescribeSubscriptionResponseTypeDef,
         EmergencyContactTypeDef,
         ProtectionTypeDef,
@@ -41,7 +39,6 @@ LOGGER.setLevel(log_level)
 
 
 UNEXPECTED = "Unexpected!"
-RESOURCES_BY_ACCOUNT: dict = {}
 SHIELD_DRT_POLICY = "arn:aws:iam::aws:policy/service-role/AWSShieldDRTAccessPolicy"
 
 try:
@@ -66,22 +63,24 @@ def get_friendly_name(arn: str) -> str:
     return arn[last_colon_index + 1 :].strip().replace("/", "").replace("-", "")  # noqa ECE001
 
 
-def build_resources_by_account(account_session: boto3.Session, params: dict, account_id: str) -> None:
-    """Build object to map resources to accounts.
+def build_resources_by_account(account_session: boto3.Session, params: dict, account_id: str) -> dict:
+    """Build object to map resources to an account.
 
     Args:
         account_session: the session for the account
         params: environment variables
         account_id: AWS Account Id to map the resources
+
+    Returns:
+        {"buckets": DRT log buckets in the account, "resources_to_protect": resource arns in the account}
     """
     buckets: list = get_buckets_to_protect(account_session, params["SHIELD_DRT_LOG_BUCKETS"].split(","))
-    check_if_key_in_object("buckets", RESOURCES_BY_ACCOUNT[account_id], "list")
-    RESOURCES_BY_ACCOUNT[account_id]["buckets"] = buckets
-    check_if_key_in_object("resources_to_protect", RESOURCES_BY_ACCOUNT[account_id], "list")
     hosted_zones: list = get_route_53_hosted_zones(account_session)
-    RESOURCES_BY_ACCOUNT[account_id]["resources_to_protect"] = hosted_zones
     resources_to_protect: list = get_resources_to_protect_in_account(account_id, params["RESOURCES_TO_PROTECT"].split(","))
-    RESOURCES_BY_ACCOUNT[account_id]["resources_to_protect"].extend(resources_to_protect)
+    return {
+        "buckets": list(dict.fromkeys(buckets)),
+        "resources_to_protect": list(dict.fromkeys(hosted_zones + resources_to_protect)),
+    }
 
 
 def get_resources_to_protect_in_account(account: str, resource_arns: list) -> list:
@@ -112,22 +111,12 @@ def get_route_53_hosted_zones(account_session: boto3.Session) -> list:
         a list of route53 hosted zones
     """
     route53_client: Route53Client = account_session.client("route53")
-    hosted_zones: ListHostedZonesResponseTypeDef = route53_client.list_hosted_zones()
     LOGGER.info("[INFO] Listing hosted zones from the Route53")
-    marker: bool = True
-    hosted_zone_arns: list = []
-    while marker:
-        for hosted_zone in hosted_zones["HostedZones"]:
-            hosted_zone_arn = f"arn:aws:route53:::{hosted_zone['Id']}"
-            if hosted_zone_arn not in hosted_zone_arns:
-                hosted_zone_arns.append(hosted_zone_arn)
-            else:
-                LOGGER.info(f"Hosted zone {hosted_zone_arn} already exists in object")
-        if "Marker" in hosted_zones:
-            hosted_zones = route53_client.list_hosted_zones(Marker=hosted_zones["Marker"])
-        else:
-            marker = False
-    return hosted_zone_arns
+    hosted_zone_arns: dict = {}
+    for page in route53_client.get_paginator("list_hosted_zones").paginate():
+        for hosted_zone in page["HostedZones"]:
+            hosted_zone_arns[f"arn:aws:route53:::{hosted_zone['Id']}"] = True
+    return list(hosted_zone_arns)
 
 
 def check_account_in_arn(account: str, arn: str) -> bool:
@@ -143,30 +132,41 @@ def check_account_in_arn(account: str, arn: str) -> bool:
     return account in arn
 
 
-def list_protections(shield_client: ShieldClient) -> list[ProtectionTypeDef]:
+def list_protections(shield_client: ShieldClient) -> dict[str, ProtectionTypeDef]:
     """List of protections in an account.
 
     Args:
         shield_client: AWS Shield Client
 
     Returns:
-        list of protections in an account
+        protections in an account, keyed by resource arn
     """
     LOGGER.info("[INFO] Listing Shield Protections\n\n")
-    marker: bool = True
-    protected_resource_arns: list = []
-    response = shield_client.list_protections()
-    while marker:
-        for resource in response["Protections"]:
-            if resource["ResourceArn"] not in protected_resource_arns:
-                protected_resource_arns.append(resource["ResourceArn"])
-            else:
-                LOGGER.info(f"{resource['ResourceArn']} already exists in object")
-        if "NextToken" in response:
-            response = shield_client.list_protections(NextToken=response["NextToken"])
-        else:
-            marker = False
-    return protected_resource_arns
+    protections_by_arn: dict[str, ProtectionTypeDef] = {}
+    for page in shield_client.get_paginator("list_protections").paginate():
+        for protection in page["Protections"]:
+            protections_by_arn[protection["ResourceArn"]] = protection
+    return protections_by_arn
+
+
+def build_protection_plan(resources: dict, protections_by_arn: dict) -> dict:
+    """Split the resources of an account into the ones that are already protected and the ones that need a protection.
+
+    Args:
+        resources: {"buckets": [...], "resources_to_protect": [...]} for the account
+        protections_by_arn: existing protections keyed by resource arn
+
+    Returns:
+        {"buckets": DRT log buckets, "resources_to_protect": unprotected resource arns, "resources_already_protected": protected resource arns}
+    """
+    resources_to_protect = [resource for resource in resources["resources_to_protect"] if resource not in protections_by_arn]
+    resources_already_protected = [resource for resource in resources["resources_to_protect"] if resource in protections_by_arn]
+    LOGGER.info(f"{len(resources_already_protected)} resource(s) already protected, {len(resources_to_protect)} resource(s) to protect")
+    return {
+        "buckets": resources["buckets"],
+        "resources_to_protect": resources_to_protect,
+        "resources_already_protected": resources_already_protected,
+    }
 
 
 def build_emergency_contacts(params: dict) -> Sequence[EmergencyContactTypeDef]:
@@ -206,33 +206,6 @@ def update_emergency_contacts(shield_client: ShieldClient, params: dict, is_dele
         shield_client.update_emergency_contact_settings(EmergencyContactList=emergency_contacts)
 
 
-def check_if_key_in_object(key: str, obj: dict, var_type: str) -> None:
-    """Check if key in  object.
-
-    Args:
-        key: key
-        obj: object
-        var_type: type
-
-    Raises:
-        ValueError: Non supported type
-    """
-    LOGGER.info(f"Adding key {key} of type {var_type} to object")
-    if key not in obj:
-        if var_type.lower() == "string":
-            obj[key] = ""
-            return
-        if var_type.lower() == "list":
-            obj[key] = []
-            return
-        if var_type.lower() == "dict":
-            obj[key] = {}
-        else:
-            raise ValueError(f"Type {var_type} is not supported")
-    else:
-        LOGGER.info(f"Key {key} already exists in object")
-
-
 def get_buckets_to_protect(account_session: boto3.Session, buckets_in_account: list) -> list[str]:
     """Get all buckets in the account.
 
@@ -405,33 +378,15 @@ def associate_drt_role(shield_client: ShieldClient, role_arn: str) -> None:
     LOGGER.info(api_call_details)
 
 
-def get_protection_id(shield_client: ShieldClient, arn: str) -> str:
-    """Get protection id.
-
-    Args:
-        shield_client: shield client
-        arn: ARN of the resource
-
-    Returns:
-        the protection id of the resource
-    """
-    try:
-        describe_protection_response: DescribeProtectionResponseTypeDef = shield_client.describe_protection(ResourceArn=arn)
-        api_call_details = {"API_Call": "shield:DescribeProtection", "API_Response": describe_protection_response}
-        LOGGER.info(api_call_details)
-        return describe_protection_response["Protection"]["Id"]
-    except shield_client.exceptions.ResourceNotFoundException:
-        return ""
-
-
-def delete_protection(shield_client: ShieldClient, resource_arn: str) -> None:
+def delete_protection(shield_client: ShieldClient, resource_arn: str, protections_by_arn: dict) -> None:
     """Delete a protection.
 
     Args:
         shield_client: Shield client
         resource_arn: resource arn
+        protections_by_arn: existing protections keyed by resource arn
     """
-    protection_id: str = get_protection_id(shield_client, resource_arn)
+    protection_id: str = protections_by_arn.get(resource_arn, {}).get("Id", "")
     if protection_id != "":
         LOGGER.info(f"Deleting protection for {resource_arn} and protectionId {protection_id}")
         delete_protection_response = shield_client.delete_protection(ProtectionId=protection_id)
@@ -12,8 +12,11 @@ import argparse
 import subprocess  # noqa: S404
 
 import boto3
+from botocore.config import Config
 
 SUPPORTED_REGIONS: list = []
+ACCOUNTS: list = []
+ORG_PAGE_SIZE = 20  # Max page size for list_accounts
 
 
 def init() -> None:
@@ -60,16 +63,19 @@ def get_audit_account() -> str:
 
 
 def get_accounts() -> list:
-    """Get all accounts from AWS Organization.
+    """Get all accounts from AWS Organization, listing them once per run.
 
     Returns:
         list: list of accounts in org
     """
-    organizations = boto3.client("organizations")
+    if ACCOUNTS:
+        return ACCOUNTS
+
+    organizations = boto3.client("organizations", config=Config(retries={"max_attempts": 10, "mode": "adaptive"}))
     paginator = organizations.get_paginator("list_accounts")
 
     accounts = []
-    for page in paginator.paginate():
+    for page in paginator.paginate(PaginationConfig={"PageSize": ORG_PAGE_SIZE}):
         for account in page["Accounts"]:
             if account["Status"] == "ACTIVE":
                 accounts.append(account["Id"])
@@ -81,6 +87,7 @@ def get_accounts() -> list:
         accounts.remove(audit_account)
         accounts.append(audit_account)
 
+    ACCOUNTS.extend(accounts)
     return accounts
 
 